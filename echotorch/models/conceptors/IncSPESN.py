@@ -66,8 +66,8 @@ class IncSPESN(ESN):
         :param bias_scaling: Bias scaling
         :param input_scaling: Input scaling
         :param nonlin_func: Non-linear function
-        :param learning_algo_wout: Output learning method (inv, pinv)
-        :param learning_algo_w: Loading method (inv, pinv)
+        :param learning_algo_wout: Output learning method (inv, pinv, woodbury)
+        :param learning_algo_w: Loading method (inv, pinv, woodbury)
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the output layer ?
         :param softmax_output: Add a softmax output layer
@@ -42,7 +42,7 @@ class ESN(Node):
     def __init__(self, input_dim, hidden_dim, output_dim, w_generator, win_generator, wbias_generator,
                  input_scaling=1.0, nonlin_func=torch.tanh, learning_algo='inv', ridge_param=0.0, with_bias=True,
                  softmax_output=False, normalize_output=False, washout=0, create_rnn=True, create_output=True,
-                 debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
+                 pooling=None, debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Input feature space dimension
@@ -53,7 +53,7 @@ class ESN(Node):
         :param wbias_generator: Bias matrix generator
         :param input_scaling: Input scaling
         :param nonlin_func: Non-linear function
-        :param learning_algo: Learning method (inv, pinv)
+        :param learning_algo: Learning method (inv, pinv, cholesky, solve, lstsq, eigh)
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the output layer ?
         :param softmax_output: Add a softmax output layer
@@ -61,6 +61,8 @@ class ESN(Node):
         :param washout: Washout period (ignore timesteps at the beginning of each sample)
         :param create_rnn: Create RNN layer ?
         :param create_output: Create the output layer ?
+        :param pooling: Sequence-level readout on states pooled over time ('last', 'mean' or a list of timesteps),
+        None for one output per timestep
         :param debug: Debug mode
         :param test_case: Test case to call for test
         :param dtype: Data type
@@ -82,6 +84,10 @@ class ESN(Node):
         self._wbias_generator = wbias_generator
         self._dtype = dtype
 
+        # Streams (stream ID -> row in stream_states), runtime state kept out of the state dict
+        self._stream_ids = dict()
+        self.register_buffer('stream_states', torch.zeros(0, hidden_dim, dtype=dtype), persistent=False)
+
         if create_rnn:
             # Generate matrices
             w, w_in, w_bias = self._generate_matrices(w_generator, win_generator, wbias_generator)
@@ -112,6 +118,7 @@ class ESN(Node):
                 learning_algo=learning_algo,
                 softmax_output=softmax_output,
                 normalize_output=normalize_output,
+                pooling=pooling,
                 debug=debug,
                 test_case=test_case,
                 dtype=dtype
@@ -162,6 +169,20 @@ class ESN(Node):
         return self._output
     # end output
 
+    # Set output layer
+    @output.setter
+    def output(self, output):
+        """
+        Set output layer
+        :param output: New output layer (e.g. an RLSCell for online training)
+        """
+        if getattr(self, '_output', None) is not None:
+            self.remove_trainable(self._output)
+        # end if
+        self._output = output
+        self.add_trainable(output)
+    # end output
+
     # Get W's spectral radius
     @property
     def spectral_radius(self):
@@ -242,6 +263,16 @@ class ESN(Node):
         return self._output.w_out
     # end w_out
 
+    # Stream IDs
+    @property
+    def streams(self):
+        """
+        Stream IDs
+        :return: List of the IDs of the open streams
+        """
+        return list(self._stream_ids.keys())
+    # end streams
+
     # endregion PROPRETIES
 
     # region OVERRIDE
@@ -251,7 +282,7 @@ class ESN(Node):
         """
         Forward
         :param u: Input signal.
-        :param y: Target outputs (or None if prediction)
+        :param y: Target outputs, a dictionary of targets for a multi-head output layer (or None if prediction)
         :return: Output or hidden states
         """
         # Compute hidden states
@@ -261,10 +292,25 @@ class ESN(Node):
         if not self.training:
             return self._output(hidden_states, None)
         else:
-            return self._output(hidden_states, y[:, self._esn_cell.washout:])
+            return self._output(hidden_states, self._time_slice(y, self._esn_cell.washout))
         # end if
     # end forward
 
+    # Set attribute, assigning the output layer goes through its property setter
+    def __setattr__(self, name, value):
+        """
+        Set attribute, assigning the output layer goes through its property setter, so that esn.output = RLSCell(...)
+        replaces the trainable output layer (nn.Module would register it as a new sub-module named output instead)
+        :param name: Attribute name
+        :param value: Value
+        """
+        if name == 'output':
+            object.__setattr__(self, name, value)
+        else:
+            super(ESN, self).__setattr__(name, value)
+        # end if
+    # end __setattr__
+
     # region PUBLIC
 
     # Reset layer (not trained)
@@ -288,10 +334,184 @@ class ESN(Node):
         self._esn_cell.reset_hidden()
     # end reset_hidden
 
+    # Train the output layer chunk by chunk
+    def fit(self, u, y, chunk_size=1000, reset_state=True):
+        """
+        Train the output layer chunk by chunk.
+        Reservoir states are accumulated into the xTx and xTy matrices of the output layer as they are produced, so
+        memory does not grow with the length of the sequences. Call finalize() afterwards, as with forward().
+        :param u: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim), or a dictionary of targets for a
+        multi-head output layer
+        :param chunk_size: Number of timesteps computed at once
+        :param reset_state: Reset state before the sequences ? (a boolean, or one boolean per sample)
+        """
+        # Output layer must be in training mode
+        if not self.training:
+            raise Exception("fit() needs an output layer in training mode, call reset() first")
+        # end if
+
+        # Sizes
+        n_batches = int(u.size(0))
+        time_length = int(u.size(1))
+        washout = self._esn_cell.washout
+
+        # Initial states
+        x = self._esn_cell._init_batch_hidden(n_batches, reset_state)
+
+        # For each chunk
+        for start in range(0, time_length, chunk_size):
+            end = min(start + chunk_size, time_length)
+
+            # Reservoir states of the chunk
+            hidden_states = self._esn_cell.stream(u[:, start:end], x)
+            x = hidden_states[:, -1]
+
+            # Accumulate states after the washout
+            first = max(washout - start, 0)
+            if first < end - start:
+                self._output.accumulate(
+                    hidden_states[:, first:],
+                    self._time_slice(y, start + first, end),
+                    time_length - washout,
+                    n_samples=n_batches if end == time_length else 0
+                )
+            # end if
+        # end for
+
+        # Last states
+        self._esn_cell.hidden.data = x.data
+    # end fit
+
+    # Push one timestep of one or several streams
+    def step(self, u_t, stream_ids=None):
+        """
+        Push one timestep of one or several streams
+        :param u_t: Inputs at time t (n streams x input dim, or input dim for a single stream)
+        :param stream_ids: Stream IDs (one per row), or None for streams 0 to n-1
+        :return: Outputs at time t (n streams x output dim, or output dim for a single stream)
+        """
+        if u_t.dim() == 1:
+            return self.push_chunk(u_t.view(1, -1), stream_ids)[0]
+        else:
+            return self.push_chunk(u_t.unsqueeze(1), stream_ids)[:, 0]
+        # end if
+    # end step
+
+    # Push a chunk of one or several streams
+    def push_chunk(self, u, stream_ids=None):
+        """
+        Push a chunk of one or several streams.
+        Each stream continues from its last state (zero for a new stream ID), there is no washout.
+        :param u: Inputs (n streams x chunk length x input dim, or chunk length x input dim for a single stream)
+        :param stream_ids: Stream IDs (one per row), or None for streams 0 to n-1
+        :return: Outputs (n streams x chunk length x output dim, or chunk length x output dim for a single stream)
+        """
+        # Streaming needs the trained output layer
+        if self.training:
+            raise Exception("Streaming needs a trained output layer, call finalize() first")
+        # end if
+
+        # Single stream
+        single_stream = u.dim() == 2
+        if single_stream:
+            u = u.unsqueeze(0)
+        # end if
+
+        # Default stream IDs
+        if stream_ids is None:
+            stream_ids = list(range(u.size(0)))
+        # end if
+
+        # Rows of the streams
+        rows = self._stream_rows(stream_ids, u.size(0))
+
+        # Run reservoir from the last states, keep the new ones
+        hidden_states = self._esn_cell.stream(u, self.stream_states[rows])
+        if hidden_states.size(1) > 0:
+            self.stream_states[rows] = hidden_states[:, -1]
+        # end if
+
+        # Outputs
+        outputs = self._output(hidden_states, None)
+        return outputs[0] if single_stream else outputs
+    # end push_chunk
+
+    # Close a stream
+    def close_stream(self, stream_id):
+        """
+        Close a stream and forget its state
+        :param stream_id: Stream ID
+        """
+        row = self._stream_ids.pop(stream_id)
+        self.stream_states = torch.cat((self.stream_states[:row], self.stream_states[row + 1:]), dim=0)
+        for s_id, s_row in self._stream_ids.items():
+            if s_row > row:
+                self._stream_ids[s_id] = s_row - 1
+            # end if
+        # end for
+    # end close_stream
+
+    # Close all streams
+    def reset_streams(self):
+        """
+        Close all streams
+        """
+        self._stream_ids = dict()
+        self.stream_states = self.stream_states[:0]
+    # end reset_streams
+
     # endregion OVERRIDE
 
     # region PRIVATE
 
+    # Timesteps of targets
+    def _time_slice(self, y, start, end=None):
+        """
+        Timesteps of targets
+        :param y: Targets (batch size x time length x output dim), or a dictionary of targets, one target per
+        sample (batch size x output dim) and class labels (batch size) are returned as they are
+        :param start: First timestep
+        :param end: Last timestep (excluded), None for the end
+        :return: Targets from start to end
+        """
+        if isinstance(y, dict):
+            return {name: self._time_slice(y_head, start, end) for name, y_head in y.items()}
+        elif y.dim() < 3:
+            return y
+        else:
+            return y[:, start:end]
+        # end if
+    # end _time_slice
+
+    # Rows of streams in the state tensor
+    def _stream_rows(self, stream_ids, n_streams):
+        """
+        Rows of streams in the state tensor, new streams start with a zero state
+        :param stream_ids: Stream IDs
+        :param n_streams: Number of streams in the chunk
+        :return: Row indices (tensor)
+        """
+        # Check IDs
+        if len(stream_ids) != n_streams or len(set(stream_ids)) != n_streams:
+            raise Exception("One distinct stream ID per row expected, got {}".format(stream_ids))
+        # end if
+
+        # Add new streams
+        new_ids = [s_id for s_id in stream_ids if s_id not in self._stream_ids]
+        if len(new_ids) > 0:
+            for s_id in new_ids:
+                self._stream_ids[s_id] = len(self._stream_ids)
+            # end for
+            self.stream_states = torch.cat(
+                (self.stream_states, self.stream_states.new_zeros(len(new_ids), self._hidden_dim)),
+                dim=0
+            )
+        # end if
+
+        return torch.tensor([self._stream_ids[s_id] for s_id in stream_ids], device=self.stream_states.device)
+    # end _stream_rows
+
     # Generate matrices
     def _generate_matrices(self, w_generator, win_generator, wbias_generator):
         """
@@ -52,7 +52,7 @@ class LiESN(ESN):
         :param win_generator: Input-reservoir weight matrix generator
         :param wbias_generator: Bias weight matrix generator
         :param nonlin_func: Non-linear function
-        :param learning_algo: Learning algorithm (inv, pinv)
+        :param learning_algo: Learning algorithm (inv, pinv, cholesky, solve, lstsq, eigh)
         :param ridge_param: Regularisation parameter
         :param with_bias: Add a bias to output ?
         :param softmax_output: Add a softmax layer at the outputs ?
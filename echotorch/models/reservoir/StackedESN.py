@@ -227,18 +227,12 @@ class StackedESN(nn.Module):
         # Hidden states
         hidden_states = Variable(torch.zeros(u.size(0), u.size(1), self.n_features))
 
-        # Compute hidden states
+        # Compute hidden states, each layer writes into its own slice which is the input of the next layer
         pos = 0
+        last_hidden_states = u
         for index, esn_cell in enumerate(self.esn_layers):
             layer_dim = esn_cell.output_dim
-            if index == 0:
-                last_hidden_states = esn_cell(u)
-            else:
-                last_hidden_states = esn_cell(last_hidden_states)
-            # end if
-
-            # Update
-            hidden_states[:, :, pos:pos + layer_dim] = last_hidden_states
+            last_hidden_states = esn_cell(last_hidden_states, out=hidden_states[:, :, pos:pos + layer_dim])
 
             # Next position
             pos += layer_dim
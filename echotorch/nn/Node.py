@@ -365,6 +365,56 @@ class Node(nn.Module):
         return torch.pinverse(M)
     # end _pinverse
 
+    # Ridge regression with a low-rank covariance matrix
+    def _low_rank_ridge(self, name, S, Y, ridge_param, code_class, code_pos):
+        """
+        Ridge regression with a low-rank covariance matrix, (sTs + ridge * I)^-1 * sTy.
+        With fewer rows T than columns N, the Woodbury identity gives sT * (ssT + ridge * I)^-1 * Y, which
+        factorizes a T x T matrix instead of the N x N one, O(N^2 * T) instead of O(N^3).
+        :param name: Name associated with S
+        :param S: Features (T x N)
+        :param Y: Targets (T x output dim)
+        :param ridge_param: Ridge parameter (must be positive)
+        :return: Solution (N x output dim)
+        """
+        # Number of rows and features
+        n_rows, n_features = S.size()
+
+        # Woodbury needs a positive definite matrix
+        if ridge_param <= 0:
+            raise Exception(
+                "Low-rank ridge regression of {} needs a positive ridge parameter (at {}:{})".format(
+                    name,
+                    code_class,
+                    code_pos
+                )
+            )
+        # end if
+
+        # The smallest of ssT and sTs
+        if n_rows < n_features:
+            M = torch.mm(S, S.t())
+        else:
+            M = torch.mm(S.t(), S)
+        # end if
+        M.diagonal().add_(ridge_param)
+
+        # Cholesky factor
+        L, info = torch.linalg.cholesky_ex(M)
+        if info.item() > 0:
+            raise Exception(
+                "Ridge matrix of {} is not positive definite (at {}:{})".format(name, code_class, code_pos)
+            )
+        # end if
+
+        # Solution
+        if n_rows < n_features:
+            return torch.mm(S.t(), torch.cholesky_solve(Y, L))
+        else:
+            return torch.cholesky_solve(torch.mm(S.t(), Y), L)
+        # end if
+    # end _low_rank_ridge
+
     # Call debug point
     def _call_debug_point(self, name, value, code_class, code_pos):
         """
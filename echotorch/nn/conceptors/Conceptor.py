@@ -31,6 +31,7 @@ from typing import Union, List
 from torch.autograd import Variable
 import math
 from ..NeuralFilter import NeuralFilter
+from ..utils.SufficientStatistics import SufficientStatistics
 from echotorch.utils.utility_functions import generalized_squared_cosine
 
 
@@ -67,6 +68,11 @@ class Conceptor(NeuralFilter):
 
         # Initialize Conceptor matrix C
         self.register_buffer('C', Variable(torch.zeros(c_size, c_size, dtype=self._dtype), requires_grad=False))
+
+        # Cached eigendecompositions of R and C (eigenvalues, eigenvectors), cleared when R or C is assigned
+        self._R_eig = None
+        self._C_eig = None
+        self._C_from_R = False
     # end __init__
 
     # region PROPERTIES
@@ -105,11 +111,11 @@ class Conceptor(NeuralFilter):
     @property
     def SV(self):
         """
-        Singular values
-        :return: Singular values as a vector
+        Singular values (from the cached eigendecomposition of C)
+        :return: Singular values as a vector (descending order)
         """
-        (U, S, V) = torch.svd(self.C)
-        return S
+        c, _ = self._C_eigen()
+        return torch.sort(torch.abs(c), descending=True)[0]
     # end SV
 
     # Singular values decomposition on C
@@ -155,6 +161,35 @@ class Conceptor(NeuralFilter):
         self.C = torch.mm(Uc, torch.mm(torch.diag(new_Sc), Vc.t()))
     # end modify_SVs
 
+    # Singular values, quota and norm of C for several apertures
+    def aperture_sweep(self, apertures):
+        """
+        Singular values, quota and Frobenius norm of C for several apertures, from one cached eigendecomposition.
+        C is recomputed from R when it was learned from R, otherwise C is scaled with PHI(aperture / self.aperture).
+        :param apertures: Apertures (list or tensor of length L)
+        :return: Dictionary with apertures (L), singular_values (L x dim, descending), quota (L) and norm (L)
+        """
+        # Apertures as a tensor
+        apertures = torch.as_tensor(apertures, dtype=torch.float64)
+
+        # Singular values for each aperture
+        if self._C_from_R:
+            s, _ = self._R_eigen()
+            svs = Conceptor._aperture_spectrum(s, apertures)
+        else:
+            c, _ = self._C_eigen()
+            svs = Conceptor._phi_spectrum(c, apertures / self._aperture)
+        # end if
+        svs = torch.sort(torch.abs(svs), dim=1, descending=True)[0]
+
+        return {
+            'apertures': apertures,
+            'singular_values': svs,
+            'quota': torch.sum(svs, dim=1) / self.input_dim,
+            'norm': torch.sqrt(torch.sum(svs ** 2, dim=1))
+        }
+    # end aperture_sweep
+
     # The conceptor is empty (zero matrix)
     def is_null(self):
         """
@@ -233,8 +268,33 @@ class Conceptor(NeuralFilter):
         self._n_samples = 0
         self.R.fill_(0.0)
         self.C.fill_(0.0)
+        self._clear_eigen_cache()
     # end reset
 
+    # Export sufficient statistics
+    def statistics(self):
+        """
+        Export sufficient statistics (correlation matrix R and number of samples), which can be saved, summed over workers
+        and loaded back with load_statistics() before finalize()
+        :return: SufficientStatistics
+        """
+        return SufficientStatistics(
+            {'R': self.R},
+            {'n_samples': self._n_samples}
+        )
+    # end statistics
+
+    # Load sufficient statistics
+    def load_statistics(self, statistics):
+        """
+        Load sufficient statistics in place of the accumulated ones
+        :param statistics: SufficientStatistics exported by statistics() (or their sum)
+        """
+        self.R.data.copy_(statistics['R'])
+        self._n_samples = statistics['n_samples']
+        self._clear_eigen_cache()
+    # end load_statistics
+
     # Set correlation matrix
     def set_R(self, R, compute_C=True):
         """
@@ -280,18 +340,42 @@ class Conceptor(NeuralFilter):
     # Update Conceptor matrix C
     def update_C(self):
         """
-        Update Conceptor matrix C
+        Update Conceptor matrix C, C = U diag(s / (s + aperture^-2)) U^T with the cached eigendecomposition
+        R = U diag(s) U^T, so that a change of aperture does not factorize R again.
         """
-        self.C = Conceptor.computeC(self.R, self.aperture)
+        # Eigendecomposition of R and singular values of C
+        s, U = self._R_eigen()
+        c = Conceptor._aperture_spectrum(s, self._aperture)
+
+        # C = U diag(c) U^T
+        self.C = torch.mm(U * c.unsqueeze(0), U.t())
+
+        # C shares the eigenvectors of R
+        self._C_eig = (c, U)
+        self._C_from_R = True
         self.train(False)
     # end update_C
 
     # Update correlation matrix R
     def update_R(self):
         """
-        Update correlation matrix R
+        Update correlation matrix R, R = aperture^-2 U diag(c / (1 - c)) U^T with the cached eigendecomposition
+        C = U diag(c) U^T (None if C is the identity)
         """
-        self.R = Conceptor.computeR(self.C, self.aperture)
+        if torch.all(torch.eq(self.C, torch.eye(self.input_dim, dtype=self.C.dtype))):
+            self.R = None
+        else:
+            # Eigenvalues of R from those of C
+            c, U = self._C_eigen()
+            s = math.pow(self.aperture, -2) * c / (1.0 - c)
+            self.R = torch.mm(U * s.unsqueeze(0), U.t())
+
+            # C can be recomputed from R for a new aperture
+            if bool(torch.all(torch.isfinite(s))):
+                self._R_eig = (s, U)
+                self._C_from_R = True
+            # end if
+        # end if
         self.train(False)
     # end update_R
 
@@ -301,110 +385,54 @@ class Conceptor(NeuralFilter):
         Multiply aperture by a factor
         :param gamma: Multiply aperture by a factor.
         """
-        # Dimension
-        dim = self.dim
-
         # Multiply by 0
         if gamma == 0:
             (U, S, V) = torch.svd(self.C)
             Sdiag = S
             Sdiag[Sdiag < 1] = torch.zeros((sum(Sdiag < 1), 1))
             Cnew = torch.mm(U, torch.mm(torch.diag(Sdiag), U.t()))
+            self.set_C(Cnew, self._aperture * gamma)
         elif gamma == float("inf"):
             (U, S, V) = torch.svd(self.C)
             Sdiag = S
             Sdiag[Sdiag > 0] = torch.ones(sum(Sdiag > 0), 1)
             Cnew = torch.mm(U, torch.mm(torch.diag(Sdiag), U.t()))
+            self.set_C(Cnew, self._aperture * gamma)
+        elif self._C_from_R:
+            # Same R, C recomputed for the new aperture
+            self.aperture = self._aperture * gamma
         else:
-            Cnew = torch.mm(self.C, torch.inverse(self.C + math.pow(gamma, -2) * (torch.eye(dim) - self.C)))
-        # end
-
-        # Set aperture and C
-        self.set_C(Cnew, self._aperture * gamma)
+            # C (C + gamma^-2 (I - C))^-1 on the eigenvalues of C
+            c, U = self._C_eigen()
+            self._set_factors(Conceptor._phi_spectrum(c, gamma), U, self._aperture * gamma)
+        # end if
     # end PHI
 
     # AND in Conceptor Logic
-    def AND(self, B, tol=1e-14):
+    def AND(self, B, tol=1e-14, compute_R=True):
         """
-        AND in Conceptor Logic
+        AND in Conceptor Logic, on the cached eigendecompositions of both operands
         :param B: Second conceptor operand (reservoir size x reservoir size)
+        :param tol: Tolerance under which singular values are zero
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: Self AND B
         """
-        # Dimension
-        dim = self.input_dim
-
-        # Conceptor matrices
-        Cc = self.C
-        Bc = B.C
-
         # Same conceptor ?
-        same_conceptor = torch.all(torch.eq(Cc, Bc))
-
-        # Apertures
-        C_aperture = self.aperture
-        B_aperture = B.aperture
-
-        # Same aperture
-        same_aperture = C_aperture == B_aperture
-
-        # SV on both conceptor
-        (UC, SC, UtC) = torch.svd(Cc)
-        (UB, SB, UtB) = torch.svd(Bc)
-
-        # Get singular values
-        dSC = SC
-        dSB = SB
-
-        # How many non-zero singular values
-        numRankC = int(torch.sum(1.0 * (dSC > tol)))
-        numRankB = int(torch.sum(1.0 * (dSB > tol)))
-
-        # Select zero singular vector
-        UC0 = UC[:, numRankC:]
-        UB0 = UB[:, numRankB:]
+        same_conceptor = bool(torch.all(torch.eq(self.C, B.C)))
 
-        # SVD on UC0 + UB0
-        # (W, Sigma, Wt) = lin.svd(np.dot(UC0, UC0.T) + np.dot(UB0, UB0.T))
-        (W, Sigma, Wt) = torch.svd(torch.mm(UC0, UC0.t()) + torch.mm(UB0, UB0.t()))
+        # AND on eigen-factors
+        c, U = Conceptor._AND_factors([self._C_eigen(), B._C_eigen()], tol=tol)
 
-        # Number of non-zero SV
-        numRankSigma = int(sum(1.0 * (Sigma > tol)))
-
-        # Select zero singular vector
-        Wgk = W[:, numRankSigma:]
-
-        # C and B
-        # Wgk * (Wgk^T * (C^-1 + B^-1 - I) * Wgk)^-1 * Wgk^T
-        # CandB = Wgk @ torch.inverse(Wgk.t() @ (torch.pinverse(Cc, tol) + torch.pinverse(Bc, tol) - torch.eye(dim)) @ Wgk) @ Wgk.t()
-        CandB = torch.mm(torch.mm(Wgk, torch.inverse(torch.mm(Wgk.t(), torch.mm((torch.pinverse(Cc, tol) + torch.pinverse(Bc, tol) - torch.eye(dim)), Wgk)))), Wgk.t())
-
-        # New conceptor
-        new_conceptor = Conceptor(
-            input_dim=dim,
-            aperture=1
-        )
-
-        # Cet C
         # TODO: Problem with aperture of a AND of two different conceptors
         if same_conceptor:
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=1.0 / math.sqrt(math.pow(C_aperture, -2) + math.pow(B_aperture, -2))
-            )
-        elif not same_conceptor and same_aperture:
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=C_aperture
-            )
+            aperture = 1.0 / math.sqrt(math.pow(self.aperture, -2) + math.pow(B.aperture, -2))
+        elif self.aperture == B.aperture:
+            aperture = self.aperture
         else:
-            # print("WARNING: Computing the AND of two different conceptors with different aperture is hazardous (aperture put to 1)")
-            new_conceptor.set_C(
-                C=CandB,
-                aperture=1.0
-            )
+            aperture = 1.0
         # end if
 
-        return new_conceptor
+        return Conceptor._from_factors(c, U, aperture, compute_R=compute_R)
     # end AND
 
     # AND in Conceptor Logic
@@ -414,15 +442,18 @@ class Conceptor(NeuralFilter):
         :param B: Second conceptor operand (reservoir size x reservoir size)
         """
         # C AND B
-        CandB = self.AND(B, tol=tol)
-        self.set_C(CandB.C, CandB.aperture)
+        CandB = self.AND(B, tol=tol, compute_R=False)
+        c, U = CandB._C_eigen()
+        self._set_factors(c, U, CandB.aperture)
     # end AND_
 
     # OR in Conceptor Logic
-    def OR(self, Q, tol=1e-14):
+    def OR(self, Q, tol=1e-14, compute_R=True):
         """
-        OR in Conceptor Logic
+        OR in Conceptor Logic, NOT(NOT self AND NOT Q) on the cached eigendecompositions of both operands
         :param Q: Second conceptor operand (reservoir size x reservoir size)
+        :param tol: Tolerance under which singular values are zero
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: Self OR Q
         """
         if Q.is_null():
@@ -430,8 +461,20 @@ class Conceptor(NeuralFilter):
         elif self.is_null():
             return Q.copy()
         else:
-            # R OR Q
-            return (self.NOT().AND(Q.NOT(), tol=tol)).NOT()
+            # NOT shares the eigenvectors, with eigenvalues 1 - c
+            c, U = Conceptor._AND_factors([Conceptor._NOT_factors(self._C_eigen()),
+                                           Conceptor._NOT_factors(Q._C_eigen())], tol=tol)
+
+            # Aperture of NOT(NOT self AND NOT Q)
+            if bool(torch.all(torch.eq(self.C, Q.C))):
+                aperture = math.sqrt(math.pow(self.aperture, 2) + math.pow(Q.aperture, 2))
+            elif self.aperture == Q.aperture:
+                aperture = self.aperture
+            else:
+                aperture = 1.0
+            # end if
+
+            return Conceptor._from_factors(1.0 - c, U, aperture, compute_R=compute_R)
         # end if
     # end OR
 
@@ -445,28 +488,22 @@ class Conceptor(NeuralFilter):
         self.R = newC.R
         self._aperture = newC.aperture
         self.C = newC.C
+        self._R_eig = newC._R_eig
+        self._C_eig = newC._C_eig
+        self._C_from_R = newC._C_from_R
     # end OR_
 
     # NOT
-    def NOT(self):
+    def NOT(self, compute_R=True):
         """
         NOT
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: ~C
         """
         if not self.is_null():
-            # NOT correlation matrix
-            not_C = torch.eye(self.input_dim, dtype=self._dtype) - self.C
-
-            # New conceptor
-            new_conceptor = Conceptor(
-                input_dim=self.input_dim,
-                aperture=1.0 / self._aperture
-            )
-
-            # Set R and C
-            new_conceptor.set_C(not_C, aperture=1.0 / self._aperture, compute_R=True)
-
-            return new_conceptor
+            # I - C shares the eigenvectors of C
+            c, U = Conceptor._NOT_factors(self._C_eigen())
+            return Conceptor._from_factors(c, U, 1.0 / self._aperture, compute_R=compute_R)
         else:
             raise Exception("Cannot compute the NOT of a null conceptor!")
         # end if
@@ -534,6 +571,9 @@ class Conceptor(NeuralFilter):
         new_C = Conceptor(self.input_dim, self.aperture)
         new_C.set_R(self.R, compute_C=False)
         new_C.set_C(self.C, self.aperture, compute_R=False)
+        new_C._R_eig = self._R_eig
+        new_C._C_eig = self._C_eig
+        new_C._C_from_R = self._C_from_R
         return new_C
     # end copy
 
@@ -549,6 +589,57 @@ class Conceptor(NeuralFilter):
 
     # region PRIVATE
 
+    # Eigendecomposition of R
+    def _R_eigen(self):
+        """
+        Eigendecomposition of R (cached until R is assigned)
+        :return: Eigenvalues (ascending, clamped to zero), eigenvectors
+        """
+        if self._R_eig is None:
+            s, U = torch.linalg.eigh(self.R)
+            self._R_eig = (torch.clamp(s, min=0.0), U)
+        # end if
+        return self._R_eig
+    # end _R_eigen
+
+    # Eigendecomposition of C
+    def _C_eigen(self):
+        """
+        Eigendecomposition of C (cached until C is assigned)
+        :return: Eigenvalues, eigenvectors
+        """
+        if self._C_eig is None:
+            self._C_eig = torch.linalg.eigh((self.C + self.C.t()) / 2.0)
+        # end if
+        return self._C_eig
+    # end _C_eigen
+
+    # Set C from its eigendecomposition
+    def _set_factors(self, c, U, aperture, compute_R=True):
+        """
+        Set C from its eigendecomposition C = U diag(c) U^T, which is kept as the cached one
+        :param c: Eigenvalues of C
+        :param U: Eigenvectors of C
+        :param aperture: Conceptor's aperture
+        :param compute_R: Update R from C
+        """
+        self.set_C(torch.mm(U * c.unsqueeze(0), U.t()), aperture, compute_R=False)
+        self._C_eig = (c, U)
+        if compute_R:
+            self.update_R()
+        # end if
+    # end _set_factors
+
+    # Clear cached eigendecompositions
+    def _clear_eigen_cache(self):
+        """
+        Clear cached eigendecompositions (R or C changed in place)
+        """
+        self._R_eig = None
+        self._C_eig = None
+        self._C_from_R = False
+    # end _clear_eigen_cache
+
     # Increment correlation matrices
     def _increment_correlation_matrices(self, X):
         """
@@ -605,6 +696,23 @@ class Conceptor(NeuralFilter):
         return s.format(**self.__dict__)
     # end extra_repr
 
+    # Set attribute
+    def __setattr__(self, name, value):
+        """
+        Set attribute, assigning R or C (also with +=, /=, ...) clears the cached eigendecompositions
+        :param name: Attribute name
+        :param value: Value
+        """
+        super(Conceptor, self).__setattr__(name, value)
+        if name == 'R':
+            self._R_eig = None
+            self._C_from_R = False
+        elif name == 'C':
+            self._C_eig = None
+            self._C_from_R = False
+        # end if
+    # end __setattr__
+
     # Hash
     def __hash__(self):
         """
@@ -755,41 +863,94 @@ class Conceptor(NeuralFilter):
 
     # NOT operator
     @staticmethod
-    def operator_NOT(C):
+    def operator_NOT(C, compute_R=True):
         """
         NOT operator
         :param C: Conceptor matrix
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: NOT version of R
         """
-        return C.NOT()
+        return C.NOT(compute_R=compute_R)
     # end operator_NOT
 
     # OR in Conceptor Logic
     @staticmethod
-    def operator_OR(C, B, tol=1e-14):
+    def operator_OR(C, B, tol=1e-14, compute_R=True):
         """
         OR in Conceptor Logic
         :param C: First Conceptor operand (reservoir size x reservoir size)
         :param B: Second Conceptor operand (reservoir size x reservoir size)
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: C OR B
         """
         # C OR B
-        return C.OR(B, tol=tol)
+        return C.OR(B, tol=tol, compute_R=compute_R)
     # end operator_OR
 
     # AND in Conceptor Logic
     @staticmethod
-    def operator_AND(C, B, tol=1e-14):
+    def operator_AND(C, B, tol=1e-14, compute_R=True):
         """
         AND in Conceptor Logic
         :param C: First Conceptor operand
         :param B: Second Conceptor operand
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
         :return: C AND B
         """
         # C AND B
-        return C.AND(B, tol=tol)
+        return C.AND(B, tol=tol, compute_R=compute_R)
     # end operator_AND
 
+    # AND of a list of conceptors
+    @staticmethod
+    def AND_all(conceptors, tol=1e-14, compute_R=True):
+        """
+        AND of a list of conceptors, in one step when they commute or are full rank
+        :param conceptors: List of Conceptor objects
+        :param tol: Tolerance under which singular values are zero
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
+        :return: AND of all conceptors (aperture of the operands if they all share it, 1 otherwise)
+        """
+        if len(conceptors) == 0:
+            raise Exception("Cannot compute the AND of an empty list of conceptors!")
+        # end if
+
+        # AND on eigen-factors
+        c, U = Conceptor._AND_factors([conceptor._C_eigen() for conceptor in conceptors], tol=tol)
+        return Conceptor._from_factors(c, U, Conceptor._shared_aperture(conceptors), compute_R=compute_R)
+    # end AND_all
+
+    # OR of a list of conceptors
+    @staticmethod
+    def OR_all(conceptors, tol=1e-14, compute_R=True):
+        """
+        OR of a list of conceptors, in one step when they commute or have no singular value equal to one
+        :param conceptors: List of Conceptor objects
+        :param tol: Tolerance under which singular values are zero
+        :param compute_R: Compute the correlation matrix R of the result (only C otherwise)
+        :return: OR of all conceptors (aperture of the operands if they all share it, 1 otherwise)
+        """
+        if len(conceptors) == 0:
+            raise Exception("Cannot compute the OR of an empty list of conceptors!")
+        # end if
+
+        # Null conceptors do not change the OR
+        operands = [conceptor for conceptor in conceptors if not conceptor.is_null()]
+
+        if len(operands) == 0:
+            return conceptors[0].copy()
+        elif len(operands) == 1:
+            return operands[0].copy()
+        else:
+            # NOT of the AND of the NOTs
+            c, U = Conceptor._AND_factors(
+                [Conceptor._NOT_factors(conceptor._C_eigen()) for conceptor in operands],
+                tol=tol
+            )
+            return Conceptor._from_factors(1.0 - c, U, Conceptor._shared_aperture(operands), compute_R=compute_R)
+        # end if
+    # end OR_all
+
     # PHI in Conceptor Logic
     @staticmethod
     def operator_PHI(C, gamma):
@@ -821,6 +982,184 @@ class Conceptor(NeuralFilter):
         return torch.mm(inv_algo(R + math.pow(aperture, -2) * torch.eye(R_dim)), R)
     # end computeC
 
+    # New conceptor from the eigendecomposition of C
+    @staticmethod
+    def _from_factors(c, U, aperture, compute_R=True):
+        """
+        New conceptor from the eigendecomposition of C
+        :param c: Eigenvalues of C
+        :param U: Eigenvectors of C
+        :param aperture: Aperture
+        :param compute_R: Compute the correlation matrix R (only C otherwise)
+        :return: Conceptor
+        """
+        new_conceptor = Conceptor(input_dim=U.size(0), aperture=aperture, dtype=U.dtype)
+        new_conceptor._set_factors(c, U, aperture, compute_R=compute_R)
+        return new_conceptor
+    # end _from_factors
+
+    # Aperture shared by a list of conceptors
+    @staticmethod
+    def _shared_aperture(conceptors):
+        """
+        Aperture shared by a list of conceptors
+        :param conceptors: List of Conceptor objects
+        :return: Their aperture if they all have the same, 1 otherwise
+        """
+        if all(conceptor.aperture == conceptors[0].aperture for conceptor in conceptors):
+            return conceptors[0].aperture
+        else:
+            return 1.0
+        # end if
+    # end _shared_aperture
+
+    # NOT on eigen-factors
+    @staticmethod
+    def _NOT_factors(factors):
+        """
+        NOT on eigen-factors, I - C = U diag(1 - c) U^T
+        :param factors: Eigenvalues and eigenvectors of C
+        :return: Eigenvalues and eigenvectors of I - C
+        """
+        c, U = factors
+        return 1.0 - c, U
+    # end _NOT_factors
+
+    # Eigenvalues of the operands in the eigenbasis of the first one
+    @staticmethod
+    def _common_spectra(factors):
+        """
+        Eigenvalues of the operands in the eigenbasis of the first one, if they all commute with it
+        :param factors: List of eigenvalues and eigenvectors
+        :return: List of eigenvalues in the eigenbasis of the first operand, None if an operand does not commute
+        """
+        U = factors[0][1]
+        spectra = [factors[0][0]]
+        for c, V in factors[1:]:
+            if V is U:
+                spectra.append(c)
+            else:
+                # Operand in the basis of the first one
+                W = torch.mm(U.t(), V)
+                D = torch.mm(W * c.unsqueeze(0), W.t())
+                d = torch.diagonal(D)
+
+                # Not diagonal, the operands do not commute
+                if torch.max(torch.abs(D - torch.diag(d))) > 1000.0 * torch.finfo(D.dtype).eps:
+                    return None
+                # end if
+                spectra.append(d)
+            # end if
+        # end for
+        return spectra
+    # end _common_spectra
+
+    # AND on eigen-factors
+    @staticmethod
+    def _AND_factors(factors, tol=1e-14):
+        """
+        AND on eigen-factors.
+        Commuting operands are combined on their eigenvalues, 1 / (1/c1 + ... + 1/ck - (k - 1)), full rank operands
+        with one eigendecomposition of C1^-1 + ... + Ck^-1 - (k - 1) I, others pairwise on their null spaces.
+        :param factors: List of eigenvalues and eigenvectors of the operands
+        :param tol: Tolerance under which singular values are zero
+        :return: Eigenvalues and eigenvectors of the AND
+        """
+        # Number of operands
+        k = len(factors)
+        spectra = Conceptor._common_spectra(factors)
+
+        if spectra is not None:
+            # Commuting operands share the eigenvectors of the first one
+            S = torch.stack(spectra)
+            c = torch.where(
+                torch.all(S > tol, dim=0),
+                1.0 / (torch.sum(1.0 / S, dim=0) - (k - 1)),
+                torch.zeros_like(S[0])
+            )
+            U = factors[0][1]
+        elif all(bool(torch.min(f_c) > tol) for f_c, _ in factors):
+            # (C1^-1 + ... + Ck^-1 - (k - 1) I)^-1, eigenvalues of the sum are >= 1
+            P = sum(torch.mm(f_U / f_c.unsqueeze(0), f_U.t()) for f_c, f_U in factors)
+            P = P - (k - 1) * torch.eye(P.size(0), dtype=P.dtype)
+            p, U = torch.linalg.eigh((P + P.t()) / 2.0)
+            c = 1.0 / p
+        else:
+            c, U = factors[0]
+            for b, V in factors[1:]:
+                c, U = Conceptor._AND_pair(c, U, b, V, tol)
+            # end for
+        # end if
+        return c, U
+    # end _AND_factors
+
+    # AND of two operands on eigen-factors
+    @staticmethod
+    def _AND_pair(c, U, b, V, tol=1e-14):
+        """
+        AND of two operands on eigen-factors, W (W^T (C^+ + B^+ - I) W)^-1 W^T with W a basis of the intersection of
+        the ranges of C and B
+        :param c: Eigenvalues of C
+        :param U: Eigenvectors of C
+        :param b: Eigenvalues of B
+        :param V: Eigenvectors of B
+        :param tol: Tolerance under which singular values are zero
+        :return: Eigenvalues and eigenvectors of C AND B
+        """
+        # Dimension
+        dim = U.size(0)
+
+        # Null spaces of both operands
+        UC0 = U[:, c <= tol]
+        UB0 = V[:, b <= tol]
+
+        # Intersection of the ranges is the null space of the sum of the null space projectors
+        sigma, W = torch.linalg.eigh(torch.mm(UC0, UC0.t()) + torch.mm(UB0, UB0.t()))
+        Wgk = W[:, sigma <= tol]
+
+        # Pseudo-inverses from the factors
+        Cp = torch.mm(U[:, c > tol] / c[c > tol].unsqueeze(0), U[:, c > tol].t())
+        Bp = torch.mm(V[:, b > tol] / b[b > tol].unsqueeze(0), V[:, b > tol].t())
+
+        # (Wgk^T (C^+ + B^+ - I) Wgk)^-1 by eigendecomposition
+        M = torch.mm(Wgk.t(), torch.mm(Cp + Bp - torch.eye(dim, dtype=U.dtype), Wgk))
+        mu, Z = torch.linalg.eigh((M + M.t()) / 2.0)
+
+        # Zero outside the intersection
+        return (
+            torch.cat((torch.zeros(dim - Wgk.size(1), dtype=U.dtype), 1.0 / mu)),
+            torch.cat((W[:, sigma > tol], torch.mm(Wgk, Z)), dim=1)
+        )
+    # end _AND_pair
+
+    # Singular values of C from the eigenvalues of R
+    @staticmethod
+    def _aperture_spectrum(s, apertures):
+        """
+        Singular values of C from the eigenvalues of R, s / (s + aperture^-2)
+        :param s: Eigenvalues of R (dim)
+        :param apertures: Aperture (float) or apertures (L)
+        :return: Singular values (dim) or (L x dim)
+        """
+        apertures = torch.as_tensor(apertures, dtype=s.dtype)
+        denominator = s + torch.pow(apertures.reshape(apertures.shape + (1,)), -2)
+        return torch.where(denominator > 0, s / denominator, torch.zeros_like(denominator))
+    # end _aperture_spectrum
+
+    # Singular values of C scaled by PHI
+    @staticmethod
+    def _phi_spectrum(c, gammas):
+        """
+        Singular values of PHI(C, gamma) from those of C, c / (c + gamma^-2 (1 - c))
+        :param c: Eigenvalues of C (dim)
+        :param gammas: Aperture factor (float) or factors (L)
+        :return: Singular values (dim) or (L x dim)
+        """
+        gammas = torch.as_tensor(gammas, dtype=c.dtype)
+        denominator = c + torch.pow(gammas.reshape(gammas.shape + (1,)), -2) * (1.0 - c)
+        return torch.where(denominator > 0, c / denominator, torch.zeros_like(denominator))
+    # end _phi_spectrum
+
     # Compute R from conceptor matrix C
     # TODO: Test
     @staticmethod
@@ -947,9 +1286,8 @@ class Conceptor(NeuralFilter):
     # end sim
 
     # Delta measure (sensibility of Frobenius norm to change of aperture)
-    # TODO: Test
     @staticmethod
-    def delta_measure(self, C, gamma, epsilon=0.01):
+    def delta_measure(C, gamma, epsilon=0.01):
         """
         Delta measure (sensibility of Frobenius norm to change of aperture)
         :param C: Conceptor object
@@ -957,47 +1295,32 @@ class Conceptor(NeuralFilter):
         :param epsilon: Epsilon
         :return: Delta measure
         """
-        # Conceptors with two gammas
-        A = Conceptor.operator_PHI(C, gamma - epsilon)
-        B = Conceptor.operator_PHI(C, gamma + epsilon)
+        # Norms of C with two gammas
+        norms = C.aperture_sweep([C.aperture * (gamma - epsilon), C.aperture * (gamma + epsilon)])['norm']
 
         # Gradient of Frobenius norm
-        A_norm = math.pow(torch.norm(A, p=2), 2)
-        B_norm = math.pow(torch.norm(B, p=2), 2)
+        A_norm = math.pow(norms[0].item(), 2)
+        B_norm = math.pow(norms[1].item(), 2)
         d_C_norm = B_norm - A_norm
 
         # Change in log (gamma)
-        d_log_gamma = torch.log(gamma + epsilon) - torch.log(gamma - epsilon)
+        d_log_gamma = math.log(gamma + epsilon) - math.log(gamma - epsilon)
         return d_C_norm / d_log_gamma, d_C_norm
-    # end delta
+    # end delta_measure
 
     # How x fits in Conceptor ellipsoid (Evidence)
-    # TODO: Test
     @staticmethod
     def evidence(C, x):
         """
-        How x fits in Conceptor ellipsoid (Evidence)
+        How x fits in Conceptor ellipsoid (Evidence), x^T C x / x^T x for all states at once
         :param C: Conceptor object
-        :param x: Reservoir state(s) (T x Nx, or Nx)
-        :return:
+        :param x: Reservoir state(s) (Nx, T x Nx, or B x T x Nx)
+        :return: Evidence (scalar, T, or B x T)
         """
-        if x.ndim == 1:
-            return torch.mv(C.C.t(), x).t().dot(x) / torch.dot(x, x)
-        elif x.ndim == 2:
-            # Time length
-            time_length = x.size(0)
-
-            # Evidence vector
-            evidences_vector = torch.empty(time_length)
-
-            # For each time step
-            for t in range(time_length):
-                evidences_vector[t] = torch.mv(C.C.t(), x[t]).t().dot(x[t]) / torch.dot(x[t], x[t])
-            # end for
-
-            return evidences_vector
+        if x.ndim in (1, 2, 3):
+            return torch.einsum('...i,ij,...j->...', x, C.C.to(x.dtype), x) / torch.sum(x * x, dim=-1)
         else:
-            raise Exception("Waiting for 1-dim or 2-dim tensor, got {}".format(x.ndim))
+            raise Exception("Waiting for 1-dim, 2-dim or 3-dim tensor, got {}".format(x.ndim))
         # end if
     # end evidence
 
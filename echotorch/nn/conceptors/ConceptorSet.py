@@ -25,8 +25,89 @@ import torch
 from typing import Union, List
 from ..NeuralFilter import NeuralFilter
 from .Conceptor import Conceptor
-from echotorch.utils import quota, rank
 from echotorch.utils.utility_functions import generalized_squared_cosine
+from echotorch.utils.error_measures import generalized_squared_cosine_matrix
+from echotorch.utils.worker_pool import map_in_workers, worker_state
+
+
+# Similarity of a pair of conceptors
+def _similarity_pair(i, j):
+    """
+    Similarity of a pair of conceptors
+    :param i: First conceptor index
+    :param j: Second conceptor index
+    :return: Similarity
+    """
+    state = worker_state()
+    return float(Conceptor.similarity(
+        state['conceptors'][i],
+        state['conceptors'][j],
+        based_on=state['based_on'],
+        sim_func=state['sim_func']
+    ))
+# end _similarity_pair
+
+
+# Rank or quota of the intersection of a pair of conceptors
+def _intersection_pair(i, j):
+    """
+    Rank or quota of the intersection of a pair of conceptors
+    :param i: First conceptor index
+    :param j: Second conceptor index
+    :return: Rank or quota of the AND
+    """
+    state = worker_state()
+    conceptors = state['conceptors']
+
+    # Eigenvalues of the AND, the matrix itself is not needed
+    c, _ = Conceptor._AND_factors([conceptors[i]._C_eigen(), conceptors[j]._C_eigen()], tol=state['tol'])
+
+    # Change aperture
+    if state['gamma'] != 1:
+        c = Conceptor._phi_spectrum(c, state['gamma'])
+    # end if
+
+    # Rank or quota from the singular values of the AND
+    if state['return_rank']:
+        return int(torch.sum(1.0 * (torch.abs(c) > state['tol'])))
+    else:
+        return float(torch.sum(torch.abs(c)).item() / c.size(0))
+    # end if
+# end _intersection_pair
+
+
+# Symmetric matrix of a function of each unordered pair of conceptors
+def _pairwise_matrix(pair_function, conceptors, options, matrix, n_workers=1, n_threads=1):
+    """
+    Symmetric matrix of a function of each unordered pair of conceptors
+    :param pair_function: Function of a pair of indices (module level, for worker processes)
+    :param conceptors: List of conceptors
+    :param options: Options of the pairwise function
+    :param matrix: Matrix to fill (K x K)
+    :param n_workers: Number of worker processes (1 for this process)
+    :param n_threads: Number of torch threads in each worker
+    :return: Filled matrix
+    """
+    # Each unordered pair once
+    pairs = [(i, j) for i in range(len(conceptors)) for j in range(i, len(conceptors))]
+
+    # In this process or in worker processes
+    values = map_in_workers(
+        pair_function,
+        pairs,
+        dict(options, conceptors=conceptors),
+        n_workers,
+        n_threads,
+        chunksize=max(1, len(pairs) // (4 * max(n_workers, 1)))
+    )
+
+    # Both halves
+    for (i, j), value in zip(pairs, values):
+        matrix[i, j] = value
+        matrix[j, i] = value
+    # end for
+    return matrix
+# end _pairwise_matrix
 
 
 # Set of conceptors : store and manipulate conceptors safely
@@ -57,6 +138,12 @@ class ConceptorSet(NeuralFilter):
 
         # We link conceptors to names
         self._conceptors = dict()
+
+        # Cached OR of all conceptors and of all but each one, with the members they were computed from
+        self._union = None
+        self._union_key = None
+        self._others = None
+        self._others_key = None
     # end __init__
 
     # region PROPERTIES
@@ -101,7 +188,7 @@ class ConceptorSet(NeuralFilter):
         NOT A - Subspace not populated by conceptors
         :return: Matrix N (Conceptor)
         """
-        return self.A().NOT()
+        return self.A(compute_R=False).NOT()
     # end N
 
     # Conceptor matrix of NOT A
@@ -113,25 +200,29 @@ class ConceptorSet(NeuralFilter):
         if self.is_null():
             return torch.eye(self.input_dim, dtype=self._dtype)
         else:
-            return self.N().conceptor_matrix()
+            return self.A(compute_R=False).NOT(compute_R=False).conceptor_matrix()
         # end if
     # end F
 
     # OR of all conceptors stored
-    def A(self, tol=1e-14):
+    def A(self, tol=1e-14, compute_R=True):
         """
         OR of all conceptors stored
+        :param tol: Tolerance under which singular values are zero
+        :param compute_R: Compute the correlation matrix R of the OR (only C otherwise)
         :return: OR (Conceptor) of all conceptors stored
         """
-        # Start at 0
-        A = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
-
-        # For each conceptor
-        for kc, C in self._conceptors.items():
-            A.OR_(C, tol=tol)
-        # end for
-
-        return A
+        if self.is_null():
+            # Start at 0
+            return Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
+        else:
+            # Copy of the cached union
+            A = self._cached_union(tol).copy()
+            if compute_R:
+                A.update_R()
+            # end if
+            return A
+        # end if
     # end A
 
     # Quota of the set of Conceptors
@@ -144,7 +235,7 @@ class ConceptorSet(NeuralFilter):
         if self.is_null():
             return 0.0
         else:
-            return self.A().quota
+            return self.A(compute_R=False).quota
         # end if
     # end quota
 
@@ -167,9 +258,10 @@ class ConceptorSet(NeuralFilter):
         Multiply aperture of each conceptor by a factor gamma
         :param gamma: Multiplicative factor
         """
-        for conceptor_i in range(self.count):
-            self.conceptors[conceptor_i].PHI(gamma)
+        for conceptor in self._conceptors.values():
+            conceptor.PHI(gamma)
         # end for
+        self._clear_unions()
     # end PHI
 
     # Similarity between conceptors and a given one
@@ -239,30 +331,51 @@ class ConceptorSet(NeuralFilter):
     # end similarity
 
     # Compute similarity matrix between conceptors
-    def similarity_matrix(self, based_on='C', sim_func=generalized_squared_cosine):
+    def similarity_matrix(self, based_on='C', sim_func=generalized_squared_cosine, n_workers=1, n_threads=1):
         """
-        Compute similarity matrix between conceptors
+        Compute similarity matrix between conceptors, once for each unordered pair. The generalized squared cosine
+        is computed for all pairs at once from the stacked matrices, other similarity functions pair by pair, in
+        n_workers processes.
         :param based_on: Similarity based on C ('C') or R ('R)
         :param sim_func: Similarity function (default: generalized squared cosine)
+        :param n_workers: Number of worker processes for other similarity functions (1 for this process)
+        :param n_threads: Number of torch threads in each worker
         :return: Similarity matrix as torch tensor
         """
         # Similarity matrix
         sim_matrix = torch.zeros(self.count, self.count)
 
-        # For each pair of conceptor
-        for i in range(self.count):
-            for j in range(self.count):
-                sim_matrix[i, j] = self.similarity(i, j, based_on, sim_func)
-            # end for
-        # end for
+        # Conceptors
+        conceptors = list(self._conceptors.values())
+
+        if sim_func is generalized_squared_cosine and self.count > 0:
+            sim_matrix[:, :] = generalized_squared_cosine_matrix(
+                torch.stack([c.C if based_on == 'C' else c.R for c in conceptors])
+            )
+        else:
+            _pairwise_matrix(
+                _similarity_pair,
+                conceptors,
+                {'based_on': based_on, 'sim_func': sim_func},
+                sim_matrix,
+                n_workers=n_workers,
+                n_threads=n_threads
+            )
+        # end if
         return sim_matrix
     # end similarity_matrix
 
     # Intersection matrix between conceptors
-    def intersection_matrix(self, return_rank=False, gamma=1):
+    def intersection_matrix(self, return_rank=False, gamma=1, n_workers=1, n_threads=1, tol=1e-14):
         """
-        Union matrix between conceptors
-        :param return_rank: Rank of union
+        Intersection matrix between conceptors, rank or quota of the AND of each unordered pair, on the cached
+        eigendecompositions of the conceptors
+        :param return_rank: Rank of intersection (quota otherwise)
+        :param gamma: Aperture factor applied to each AND
+        :param n_workers: Number of worker processes (1 for this process)
+        :param n_threads: Number of torch threads in each worker
+        :param tol: Tolerance under which singular values are zero
+        :return: Intersection matrix as torch tensor
         """
         # Intersection matrix
         if return_rank:
@@ -271,27 +384,20 @@ class ConceptorSet(NeuralFilter):
             intersection_matrix = torch.zeros(self.count, self.count)
         # end if
 
-        # For each pair
-        for i, i_name in enumerate(self._conceptors.keys()):
-            for j, j_name in enumerate(self._conceptors.keys()):
-                # Compute
-                E = Conceptor.operator_AND(self._conceptors[i_name], self._conceptors[j_name])
-
-                # Change aperture
-                if gamma != 1:
-                    E.PHI(gamma)
-                # end if
-
-                # Compute rank or quota
-                if return_rank:
-                    intersection_matrix[i, j] = rank(E.C)
-                else:
-                    intersection_matrix[i, j] = quota(E.C)
-                # end if
-            # end for
+        # Eigendecompositions computed once, before workers are started
+        conceptors = list(self._conceptors.values())
+        for conceptor in conceptors:
+            conceptor._C_eigen()
         # end for
 
-        return intersection_matrix
+        return _pairwise_matrix(
+            _intersection_pair,
+            conceptors,
+            {'return_rank': return_rank, 'gamma': gamma, 'tol': tol},
+            intersection_matrix,
+            n_workers=n_workers,
+            n_threads=n_threads
+        )
     # end intersection_matrix
 
     # Set conceptor index to use
@@ -314,6 +420,7 @@ class ConceptorSet(NeuralFilter):
         """
         # Empty dict
         self._conceptors = dict()
+        self._clear_unions()
     # end reset
 
     # Add a conceptor to the set
@@ -323,9 +430,23 @@ class ConceptorSet(NeuralFilter):
         :param idx: Name associated with the conceptor
         :param c: Conceptor object
         """
+        # The union can be updated with one OR if it is up to date and c is a new conceptor
+        update_union = idx not in self._conceptors and self._is_cached(self._union_key)
+
         # Add
         self._conceptors[idx] = c
         self.add_trainable(c)
+
+        # Update the union, all "all but i" unions change
+        if update_union:
+            self._union = self._OR(self._union, c, self._union_key[1])
+            self._union_key = (self._members_key(), self._union_key[1])
+        else:
+            self._union = None
+            self._union_key = None
+        # end if
+        self._others = None
+        self._others_key = None
     # end add
 
     # Delete a conceptor from the set
@@ -338,6 +459,7 @@ class ConceptorSet(NeuralFilter):
         # Remove
         self.remove_trainable(self._conceptors[idx])
         del self._conceptors[idx]
+        self._clear_unions()
     # end delete
 
     # Morph conceptors in the set
@@ -378,31 +500,7 @@ class ConceptorSet(NeuralFilter):
         :param x: Reservoir states
         :return: Evidence against
         """
-        # Empty conceptor
-        # Cothers = Conceptor.empty(self._conceptor_dim)
-
-        # OR for all other Conceptor
-        # for k, C in self.conceptors.items():
-        #     if k != conceptor_i:
-        #         Cothers = Conceptor.operator_OR(Cothers, C)
-            # end if
-        # end for
-
-        # Start at 0
-        others = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
-
-        # For each conceptor
-        for kc, C in self._conceptors.items():
-            if kc != conceptor_i:
-                others.OR_(C, tol=tol)
-            # end if
-        # end for
-
-        # NOT others
-        not_others = Conceptor.operator_NOT(others)
-
-        # Tensor dim
-        return Conceptor.evidence(not_others, x)
+        return Conceptor.evidence(self._not_others(conceptor_i, tol), x)
     # end Eneg
 
     # Positive evidence for a conceptor
@@ -431,51 +529,180 @@ class ConceptorSet(NeuralFilter):
     # end E
 
     # Get evidences for each conceptor
-    # TODO: Test
-    def evidences(self, x, based_on='both', average=False):
+    def evidences(self, x, based_on='both', average=False, tol=1e-14):
         """
-        Get evidences for each conceptor
-        :param x: Matrix of points in the reservoir space (T x Nx)
+        Get evidences for each conceptor, as quadratic forms of the stacked conceptor matrices (K x Nx x Nx)
+        against all states at once
+        :param x: Matrix of points in the reservoir space (T x Nx), or batch of them (B x T x Nx)
         :param based_on: both (positive evidence + negative evidence), positive, negative
-        :return: Evidence matrix with evidence for each conceptor (T x conceptors)
+        :param average: Average evidences over time
+        :param tol: Tolerance under which singular values are zero
+        :return: Evidence matrix with evidence for each conceptor (T x conceptors, or B x T x conceptors, without the
+        time dimension if averaged)
         """
-        # A single point in reservoir space
-        if x.ndim == 2:
-            # Time length
-            time_length = x.size(0)
+        if x.ndim not in (2, 3):
+            raise Exception("Waiting for 2-dim or 3-dim tensor, got {} instead".format(x.ndim))
+        # end if
 
-            # Evidence vector
-            evidences_matrix = torch.zeros(time_length, self.count)
+        # Names
+        names = list(self.conceptors.keys())
 
-            # For each conceptor
-            for c_i, k in enumerate(self.conceptors.keys()):
-                # Evidences for this conceptor
-                if based_on == 'both':
-                    evidences_matrix[:, c_i] = self.E(k, x)
-                elif based_on == 'positive':
-                    evidences_matrix[:, c_i] = self.Eplus(k, x)
-                elif based_on == 'negative':
-                    evidences_matrix[:, c_i] = self.Eneg(k, x)
-                else:
-                    raise Exception("Waiting for both, positive or negative for based_on, got {}".format(based_on))
-                # end if
-            # end for
+        # Conceptor matrices for positive and negative evidences
+        if based_on == 'both':
+            Cs = [self.conceptors[k].C for k in names] + [self._not_others(k, tol).C for k in names]
+        elif based_on == 'positive':
+            Cs = [self.conceptors[k].C for k in names]
+        elif based_on == 'negative':
+            Cs = [self._not_others(k, tol).C for k in names]
+        else:
+            raise Exception("Waiting for both, positive or negative for based_on, got {}".format(based_on))
+        # end if
 
-            # Average
-            if average:
-                return torch.mean(evidences_matrix, axis=0)
-            else:
-                return evidences_matrix
-            # end if
-        elif x.ndim == 3:
-            raise Exception("Waiting for 2-dim tensor, got {} instead".format(x.ndim))
-        #end if
+        # x^T C x / x^T x for every matrix in one pass
+        evidences_matrix = torch.einsum('...i,kij,...j->...k', x, torch.stack(Cs).to(x.dtype), x)
+        evidences_matrix = evidences_matrix / torch.sum(x * x, dim=-1, keepdim=True)
+
+        # Total evidence
+        if based_on == 'both':
+            evidences_matrix = (evidences_matrix[..., :len(names)] + evidences_matrix[..., len(names):]) / 2.0
+        # end if
+
+        # Average over time
+        if average:
+            return torch.mean(evidences_matrix, dim=-2)
+        else:
+            return evidences_matrix
+        # end if
     # end evidences
 
     # endregion PUBLIC
 
     # region PRIVATE
 
+    # Members of the set, to check that cached unions are up to date
+    def _members_key(self):
+        """
+        Members of the set, to check that cached unions are up to date
+        :return: List of (name, conceptor matrix, version of the matrix, aperture)
+        """
+        return [(k, c.C, c.C._version, c.aperture) for k, c in self._conceptors.items()]
+    # end _members_key
+
+    # Is a cached union up to date
+    def _is_cached(self, key, tol=None):
+        """
+        Is a cached union up to date (same conceptors, with matrices not changed since)
+        :param key: Members key and tolerance of the cached union
+        :param tol: Tolerance of the request, None for any
+        :return: True/False
+        """
+        if key is None or (tol is not None and key[1] != tol) or len(key[0]) != len(self._conceptors):
+            return False
+        else:
+            return all(
+                k == k_now and C is C_now and version == C_now._version and aperture == aperture_now
+                for (k, C, version, aperture), (k_now, C_now, _, aperture_now) in zip(key[0], self._members_key())
+            )
+        # end if
+    # end _is_cached
+
+    # Clear cached unions
+    def _clear_unions(self):
+        """
+        Clear cached unions
+        """
+        self._union = None
+        self._union_key = None
+        self._others = None
+        self._others_key = None
+    # end _clear_unions
+
+    # OR of all conceptors, cached
+    def _cached_union(self, tol):
+        """
+        OR of all conceptors, cached (without R)
+        :param tol: Tolerance under which singular values are zero
+        :return: OR (Conceptor)
+        """
+        if not self._is_cached(self._union_key, tol):
+            self._union = Conceptor.OR_all(list(self._conceptors.values()), tol=tol, compute_R=False)
+            self._union_key = (self._members_key(), tol)
+        # end if
+        return self._union
+    # end _cached_union
+
+    # OR of all conceptors but each one, cached
+    def _cached_others(self, tol):
+        """
+        OR of all conceptors but each one, cached. Built from prefix and suffix unions, with O(K) ORs for K
+        conceptors.
+        :param tol: Tolerance under which singular values are zero
+        :return: Dictionary name -> OR (Conceptor) of the other conceptors, None if there is no other one
+        """
+        if not self._is_cached(self._others_key, tol):
+            names = list(self._conceptors.keys())
+            n_conceptors = len(names)
+
+            # Unions of the conceptors before and after each one
+            prefix = [None] * (n_conceptors + 1)
+            suffix = [None] * (n_conceptors + 1)
+            for c_i in range(n_conceptors):
+                prefix[c_i + 1] = self._OR(prefix[c_i], self._conceptors[names[c_i]], tol)
+                suffix[n_conceptors - c_i - 1] = self._OR(
+                    suffix[n_conceptors - c_i],
+                    self._conceptors[names[n_conceptors - c_i - 1]],
+                    tol
+                )
+            # end for
+
+            # All but each one
+            self._others = {names[c_i]: self._OR(prefix[c_i], suffix[c_i + 1], tol) for c_i in range(n_conceptors)}
+            self._others_key = (self._members_key(), tol)
+
+            # The prefix of all conceptors is the union
+            if n_conceptors > 0:
+                self._union = prefix[n_conceptors]
+                self._union_key = self._others_key
+            # end if
+        # end if
+        return self._others
+    # end _cached_others
+
+    # NOT of the OR of all other conceptors
+    def _not_others(self, conceptor_i, tol):
+        """
+        NOT of the OR of all other conceptors
+        :param conceptor_i: Index of the conceptor
+        :param tol: Tolerance under which singular values are zero
+        :return: NOT of the others (Conceptor)
+        """
+        # OR for all other Conceptor (prefix and suffix unions, cached)
+        others = self._cached_others(tol)[conceptor_i]
+        if others is None:
+            others = Conceptor(input_dim=self._conceptor_dim, aperture=1, dtype=self._dtype)
+        # end if
+
+        return Conceptor.operator_NOT(others, compute_R=False)
+    # end _not_others
+
+    # OR of two unions, None being empty
+    def _OR(self, A, B, tol):
+        """
+        OR of two unions, None being empty
+        :param A: First union (Conceptor or None)
+        :param B: Second union (Conceptor or None)
+        :param tol: Tolerance under which singular values are zero
+        :return: A OR B (Conceptor or None)
+        """
+        if A is None:
+            return B
+        elif B is None:
+            return A
+        else:
+            return Conceptor.operator_OR(A, B, tol=tol, compute_R=False)
+        # end if
+    # end _OR
+
     # endregion PRIVATE
 
     # region OVERRIDE
@@ -552,6 +779,7 @@ class ConceptorSet(NeuralFilter):
         Set item
         """
         self._conceptors[key] = value
+        self._clear_unions()
     # end __setitem__
 
     # endregion OVERRIDE
@@ -30,12 +30,13 @@ import torch
 from torch.autograd import Variable
 from .IncSPESNCell import IncSPESNCell
 from .Conceptor import Conceptor
+from echotorch.nn.utils.LazyDiagnostics import LazyDiagnostics
 from echotorch.utils import nrmse
 from echotorch.utils import quota, rank
 
 
 # Self-Predicting ESN Cell with incremental-forgetting learning
-class IncForgSPESNCell(IncSPESNCell):
+class IncForgSPESNCell(IncSPESNCell, LazyDiagnostics):
     """
     Self-Predicting ESN Cell with incremental-forgetting learning
     """
@@ -71,21 +72,8 @@ class IncForgSPESNCell(IncSPESNCell):
         self._forgetting_version = forgetting_version
         self._forgetting_threshold = forgetting_threshold
 
-        # Debug info
-        self.dinc_nrmse = -1
-        self.dup_nrmse = -1
-        self.dinc_magnitude = 0
-        self.dup_magnitude = 0
-        self.d_magnitude = 0
-        self.d_gradient = 0
-        self.d_rank = 0
-        self.dinc_rank = 0
-        self.dup_rank = 0
-        self.e_rank = 0
-        self.d_SVs = None
-        self.dinc_SVs = None
-        self.dup_SVs = None
-        self.e_SVs = None
+        # Diagnostics of the last load, computed when read
+        self._set_diagnostics_inputs(None)
 
         # Spaces used for loading
         self.C = None
@@ -118,6 +106,158 @@ class IncForgSPESNCell(IncSPESNCell):
         )
     # end __init__
 
+    # region PROPERTIES
+
+    # NRMSE of D + Dinc on the last pattern
+    @property
+    def dinc_nrmse(self):
+        """
+        NRMSE of D + Dinc on the last pattern
+        :return: NRMSE, -1 before any load
+        """
+        return self._diagnostic(
+            'dinc_nrmse',
+            -1,
+            lambda d: nrmse(torch.mm(self._D_before_load(d) + self.Dinc, d['X_old'].t()).t(), d['win_u'])
+        )
+    # end dinc_nrmse
+
+    # NRMSE of D + Dup on the last pattern
+    @property
+    def dup_nrmse(self):
+        """
+        NRMSE of D + Dup on the last pattern
+        :return: NRMSE, -1 before any load
+        """
+        return self._diagnostic(
+            'dup_nrmse',
+            -1,
+            lambda d: nrmse(torch.mm(self._D_before_load(d) + self.Dup, d['X_old'].t()).t(), d['win_u'])
+        )
+    # end dup_nrmse
+
+    # Magnitude of Dinc
+    @property
+    def dinc_magnitude(self):
+        """
+        Magnitude of Dinc
+        :return: Frobenius norm
+        """
+        return self._diagnostic('dinc_magnitude', 0, lambda d: torch.norm(self.Dinc))
+    # end dinc_magnitude
+
+    # Magnitude of Dup
+    @property
+    def dup_magnitude(self):
+        """
+        Magnitude of Dup
+        :return: Frobenius norm
+        """
+        return self._diagnostic('dup_magnitude', 0, lambda d: torch.norm(self.Dup))
+    # end dup_magnitude
+
+    # Magnitude of D
+    @property
+    def d_magnitude(self):
+        """
+        Magnitude of D
+        :return: Frobenius norm
+        """
+        return self._diagnostic('d_magnitude', 0, lambda d: torch.norm(self.D))
+    # end d_magnitude
+
+    # Change of D's magnitude during the last load
+    @property
+    def d_gradient(self):
+        """
+        Change of D's magnitude during the last load
+        :return: Difference of Frobenius norms
+        """
+        return self._diagnostic('d_gradient', 0, lambda d: torch.norm(self.D) - torch.norm(self._D_before_load(d)))
+    # end d_gradient
+
+    # Rank of D
+    @property
+    def d_rank(self):
+        """
+        Rank of D
+        :return: Rank
+        """
+        return self._diagnostic('d_rank', 0, lambda d: rank(self.D))
+    # end d_rank
+
+    # Rank of Dinc
+    @property
+    def dinc_rank(self):
+        """
+        Rank of Dinc
+        :return: Rank
+        """
+        return self._diagnostic('dinc_rank', 0, lambda d: rank(self.Dinc))
+    # end dinc_rank
+
+    # Rank of Dup
+    @property
+    def dup_rank(self):
+        """
+        Rank of Dup
+        :return: Rank
+        """
+        return self._diagnostic('dup_rank', 0, lambda d: rank(self.Dup))
+    # end dup_rank
+
+    # Rank of the conflict zone of the last pattern
+    @property
+    def e_rank(self):
+        """
+        Rank of the conflict zone of the last pattern
+        :return: Rank
+        """
+        return self._diagnostic('e_rank', 0, lambda d: rank(self.E.C))
+    # end e_rank
+
+    # Singular values of D
+    @property
+    def d_SVs(self):
+        """
+        Singular values of D
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('d_SVs', None, lambda d: torch.linalg.svdvals(self.D))
+    # end d_SVs
+
+    # Singular values of Dinc
+    @property
+    def dinc_SVs(self):
+        """
+        Singular values of Dinc
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('dinc_SVs', None, lambda d: torch.linalg.svdvals(self.Dinc))
+    # end dinc_SVs
+
+    # Singular values of Dup
+    @property
+    def dup_SVs(self):
+        """
+        Singular values of Dup
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('dup_SVs', None, lambda d: torch.linalg.svdvals(self.Dup))
+    # end dup_SVs
+
+    # Singular values of the conflict zone of the last pattern
+    @property
+    def e_SVs(self):
+        """
+        Singular values of the conflict zone of the last pattern
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('e_SVs', None, lambda d: torch.linalg.svdvals(self.E.C))
+    # end e_SVs
+
+    # endregion PROPERTIES
+
     # region PUBLIC
 
     # Set aperture
@@ -132,6 +272,16 @@ class IncForgSPESNCell(IncSPESNCell):
 
     # region PRIVATE
 
+    # D as it was before the last load
+    def _D_before_load(self, diagnostics_inputs):
+        """
+        D as it was before the last load, i.e. the current D minus the matrix the load added to it
+        :param diagnostics_inputs: Inputs of the last load
+        :return: D before the last load
+        """
+        return self.D - diagnostics_inputs['D_added_scale'] * diagnostics_inputs['D_added']
+    # end _D_before_load
+
     # Compute update matrix (Dup)
     def _compute_update(self, X_old, Y, E, ridge_param):
         """
@@ -155,46 +305,52 @@ class IncForgSPESNCell(IncSPESNCell):
         # Debug
         self._call_debug_point("S_old{}".format(self._n_samples), S_old, "IncForgSPESNCell", "_compute_update")
 
-        # Targets
-        if self._averaged:
-            sTd = torch.mm(S_old.t(), Y) / learn_length
+        # Low-rank update (Woodbury) or full N x N inverse
+        if self._w_learning_algo == "woodbury":
+            ridge = ridge_param * learn_length if self._averaged else ridge_param
+            return self._low_rank_ridge("S_old", S_old, Y, ridge, "IncForgSPESNCell", "_compute_update").t()
         else:
-            sTd = torch.mm(S_old.t(), Y)
-        # end if
+            # Targets
+            if self._averaged:
+                sTd = torch.mm(S_old.t(), Y) / learn_length
+            else:
+                sTd = torch.mm(S_old.t(), Y)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTd{}".format(self._n_samples), sTd, "IncForgSPESNCell", "_compute_update")
+            # Debug
+            self._call_debug_point("sTd{}".format(self._n_samples), sTd, "IncForgSPESNCell", "_compute_update")
 
-        # sTs
-        if self._averaged:
-            sTs = torch.mm(S_old.t(), S_old) / learn_length
-        else:
-            sTs = torch.mm(S_old.t(), S_old)
-        # end if
+            # sTs
+            if self._averaged:
+                sTs = torch.mm(S_old.t(), S_old) / learn_length
+            else:
+                sTs = torch.mm(S_old.t(), S_old)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncForgSPESNCell", "_compute_update")
+            # Debug
+            self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncForgSPESNCell", "_compute_update")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
+            # Ridge sTs
+            ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
 
-        # Debug
-        self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgSPESNCell", "_compute_update")
+            # Debug
+            self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgSPESNCell", "_compute_update")
 
-        # Inverse / pinverse
-        if self._w_learning_algo == "inv":
-            inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgSPESNCell", "_compute_update")
-        elif self._w_learning_algo == "pinv":
-            inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncForgSPESNCell", "_compute_update")
-        else:
-            raise Exception("Unknown learning method {}".format(self._learning_algo))
-        # end if
+            # Inverse / pinverse
+            if self._w_learning_algo == "inv":
+                inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgSPESNCell", "_compute_update")
+            elif self._w_learning_algo == "pinv":
+                inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncForgSPESNCell", "_compute_update")
+            else:
+                raise Exception("Unknown learning method {}".format(self._learning_algo))
+            # end if
 
-        # Debug
-        self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncForgSPESNCell", "_compute_update")
+            # Debug
+            self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncForgSPESNCell", "_compute_update")
 
-        # Compute the update for matrix D
-        return torch.mm(inv_sTs, sTd).t()
+            # Compute the update for matrix D
+            return torch.mm(inv_sTs, sTd).t()
+        # end if
     # end _compute_update
 
     # Compute conceptor of the current pattern
@@ -245,9 +401,9 @@ class IncForgSPESNCell(IncSPESNCell):
         :param C: Conceptor
         """
         if increment:
-            self.A = Conceptor.operator_OR(self.A, C)
+            self.A = Conceptor.operator_OR(self.A, C, compute_R=False)
         else:
-            self.A = Conceptor.operator_OR(M, C)
+            self.A = Conceptor.operator_OR(M, C, compute_R=False)
         # end if
     # end _update_A
 
@@ -257,7 +413,7 @@ class IncForgSPESNCell(IncSPESNCell):
         Compute F (space not occupied by any pattern)
         """
         if not self.A.is_null():
-            return Conceptor.operator_NOT(self.A).C
+            return Conceptor.operator_NOT(self.A, compute_R=False).C
         else:
             return Conceptor.identity(self.output_dim, dtype=self._dtype).C
         # end if
@@ -269,7 +425,7 @@ class IncForgSPESNCell(IncSPESNCell):
         Compute M (conflict free zone)
         :param C: Conceptor of current pattern.
         """
-        return Conceptor.operator_AND(self.A, Conceptor.operator_NOT(C))
+        return Conceptor.operator_AND(self.A, Conceptor.operator_NOT(C, compute_R=False), compute_R=False)
     # end _compute_M
 
     # Compute E (conflict zone)
@@ -279,7 +435,7 @@ class IncForgSPESNCell(IncSPESNCell):
         :param M: conflict free zone.
         """
         if not M.is_null():
-            return Conceptor.operator_NOT(M)
+            return Conceptor.operator_NOT(M, compute_R=False)
         else:
             return Conceptor.identity(self.output_dim, dtype=self._dtype)
         # end if
@@ -303,10 +459,6 @@ class IncForgSPESNCell(IncSPESNCell):
         self.M = self._compute_M(self.C)
         self.E = self._compute_E(self.M)
 
-        # DEBUG E
-        self.e_rank = rank(self.E.C)
-        _, self.e_SVs, _ = torch.svd(self.E.C)
-
         # Truth for comparison and test (Win * U)
         win_u = torch.mm(self.w_in, U.t()).t()
 
@@ -317,17 +469,11 @@ class IncForgSPESNCell(IncSPESNCell):
         # Compute the increment for matrix D
         # with adaptive ridge param (*1000 if free zone F is too small)
         if quota(self.F) < 1e-1:
-            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc * 1000, F=self._compute_F_matrix())
+            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc * 1000, F=self.F)
         else:
-            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc, F=self._compute_F_matrix())
+            self.Dinc = self._compute_increment(X_old, Yinc, self._ridge_param_inc, F=self.F)
         # end if
 
-        # DEBUG Dinc
-        self.dinc_nrmse = nrmse(torch.mm(self.D + self.Dinc, X_old.t()).t(), win_u)
-        self.dinc_magnitude = torch.norm(self.Dinc)
-        self.dinc_rank = rank(self.Dinc)
-        _, self.dinc_SVs, _ = torch.svd(self.Dinc)
-
         # Targets for the update matrix Dup(t+1)
         # What cannot be predicted by the current matrix D(t)
         # Y = Win * U - D * X(t-1)
@@ -342,35 +488,24 @@ class IncForgSPESNCell(IncSPESNCell):
         # free zone F (E+F)
         self.Dup = self._compute_update(X_old, Y, self.E, self._ridge_param_up)
 
-        # DEBUG Dup
-        self.dup_nrmse = nrmse(torch.mm(self.D + self.Dup, X_old.t()).t(), win_u)
-        # self.dup_nrmse = nrmse(torch.mm(torch.mm(self.M.C, self.D) + (1.0 - self._lambda) * torch.mm(self.E.C, self.D) + self._lambda * self.Dup, X_old.t()).t(), win_u)
-        self.dup_magnitude = torch.norm(self.Dup)
-        self.dup_rank = rank(self.Dup)
-        _, self.dup_SVs, _ = torch.svd(self.Dup)
-
         # Debug
         self._call_debug_point("Dinc{}".format(self._n_samples), self.Dinc, "IncSPESNCell", "_update_D_loading")
         self._call_debug_point("Dup{}".format(self._n_samples), self.Dup, "IncSPESNCell", "_update_D_loading")
 
         # We erase information in D with Dup if above a threshold
         if self.A.quota > self._forgetting_threshold:
-            # Gradient
-            self.d_gradient = torch.norm(self.D + self._lambda * self.Dup) - torch.norm(self.D)
-            # self.d_gradient = torch.norm(torch.mm(self.M.C, self.D) + (1.0 - self._lambda) * torch.mm(self.E.C, self.D) + self._lambda * self.Dup) - torch.norm(self.D)
             print("update")
             # D = D + Dup
             self.D += self._lambda * self.Dup
+            D_added, D_added_scale = self.Dup, self._lambda
             # self.D = torch.mm(self.M.C, self.D) + (1.0 - self._lambda) * torch.mm(self.E.C, self.D) + self._lambda * self.Dup
 
             # Update A
             self._update_A(self.M, self.C)
         else:
-            # Gradient
-            self.d_gradient = torch.norm(self.D + self.Dinc) - torch.norm(self.D)
-
             # D = D + Dinc
             self.D += self.Dinc
+            D_added, D_added_scale = self.Dinc, 1.0
             # self.D += self._lambda * self.Dup
 
             # Update A
@@ -378,10 +513,10 @@ class IncForgSPESNCell(IncSPESNCell):
             # self._update_A(self.M, C)
         # end if
 
-        # Save D's magnitude and rank and SV
-        self.d_magnitude = torch.norm(self.D)
-        self.d_rank = rank(self.D)
-        _, self.d_SVs, _ = torch.svd(self.D)
+        # Diagnostics are computed from these when read, D before the load is D minus what was added
+        self._set_diagnostics_inputs(
+            {'X_old': X_old, 'win_u': win_u, 'D_added': D_added, 'D_added_scale': D_added_scale}
+        )
 
         # Debug
         self._call_debug_point("D{}".format(self._n_samples), self.D, "IncSPESNCell", "_update_D_loading")
@@ -411,13 +546,13 @@ class IncForgSPESNCell(IncSPESNCell):
 
         # Increment D
         if self._forgetting_version == IncForgSPESNCell.FORGETTING_A:
-            if self._conceptors.A().quota + C.quota > self._forgetting_threshold:
+            if self._conceptors.A(compute_R=False).quota + C.quota > self._forgetting_threshold:
                 self.R = (1.0 - self._lambda) * self.R + self._lambda * self.Rup + self.Rinc
             else:
                 self.R += self.Rinc
             # end if
         else:
-            if self._conceptors.A().quota + C.quota > self._forgetting_threshold:
+            if self._conceptors.A(compute_R=False).quota + C.quota > self._forgetting_threshold:
                 self.R = torch.mm(NC.C, self.R.t()).t() + (1.0 - self._lambda) * torch.mm(C.C, self.R.t()).t() + self._lambda * self.Rup + self.Rinc
             else:
                 self.R = torch.mm(NC.C, self.R.t()).t() + torch.mm(C.C, self.R.t()).t() + self.Rinc
@@ -102,46 +102,52 @@ class IncSPESNCell(SPESNCell):
         # Debug
         self._call_debug_point("Sold{}".format(self._n_samples), S_old, "IncSPESNCell", "_compute_increment")
 
-        # Targets
-        if self._averaged:
-            sTd = torch.mm(S_old.t(), Y) / learn_length
+        # Low-rank update (Woodbury) or full N x N inverse
+        if self._w_learning_algo == "woodbury":
+            ridge = ridge_param * learn_length if self._averaged else ridge_param
+            return self._low_rank_ridge("S_old", S_old, Y, ridge, "IncSPESNCell", "_compute_increment").t()
         else:
-            sTd = torch.mm(S_old.t(), Y)
-        # end if
+            # Targets
+            if self._averaged:
+                sTd = torch.mm(S_old.t(), Y) / learn_length
+            else:
+                sTd = torch.mm(S_old.t(), Y)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTd{}".format(self._n_samples), sTd, "IncSPESNCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("sTd{}".format(self._n_samples), sTd, "IncSPESNCell", "_compute_increment")
 
-        # sTs
-        if self._averaged:
-            sTs = torch.mm(S_old.t(), S_old) / learn_length
-        else:
-            sTs = torch.mm(S_old.t(), S_old)
-        # end if
+            # sTs
+            if self._averaged:
+                sTs = torch.mm(S_old.t(), S_old) / learn_length
+            else:
+                sTs = torch.mm(S_old.t(), S_old)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncSPESNCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncSPESNCell", "_compute_increment")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
+            # Ridge sTs
+            ridge_sTs = sTs + ridge_param * torch.eye(self._output_dim)
 
-        # Debug
-        self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncSPESNCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncSPESNCell", "_compute_increment")
 
-        # Inverse / pinverse
-        if self._w_learning_algo == "inv":
-            inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncSPESNCell", "_compute_increment")
-        elif self._w_learning_algo == "pinv":
-            inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncSPESNCell", "_compute_increment")
-        else:
-            raise Exception("Unknown learning method {}".format(self._learning_algo))
-        # end if
+            # Inverse / pinverse
+            if self._w_learning_algo == "inv":
+                inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncSPESNCell", "_compute_increment")
+            elif self._w_learning_algo == "pinv":
+                inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncSPESNCell", "_compute_increment")
+            else:
+                raise Exception("Unknown learning method {}".format(self._learning_algo))
+            # end if
 
-        # Debug
-        self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncSPESNCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncSPESNCell", "_compute_increment")
 
-        # Compute the increment for matrix D
-        return torch.mm(inv_sTs, sTd).t()
+            # Compute the increment for matrix D
+            return torch.mm(inv_sTs, sTd).t()
+        # end if
     # end _compute_increment
 
     # Update input simulation matrix D
@@ -254,9 +260,9 @@ class IncSPESNCell(SPESNCell):
         if not self.training:
             # Loading type
             if self._loading_method == SPESNCell.INPUTS_SIMULATION:
-                return self.D.mv(self.hidden)
+                return self.hidden.mm(self.D.t())
             elif self._loading_method == SPESNCell.INPUTS_RECREATION:
-                return self.w_in.mv(self.R.mv(self.hidden))
+                return self.hidden.mm(self.R.t()).mm(self.w_in.t())
             else:
                 raise Exception("Unknown loading method {} for incremental loading".format(self._loading_method))
             # end if
@@ -265,6 +271,23 @@ class IncSPESNCell(SPESNCell):
         # end if
     # end _input_layer
 
+    # Input pre-projection for a whole sequence
+    def _input_projection(self, u):
+        """
+        Input pre-projection for a whole sequence
+        :param u: Inputs (batch size x time length x input dim)
+        :return: Projected inputs, or None if the inputs are simulated/recreated from the states or the reservoir layer
+        is overridden
+        """
+        if self._has_custom_reservoir_layer():
+            return None
+        elif self.training:
+            return self._project_inputs(u)
+        else:
+            return None
+        # end if
+    # end _input_projection
+
     # Hook which gets executed after the update state equation for every sample.
     def _post_update_hook(self, states, inputs, forward_i, sample_i):
         """
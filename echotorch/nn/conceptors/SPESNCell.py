@@ -28,6 +28,7 @@ Created on 26 January 2018
 import torch
 from torch.autograd import Variable
 from echotorch.nn.reservoir.ESNCell import ESNCell
+from echotorch.nn.utils.SufficientStatistics import SufficientStatistics
 import matplotlib.pyplot as plt
 
 
@@ -296,6 +297,30 @@ class SPESNCell(ESNCell):
         self.train(True)
     # end reset
 
+    # Export sufficient statistics
+    def statistics(self):
+        """
+        Export sufficient statistics (xTx, xTy and number of samples), which can be saved, summed over workers
+        and loaded back with load_statistics() before finalize()
+        :return: SufficientStatistics
+        """
+        return SufficientStatistics(
+            {'xTx': self.xTx, 'xTy': self.xTy},
+            {'n_samples': self._n_samples}
+        )
+    # end statistics
+
+    # Load sufficient statistics
+    def load_statistics(self, statistics):
+        """
+        Load sufficient statistics in place of the accumulated ones
+        :param statistics: SufficientStatistics exported by statistics() (or their sum)
+        """
+        self.xTx.data.copy_(statistics['xTx'])
+        self.xTy.data.copy_(statistics['xTy'])
+        self._n_samples = statistics['n_samples']
+    # end load_statistics
+
     # Finalize internal training
     def finalize(self):
         """
@@ -328,9 +353,9 @@ class SPESNCell(ESNCell):
             if self._loading_method == SPESNCell.W_LOADING:
                 return super(SPESNCell, self)._input_layer(ut)
             elif self._loading_method == SPESNCell.INPUTS_SIMULATION:
-                return self.D.mv(self.hidden)
+                return self.hidden.mm(self.D.t())
             elif self._loading_method == SPESNCell.INPUTS_RECREATION:
-                return self.w_in.mv(self.R.mv(self.hidden))
+                return self.hidden.mm(self.R.t()).mm(self.w_in.t())
             else:
                 raise Exception("Unknown loading method {}".format(self._loading_method))
             # end if
@@ -339,6 +364,23 @@ class SPESNCell(ESNCell):
         # end if
     # end _input_layer
 
+    # Input pre-projection for a whole sequence
+    def _input_projection(self, u):
+        """
+        Input pre-projection for a whole sequence
+        :param u: Inputs (batch size x time length x input dim)
+        :return: Projected inputs, or None if the inputs are simulated/recreated from the states or the reservoir layer
+        is overridden
+        """
+        if self._has_custom_reservoir_layer():
+            return None
+        elif self.training or self._loading_method == SPESNCell.W_LOADING:
+            return self._project_inputs(u)
+        else:
+            return None
+        # end if
+    # end _input_projection
+
     # Hook which gets executed before the update state equation for every sample.
     def _pre_update_hook(self, inputs, forward_i, sample_i):
         """
@@ -352,18 +394,6 @@ class SPESNCell(ESNCell):
         return inputs
     # end _pre_update_hook
 
-    # Hook which gets executed before the update state equation for every timesteps.
-    def _pre_step_update_hook(self, inputs, forward_i, sample_i, t):
-        """
-        Hook which gets executed before the update equation for every timesteps
-        :param inputs: Input signal.
-        :param forward_i: Index of forward call
-        :param sample_i: Position of the sample in the batch.
-        :param t: Timestep.
-        """
-        return inputs
-    # end _pre_step_update_hook
-
     # Hook which gets executed after the update state equation for every sample.
     def _post_update_hook(self, states, inputs, forward_i, sample_i):
         """
@@ -390,19 +420,6 @@ class SPESNCell(ESNCell):
         return states
     # end _post_update_hook
 
-    # Hook which gets executed after the update state equation for every timesteps.
-    def _post_step_update_hook(self, states, inputs, forward_i, sample_i, t):
-        """
-        Hook which gets executed after the update equation for every timesteps
-        :param states: Reservoir's states.
-        :param inputs: Input signal.
-        :param forward_i: Index of forward call
-        :param sample_i: Position of the sample in the batch
-        :param t: Timestep
-        """
-        return states
-    # end _post_step_update_hook
-
     # endregion OVERRIDE
 
     # region TARGETS
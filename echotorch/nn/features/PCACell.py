@@ -29,6 +29,7 @@ import torch.sparse
 import torch
 import torch.nn as nn
 from torch.autograd import Variable
+from ..utils.SufficientStatistics import SufficientStatistics
 
 
 # Filter the input data through the most significatives principal components.
@@ -102,6 +103,30 @@ class PCACell(nn.Module):
         self.train(True)
     # end reset
 
+    # Export sufficient statistics
+    def statistics(self):
+        """
+        Export sufficient statistics (xTx, xTx_avg and number of observations), which can be saved, summed over workers
+        and loaded back with load_statistics() before finalize()
+        :return: SufficientStatistics
+        """
+        return SufficientStatistics(
+            {'xTx': self.xTx, 'xTx_avg': self.xTx_avg},
+            {'tlen': self.tlen}
+        )
+    # end statistics
+
+    # Load sufficient statistics
+    def load_statistics(self, statistics):
+        """
+        Load sufficient statistics in place of the accumulated ones
+        :param statistics: SufficientStatistics exported by statistics() (or their sum)
+        """
+        self.xTx.data.copy_(statistics['xTx'])
+        self.xTx_avg.data.copy_(statistics['xTx_avg'])
+        self.tlen = statistics['tlen']
+    # end load_statistics
+
     # Forward
     def forward(self, x, y=None):
         """
@@ -21,6 +21,11 @@
 
 # Imports
 from .losses import CSTLoss
+from .quantization import dequantize, quantize_per_channel, quantized_linear
+from .reservoir import esn_recurrence, ensemble_recurrence, structured_esn_recurrence
 
 # ALL
-__all__ = ['CSTLoss']
+__all__ = [
+    'CSTLoss', 'dequantize', 'esn_recurrence', 'ensemble_recurrence', 'quantize_per_channel', 'quantized_linear',
+    'structured_esn_recurrence'
+]
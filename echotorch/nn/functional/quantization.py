@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/functional/quantization.py
+# Description : Per-channel weight quantization and dequantize-on-the-fly products.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+
+
+# Quantization modes
+QUANTIZATION_MODES = ('int8', 'float16')
+
+
+# Quantize a weight matrix per output channel
+def quantize_per_channel(w, mode='int8'):
+    """
+    Quantize a weight matrix per output channel (row).
+    int8 is symmetric, w ~ q * scale with q in [-127, 127] and one scale per row. float16 keeps the values as
+    half-precision floats and has no scale.
+    :param w: Weight matrix (output dim x input dim)
+    :param mode: Quantization mode (int8 or float16)
+    :return: Quantized values (int8 or float16), scales (output dim, float32) or None for float16
+    """
+    if mode == 'int8':
+        scales = w.abs().amax(dim=1).to(torch.float32) / 127.0
+        scales[scales == 0] = 1.0
+        values = torch.round(w / scales.to(w.dtype).unsqueeze(1)).clamp(-127, 127).to(torch.int8)
+        return values, scales
+    elif mode == 'float16':
+        return w.to(torch.float16), None
+    else:
+        raise Exception("Unknown quantization mode {}, expected one of {}".format(mode, QUANTIZATION_MODES))
+    # end if
+# end quantize_per_channel
+
+
+# Dequantize a weight matrix
+def dequantize(values, scales, dtype=torch.float32):
+    """
+    Dequantize a weight matrix
+    :param values: Quantized values (output dim x input dim)
+    :param scales: Per-channel scales (output dim), or None
+    :param dtype: Data type of the result
+    :return: Weight matrix (output dim x input dim)
+    """
+    w = values.to(dtype)
+    if scales is not None:
+        w = w * scales.to(dtype).unsqueeze(1)
+    # end if
+    return w
+# end dequantize
+
+
+# Product with a quantized weight matrix
+def quantized_linear(x, values, scales, bias=None):
+    """
+    Product with a quantized weight matrix, x * W^T (+ bias), dequantized on the fly.
+    The per-channel scales are applied to the output columns after the product, so the weights are only cast.
+    :param x: Inputs (... x input dim)
+    :param values: Quantized values (output dim x input dim)
+    :param scales: Per-channel scales (output dim), or None
+    :param bias: Bias added to the outputs (output dim), or None
+    :return: Outputs (... x output dim) in the data type of x
+    """
+    outputs = torch.matmul(x, values.to(x.dtype).t())
+    if scales is not None:
+        outputs = outputs * scales.to(x.dtype)
+    # end if
+    if bias is not None:
+        outputs = outputs + bias
+    # end if
+    return outputs
+# end quantized_linear
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/functional/reservoir.py
+# Description : Fused reservoir recurrences.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+from typing import Optional, Tuple
+
+
+# Storage for the states after the washout
+@torch.jit.script
+def _washout_storage(inputs_win: torch.Tensor, washout: int, out: Optional[torch.Tensor]):
+    """
+    Storage for the states after the washout
+    :param inputs_win: Projected inputs (... x time length x reservoir size)
+    :param washout: Number of first timesteps not stored
+    :param out: Caller-provided storage, or None to allocate it
+    :return: Storage (... x time length - washout x reservoir size)
+    """
+    if out is not None:
+        return out
+    # end if
+    size = inputs_win.size()
+    size[-2] = max(size[-2] - washout, 0)
+    return inputs_win.new_empty(size)
+# end _washout_storage
+
+
+# Fused leaky tanh recurrence over a whole sequence
+@torch.jit.script
+def esn_recurrence(inputs_win: torch.Tensor, w: torch.Tensor, x: torch.Tensor, leaky_rate: float = 1.0,
+                   washout: int = 0, out: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Fused leaky tanh recurrence over a whole sequence,
+    x(t) = (1 - a) * x(t-1) + a * tanh(Win u(t) + Wbias + W x(t-1))
+    :param inputs_win: Projected inputs with bias (batch size x time length x reservoir size)
+    :param w: Reservoir matrix W (reservoir size x reservoir size), dense
+    :param x: Initial states (batch size x reservoir size)
+    :param leaky_rate: Leaky rate a (1.0 for a standard ESN)
+    :param washout: Number of first states not stored
+    :param out: Storage for the states after the washout (batch size x time length - washout x reservoir size), or
+    None to allocate it
+    :return: States after the washout (batch size x time length - washout x reservoir size), last states
+    """
+    outputs = _washout_storage(inputs_win, washout, out)
+    w_t = w.t()
+    for t in range(inputs_win.size(1)):
+        x_new = torch.tanh(torch.addmm(inputs_win[:, t], x, w_t))
+        if leaky_rate != 1.0:
+            x = torch.add(x * (1.0 - leaky_rate), x_new, alpha=leaky_rate)
+        else:
+            x = x_new
+        # end if
+        if t >= washout:
+            outputs[:, t - washout] = x
+        # end if
+    # end for
+    return outputs, x
+# end esn_recurrence
+
+
+# Fused leaky tanh recurrence of an ensemble of reservoirs
+@torch.jit.script
+def ensemble_recurrence(inputs_win: torch.Tensor, w: torch.Tensor, x: torch.Tensor, leaky_rates: torch.Tensor,
+                        washout: int = 0, out: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Fused leaky tanh recurrence of K reservoirs over a whole sequence, one batched product per timestep,
+    x_k(t) = (1 - a_k) * x_k(t-1) + a_k * tanh(Win_k u(t) + Wbias_k + W_k x_k(t-1))
+    :param inputs_win: Projected inputs with bias (K x batch size x time length x reservoir size)
+    :param w: Reservoir matrices (K x reservoir size x reservoir size)
+    :param x: Initial states (K x batch size x reservoir size)
+    :param leaky_rates: Leaky rates (K)
+    :param washout: Number of first states not stored
+    :param out: Storage for the states after the washout, or None to allocate it
+    :return: States after the washout (K x batch size x time length - washout x reservoir size), last states
+    """
+    outputs = _washout_storage(inputs_win, washout, out)
+    w_t = w.transpose(1, 2)
+    leaky_rates = leaky_rates.view(-1, 1, 1)
+    for t in range(inputs_win.size(2)):
+        x_new = torch.tanh(torch.baddbmm(inputs_win[:, :, t], x, w_t))
+        x = x + leaky_rates * (x_new - x)
+        if t >= washout:
+            outputs[:, :, t - washout] = x
+        # end if
+    # end for
+    return outputs, x
+# end ensemble_recurrence
+
+
+# Fused leaky tanh recurrence with a structured reservoir matrix
+@torch.jit.script
+def structured_esn_recurrence(inputs_win: torch.Tensor, w_index: torch.Tensor, w_values: torch.Tensor, x: torch.Tensor,
+                              leaky_rate: float = 1.0, washout: int = 0,
+                              out: Optional[torch.Tensor] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Fused leaky tanh recurrence over a whole sequence, with a reservoir matrix given by its non-zero weights in each
+    row, W x = sum_j w_values[j] * x[w_index[j]], in O(N) per timestep.
+    :param inputs_win: Projected inputs with bias (batch size x time length x reservoir size)
+    :param w_index: Column of the j-th weight of each row (weights per row x reservoir size)
+    :param w_values: Value of the j-th weight of each row (weights per row x reservoir size)
+    :param x: Initial states (batch size x reservoir size)
+    :param leaky_rate: Leaky rate (1.0 for a standard ESN)
+    :param washout: Number of first states not stored
+    :param out: Storage for the states after the washout, or None to allocate it
+    :return: States after the washout (batch size x time length - washout x reservoir size), last states
+    """
+    outputs = _washout_storage(inputs_win, washout, out)
+    n_weights, n_units = w_index.size(0), w_index.size(1)
+    flat_index = w_index.reshape(-1)
+    for t in range(inputs_win.size(1)):
+        x_w = (x.index_select(1, flat_index).view(-1, n_weights, n_units) * w_values).sum(1)
+        x_new = torch.tanh(inputs_win[:, t] + x_w)
+        if leaky_rate != 1.0:
+            x = torch.add(x * (1.0 - leaky_rate), x_new, alpha=leaky_rate)
+        else:
+            x = x_new
+        # end if
+        if t >= washout:
+            outputs[:, t - washout] = x
+        # end if
+    # end for
+    return outputs, x
+# end structured_esn_recurrence
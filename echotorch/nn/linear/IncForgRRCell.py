@@ -32,11 +32,12 @@ from torch.autograd import Variable
 # EchoTorch imports
 import echotorch.nn.conceptors.Conceptor as Conceptor
 from echotorch.nn.linear.IncRRCell import IncRRCell
+from echotorch.nn.utils.LazyDiagnostics import LazyDiagnostics
 from echotorch.utils import nrmse, quota, rank
 
 
 # Incremental Ridge Regression node
-class IncForgRRCell(IncRRCell):
+class IncForgRRCell(IncRRCell, LazyDiagnostics):
     """
     Incremental Ridge Regression node
     """
@@ -58,7 +59,7 @@ class IncForgRRCell(IncRRCell):
         :param conceptors: ConceptorSet object of conceptors used to describe space.
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv) or low-rank Woodbury update (woodbury)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param averaged: Covariance matrix divided by the number of samples ?
         :param debug: Debug mode
@@ -79,30 +80,162 @@ class IncForgRRCell(IncRRCell):
         self._forgetting_version = forgetting_version
         self._forgetting_threshold = forgetting_threshold
 
-        # Debug
-        self.w_out_inc_nrmse = -1
-        self.w_out_up_nrmse = -1
-        self.w_out_inc_magnitude = 0
-        self.w_out_up_magnitude = 0
-        self.w_out_magnitude = 0
-        self.w_out_gradient = 0
-        self.w_out_inc_rank = 0
-        self.w_out_up_rank = 0
-        self.w_out_rank = 0
-        self.e_rank = 0
-        self.w_out_SVs = None
-        self.w_out_inc_SVs = None
-        self.w_out_up_SVs = None
+        # Diagnostics of the last load, computed when read
+        self._set_diagnostics_inputs(None)
 
         # Space used by all patterns
         self.C = None
-        self.A = Conceptor.empty(self.output_dim)
+        self.A = Conceptor.empty(self.input_dim, dtype=self._dtype)
 
         # Wout matrix, update, increment and new
         self.register_buffer('w_out_up', Variable(torch.zeros(1, self.input_dim, dtype=self.dtype), requires_grad=False))
         self.register_buffer('w_out_new', Variable(torch.zeros(1, self.input_dim, dtype=self.dtype), requires_grad=False))
     # end __init__
 
+    # region PROPERTIES
+
+    # NRMSE of Wout + Wout_inc on the last pattern
+    @property
+    def w_out_inc_nrmse(self):
+        """
+        NRMSE of Wout + Wout_inc on the last pattern
+        :return: NRMSE, -1 before any load
+        """
+        return self._diagnostic(
+            'w_out_inc_nrmse',
+            -1,
+            lambda d: nrmse(torch.mm(self._w_out_before_load(d) + self.w_out_inc, d['X'].t()).t(), d['Y'])
+        )
+    # end w_out_inc_nrmse
+
+    # NRMSE of Wout + Wout_up on the last pattern
+    @property
+    def w_out_up_nrmse(self):
+        """
+        NRMSE of Wout + Wout_up on the last pattern
+        :return: NRMSE, -1 before any load
+        """
+        return self._diagnostic(
+            'w_out_up_nrmse',
+            -1,
+            lambda d: nrmse(torch.mm(self._w_out_before_load(d) + self.w_out_up, d['X'].t()).t(), d['Y'])
+        )
+    # end w_out_up_nrmse
+
+    # Magnitude of Wout_inc
+    @property
+    def w_out_inc_magnitude(self):
+        """
+        Magnitude of Wout_inc
+        :return: Frobenius norm
+        """
+        return self._diagnostic('w_out_inc_magnitude', 0, lambda d: torch.norm(self.w_out_inc))
+    # end w_out_inc_magnitude
+
+    # Magnitude of Wout_up
+    @property
+    def w_out_up_magnitude(self):
+        """
+        Magnitude of Wout_up
+        :return: Frobenius norm
+        """
+        return self._diagnostic('w_out_up_magnitude', 0, lambda d: torch.norm(self.w_out_up))
+    # end w_out_up_magnitude
+
+    # Magnitude of Wout
+    @property
+    def w_out_magnitude(self):
+        """
+        Magnitude of Wout
+        :return: Frobenius norm
+        """
+        return self._diagnostic('w_out_magnitude', 0, lambda d: torch.norm(self.w_out))
+    # end w_out_magnitude
+
+    # Change of Wout's magnitude during the last load
+    @property
+    def w_out_gradient(self):
+        """
+        Change of Wout's magnitude during the last load
+        :return: Difference of Frobenius norms
+        """
+        return self._diagnostic(
+            'w_out_gradient', 0, lambda d: torch.norm(self.w_out) - torch.norm(self._w_out_before_load(d))
+        )
+    # end w_out_gradient
+
+    # Rank of Wout_inc
+    @property
+    def w_out_inc_rank(self):
+        """
+        Rank of Wout_inc
+        :return: Rank
+        """
+        return self._diagnostic('w_out_inc_rank', 0, lambda d: rank(self.w_out_inc))
+    # end w_out_inc_rank
+
+    # Rank of Wout_up
+    @property
+    def w_out_up_rank(self):
+        """
+        Rank of Wout_up
+        :return: Rank
+        """
+        return self._diagnostic('w_out_up_rank', 0, lambda d: rank(self.w_out_up))
+    # end w_out_up_rank
+
+    # Rank of Wout
+    @property
+    def w_out_rank(self):
+        """
+        Rank of Wout
+        :return: Rank
+        """
+        return self._diagnostic('w_out_rank', 0, lambda d: rank(self.w_out))
+    # end w_out_rank
+
+    # Rank of the conflict zone of the last pattern
+    @property
+    def e_rank(self):
+        """
+        Rank of the conflict zone of the last pattern
+        :return: Rank
+        """
+        return self._diagnostic('e_rank', 0, lambda d: rank(self.E.C))
+    # end e_rank
+
+    # Singular values of Wout
+    @property
+    def w_out_SVs(self):
+        """
+        Singular values of Wout
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('w_out_SVs', None, lambda d: torch.linalg.svdvals(self.w_out))
+    # end w_out_SVs
+
+    # Singular values of Wout_inc
+    @property
+    def w_out_inc_SVs(self):
+        """
+        Singular values of Wout_inc
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('w_out_inc_SVs', None, lambda d: torch.linalg.svdvals(self.w_out_inc))
+    # end w_out_inc_SVs
+
+    # Singular values of Wout_up
+    @property
+    def w_out_up_SVs(self):
+        """
+        Singular values of Wout_up
+        :return: Singular values, None before any load
+        """
+        return self._diagnostic('w_out_up_SVs', None, lambda d: torch.linalg.svdvals(self.w_out_up))
+    # end w_out_up_SVs
+
+    # endregion PROPERTIES
+
     # region PUBLIC
 
     # Set aperture
@@ -115,6 +248,18 @@ class IncForgRRCell(IncRRCell):
 
     # endregion PUBLIC
 
+    # region PRIVATE
+
+    # Wout as it was before the last load
+    def _w_out_before_load(self, diagnostics_inputs):
+        """
+        Wout as it was before the last load, i.e. the current Wout minus the matrix the load added to it
+        :param diagnostics_inputs: Inputs of the last load
+        :return: Wout before the last load
+        """
+        return self.w_out - diagnostics_inputs['w_out_added']
+    # end _w_out_before_load
+
     # Compute update matrix for Wout
     def _compute_update(self, X, Y, E, ridge_param):
         """
@@ -140,46 +285,52 @@ class IncForgRRCell(IncRRCell):
         # Debug
         self._call_debug_point("S{}".format(self._n_samples), S, "IncForgRRCell", "_compute_update")
 
-        # sTs
-        if self._averaged:
-            sTs = torch.mm(S.t(), S) / time_length
-        else:
-            sTs = torch.mm(S.t(), S)
-        # end if
-
-        # Debug
-        self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncForgRRCell", "_compute_update")
-
-        # sTy
-        if self._averaged:
-            sTy = torch.mm(S.t(), Y) / time_length
+        # Low-rank update (Woodbury) or full N x N inverse
+        if self._learning_algo == "woodbury":
+            ridge = ridge_param * time_length if self._averaged else ridge_param
+            return self._low_rank_ridge("S", S, Y, ridge, "IncForgRRCell", "_compute_update").t()
         else:
-            sTy = torch.mm(S.t(), Y)
+            # sTs
+            if self._averaged:
+                sTs = torch.mm(S.t(), S) / time_length
+            else:
+                sTs = torch.mm(S.t(), S)
+            # end if
+
+            # Debug
+            self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncForgRRCell", "_compute_update")
+
+            # sTy
+            if self._averaged:
+                sTy = torch.mm(S.t(), Y) / time_length
+            else:
+                sTy = torch.mm(S.t(), Y)
+            # end if
+
+            # Debug
+            self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncForgRRCell", "_compute_update")
+
+            # Ridge sTs
+            ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
+
+            # Debug
+            self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgRRCell", "_compute_update")
+
+            # Inverse / pinverse
+            if self._learning_algo == "inv":
+                inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgRRCell", "_compute_update")
+            elif self._learning_algo == "pinv":
+                inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncForgRRCell", "_compute_update")
+            else:
+                raise Exception("Unknown learning method {}".format(self._learning_algo))
+            # end if
+
+            # Debug
+            self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncForgRRCell", "_compute_update")
+
+            # Compute increment for Wout
+            return (torch.mm(inv_sTs, sTy)).t()
         # end if
-
-        # Debug
-        self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncForgRRCell", "_compute_update")
-
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
-
-        # Debug
-        self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncForgRRCell", "_compute_update")
-
-        # Inverse / pinverse
-        if self._learning_algo == "inv":
-            inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncForgRRCell", "_compute_update")
-        elif self._learning_algo == "pinv":
-            inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncForgRRCell", "_compute_update")
-        else:
-            raise Exception("Unknown learning method {}".format(self._learning_algo))
-        # end if
-
-        # Debug
-        self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncForgRRCell", "_compute_update")
-
-        # Compute increment for Wout
-        return (torch.mm(inv_sTs, sTy)).t()
     # end _compute_update
 
     # endregion PRIVATE
@@ -234,9 +385,9 @@ class IncForgRRCell(IncRRCell):
         :param C: Conceptor
         """
         if increment:
-            self.A = Conceptor.operator_OR(self.A, C)
+            self.A = Conceptor.operator_OR(self.A, C, compute_R=False)
         else:
-            self.A = Conceptor.operator_OR(M, C)
+            self.A = Conceptor.operator_OR(M, C, compute_R=False)
         # end if
 
     # end _update_A
@@ -247,9 +398,9 @@ class IncForgRRCell(IncRRCell):
         Compute F (space not occupied by any pattern)
         """
         if not self.A.is_null():
-            return Conceptor.operator_NOT(self.A).C
+            return Conceptor.operator_NOT(self.A, compute_R=False).C
         else:
-            return Conceptor.identity(self.output_dim, dtype=self._dtype).C
+            return Conceptor.identity(self.input_dim, dtype=self._dtype).C
         # end if
 
     # end _compute_F
@@ -260,7 +411,7 @@ class IncForgRRCell(IncRRCell):
         Compute M (conflict free zone)
         :param C: Conceptor of current pattern.
         """
-        return Conceptor.operator_AND(self.A, Conceptor.operator_NOT(C))
+        return Conceptor.operator_AND(self.A, Conceptor.operator_NOT(C, compute_R=False), compute_R=False)
     # end _compute_M
 
     # Compute E (conflict zone)
@@ -270,16 +421,19 @@ class IncForgRRCell(IncRRCell):
         :param M: conflict free zone.
         """
         if not M.is_null():
-            return Conceptor.operator_NOT(M)
+            return Conceptor.operator_NOT(M, compute_R=False)
         else:
-            return Conceptor.identity(self.output_dim, dtype=self._dtype)
+            return Conceptor.identity(self.input_dim, dtype=self._dtype)
         # end if
     # end _compute_E
 
     # Update Wout matrix
-    def _update_Wout_loading(self, X, Y):
+    def _update_Wout_loading(self, X, Y, F=None):
         """
         Update Wout matrix
+        :param X: States of one sample (time length x input dim)
+        :param Y: Targets of one sample (time length x output dim)
+        :param F: Not used, the free zone is computed from the space used by all patterns
         """
         # Compute zones
         self.C = self._compute_conceptor(X)
@@ -291,25 +445,16 @@ class IncForgRRCell(IncRRCell):
         self.M = self._compute_M(self.C)
         self.E = self._compute_E(self.M)
 
-        # Debug
-        self.e_rank = rank(self.E.C)
-
         # Compute increment for Wout
         if quota(self.F) < 1e-1:
-            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc * 1000, F=self._compute_F_matrix())
+            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc * 1000, F=self.F)
         else:
-            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc, F=self._compute_F_matrix())
+            self.w_out_inc = self._compute_increment(X, Y, self._ridge_param_inc, F=self.F)
         # end if
 
         # Debug
         self._call_debug_point("w_out_inc{}".format(self._n_samples), self.w_out_inc, "IncForgRRCell", "_update_Wout_loading")
 
-        # DEBUG Wout inc
-        self.w_out_inc_nrmse = nrmse(torch.mm(self.w_out + self.w_out_inc, X.t()).t(), Y)
-        self.w_out_inc_magnitude = torch.norm(self.w_out_inc)
-        self.w_out_inc_rank = rank(self.w_out_inc)
-        _, self.w_out_inc_SVs, _ = torch.svd(self.w_out_inc)
-
         # Targets: what cannot be predicted by the current matrix Wout.
         # Yt = Y - Wout * X
         Yt = Y - torch.mm(self.w_out, X.t()).t()
@@ -322,32 +467,21 @@ class IncForgRRCell(IncRRCell):
         # and the free zone.
         self.w_out_up = self._compute_update(X, Yt, self.E, self._ridge_param_up)
 
-        # Split the matrix Wout_new into update and increment
-        # Wout_up = A * Wout_new
-        self.w_out_up_nrmse = nrmse(torch.mm(self.w_out + self.w_out_up, X.t()).t(), Y)
-        self.w_out_up_magnitude = torch.norm(self.w_out_up)
-        self.w_out_up_rank = rank(self.w_out_up)
-        _, self.w_out_up_SVs, _ = torch.svd(self.w_out_up)
-
         # Debug
         self._call_debug_point("w_out_up{}".format(self._n_samples), self.w_out_up, "IncForgRRCell", "_update_Wout_loading")
 
         # Compute final matrix
         if self.A.quota > self._forgetting_threshold:
-            # Gradient
-            self.w_out_gradient = torch.norm(self.w_out + self.w_out_up) - torch.norm(self.w_out)
-
             # Wout = Wout + Wout_up
             self.w_out += self.w_out_up
+            w_out_added = self.w_out_up
 
             # Update A
             self._update_A(self.M, self.C)
         else:
-            # Gradient
-            self.w_out_gradient = torch.norm(self.w_out + self.w_out_inc) - torch.norm(self.w_out)
-
             # Wout = Wout + Wout_inc
             self.w_out += self.w_out_inc
+            w_out_added = self.w_out_inc
             # self.w_out += self.w_out_up
 
             # Update A
@@ -355,10 +489,8 @@ class IncForgRRCell(IncRRCell):
             # self._update_A(self.M, C)
         # end if
 
-        # Wout magnitude
-        self.w_out_magnitude = torch.norm(self.w_out)
-        self.w_out_rank = rank(self.w_out)
-        _, self.w_out_SVs, _ = torch.svd(self.w_out)
+        # Diagnostics are computed from these when read, Wout before the load is Wout minus what was added
+        self._set_diagnostics_inputs({'X': X, 'Y': Y, 'w_out_added': w_out_added})
 
         # Debug
         self._call_debug_point("w_out{}".format(self._n_samples), self.w_out, "IncForgRRCell", "_update_Wout_loading")
@@ -47,7 +47,7 @@ class IncRRCell(Node):
         :param conceptors: ConceptorSet object of conceptors used to describe space.
         :param ridge_param: Ridge parameter
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv) or low-rank Woodbury update (woodbury)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param averaged: Covariance matrix divided by the number of samples ?
         :param debug: Debug mode
@@ -127,46 +127,52 @@ class IncRRCell(Node):
         # Debug
         self._call_debug_point("S{}".format(self._n_samples), S, "IncRRCell", "_compute_increment")
 
-        # sTs
-        if self._averaged:
-            sTs = torch.mm(S.t(), S) / time_length
+        # Low-rank update (Woodbury) or full N x N inverse
+        if self._learning_algo == "woodbury":
+            ridge = ridge_param * time_length if self._averaged else ridge_param
+            Wout_inc = self._low_rank_ridge("S", S, Yt, ridge, "IncRRCell", "_compute_increment").t()
         else:
-            sTs = torch.mm(S.t(), S)
-        # end if
+            # sTs
+            if self._averaged:
+                sTs = torch.mm(S.t(), S) / time_length
+            else:
+                sTs = torch.mm(S.t(), S)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncRRCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("sTs{}".format(self._n_samples), sTs, "IncRRCell", "_compute_increment")
 
-        # sTy
-        if self._averaged:
-            sTy = torch.mm(S.t(), Yt) / time_length
-        else:
-            sTy = torch.mm(S.t(), Yt)
-        # end if
+            # sTy
+            if self._averaged:
+                sTy = torch.mm(S.t(), Yt) / time_length
+            else:
+                sTy = torch.mm(S.t(), Yt)
+            # end if
 
-        # Debug
-        self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncRRCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("sTy{}".format(self._n_samples), sTy, "IncRRCell", "_compute_increment")
 
-        # Ridge sTs
-        ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
+            # Ridge sTs
+            ridge_sTs = sTs + ridge_param * torch.eye(self._input_dim)
 
-        # Debug
-        self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncRRCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("ridge_sTs{}".format(self._n_samples), ridge_sTs, "IncRRCell", "_compute_increment")
 
-        # Inverse / pinverse
-        if self._learning_algo == "inv":
-            inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncRRCell", "_compute_increment")
-        elif self._learning_algo == "pinv":
-            inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncRRCell", "_compute_increment")
-        else:
-            raise Exception("Unknown learning method {}".format(self._learning_algo))
-        # end if
+            # Inverse / pinverse
+            if self._learning_algo == "inv":
+                inv_sTs = self._inverse("ridge_sTs", ridge_sTs, "IncRRCell", "_compute_increment")
+            elif self._learning_algo == "pinv":
+                inv_sTs = self._pinverse("ridge_sTs", ridge_sTs, "IncRRCell", "_compute_increment")
+            else:
+                raise Exception("Unknown learning method {}".format(self._learning_algo))
+            # end if
 
-        # Debug
-        self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncRRCell", "_compute_increment")
+            # Debug
+            self._call_debug_point("inv_sTs{}".format(self._n_samples), inv_sTs, "IncRRCell", "_compute_increment")
 
-        # Compute increment for Wout
-        Wout_inc = (torch.mm(inv_sTs, sTy)).t()
+            # Compute increment for Wout
+            Wout_inc = (torch.mm(inv_sTs, sTy)).t()
+        # end if
 
         # Debug
         self._call_debug_point("Wout_inc{}".format(self._n_samples), Wout_inc, "IncRRCell", "_compute_increment")
@@ -175,12 +181,15 @@ class IncRRCell(Node):
     # end _compute_increment
 
     # Update Wout matrix
-    def _update_Wout_loading(self, x, y):
+    def _update_Wout_loading(self, x, y, F=None):
         """
         Update Wout matrix
+        :param x: States of one sample (time length x input dim)
+        :param y: Targets of one sample (time length x output dim)
+        :param F: Free space of the conceptors, or None to compute it
         """
         # Compute increment for Wout
-        self.w_out_inc = self._compute_increment(x, y, self._ridge_param)
+        self.w_out_inc = self._compute_increment(x, y, self._ridge_param, F=F)
 
         # Increment Wout
         self.w_out += self.w_out_inc
@@ -216,9 +225,6 @@ class IncRRCell(Node):
         # Batch size
         batch_size = x.size()[0]
 
-        # Time length
-        time_length = x.size()[1]
-
         # Add bias
         if self._with_bias:
             x = self._add_constant(x)
@@ -226,10 +232,13 @@ class IncRRCell(Node):
 
         # State or output
         if self.training:
-            # For each sample in the batch
+            # The free space does not change during the batch
+            F = self._conceptors.F() if not self._conceptors.is_null() else None
+
+            # For each sample in the batch, each increment depends on the previous ones
             for b in range(batch_size):
                 # Update Wout matrix
-                self._update_Wout_loading(x[b], y[b])
+                self._update_Wout_loading(x[b], y[b], F=F)
 
                 # Debug
                 self._call_debug_point("w_out{}".format(self._n_samples), self.w_out, "IncRRCell", "forward")
@@ -241,19 +250,12 @@ class IncRRCell(Node):
             # State
             return x
         else:
-            # Outputs
-            outputs = Variable(torch.zeros(batch_size, time_length, self._output_dim, dtype=self._dtype), requires_grad=False)
-            outputs = outputs.cuda() if self.w_out.is_cuda else outputs
-
-            # For each sample in the batch
-            for b in range(batch_size):
-                # Predicted output
-                outputs[b] = torch.mm(self.w_out, x[b].t()).t()
-            # end for
+            # Predicted outputs for all samples and timesteps
+            outputs = torch.matmul(x, self.w_out.t())
 
             # Softmax output ?
             if self._softmax_output:
-                return self.softmax(outputs)
+                return self._softmax(outputs)
             else:
                 return outputs
             # end if
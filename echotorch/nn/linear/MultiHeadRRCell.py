@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/linear/MultiHeadRRCell.py
+# Description : Ridge Regression node with several output heads
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+"""
+Created on 16 October 2026
+@author: Nils Schaetti
+"""
+
+# Imports
+import torch
+from ..Node import Node
+from .RRCell import RRCell
+
+
+# Ridge Regression node with several output heads
+class MultiHeadRRCell(RRCell):
+    """
+    Ridge Regression node with several output heads (e.g. different horizons or targets) trained on the same states.
+    The heads share one xTx, each head has its own columns of xTy, and all heads are solved with one
+    factorization in finalize(). Targets are given and outputs are returned as dictionaries indexed by head name.
+    """
+
+    # Constructor
+    def __init__(self, input_dim, heads, ridge_param=0.0, with_bias=True, learning_algo='inv', softmax_output=False,
+                 normalize_output=False, averaged=True, accumulation_dtype=None, debug=Node.NO_DEBUG, test_case=None,
+                 dtype=torch.float32):
+        """
+        Constructor
+        :param input_dim: Feature space dimension
+        :param heads: Output dimension of each head, as a dictionary (head name -> output dim)
+        :param ridge_param: Ridge parameter shared by all heads
+        :param with_bias: Add a bias to the linear layer
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv), Cholesky factorization (cholesky), LU solve
+        (solve), least squares (lstsq) or eigendecomposition (eigh)
+        :param softmax_output: Add a softmax output to each head ?
+        :param normalize_output: Normalize outputs of each head to sum to one ?
+        :param averaged: Covariance matrix divided by the number of samples ?
+        :param accumulation_dtype: Data type of xTx and xTy and of the solve, None for dtype
+        :param debug: Debug mode
+        :param test_case: Test case to call for test.
+        :param dtype: Data type
+        """
+        # Superclass, the heads are the columns of one output layer
+        super(MultiHeadRRCell, self).__init__(
+            input_dim=input_dim,
+            output_dim=sum(heads.values()),
+            ridge_param=ridge_param,
+            with_bias=with_bias,
+            learning_algo=learning_algo,
+            softmax_output=False,
+            normalize_output=False,
+            averaged=averaged,
+            accumulation_dtype=accumulation_dtype,
+            debug=debug,
+            test_case=test_case,
+            dtype=dtype
+        )
+
+        # Heads
+        self._heads = dict(heads)
+        self._head_softmax_output = softmax_output
+        self._head_normalize_output = normalize_output
+
+        # Columns of each head
+        self._head_slices = dict()
+        position = 0
+        for head_name, head_dim in self._heads.items():
+            self._head_slices[head_name] = slice(position, position + head_dim)
+            position += head_dim
+        # end for
+    # end __init__
+
+    # region PROPERTIES
+
+    # Heads
+    @property
+    def heads(self):
+        """
+        Heads
+        :return: Output dimension of each head (head name -> output dim)
+        """
+        return self._heads
+    # end heads
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Output weights of a head
+    def head_w_out(self, head_name):
+        """
+        Output weights of a head
+        :param head_name: Head name
+        :return: Output weights (head output dim x input dim (+1 with bias))
+        """
+        return self.w_out[self._head_slices[head_name]]
+    # end head_w_out
+
+    # Forward
+    def forward(self, x, y=None):
+        """
+        Forward
+        :param x: Input signal (batch size x time length x input dim)
+        :param y: Target outputs of each head (head name -> batch size x time length x head output dim)
+        :return: States (training) or outputs of each head (eval, head name -> batch size x time length x head
+        output dim)
+        """
+        if self.training:
+            return super(MultiHeadRRCell, self).forward(x, self._stack_targets(y))
+        else:
+            # All heads in one matrix product
+            outputs = super(MultiHeadRRCell, self).forward(x, None)
+
+            # Split into heads
+            head_outputs = dict()
+            for head_name, head_slice in self._head_slices.items():
+                head_output = outputs[:, :, head_slice]
+                if self._head_softmax_output:
+                    head_output = self._softmax(head_output)
+                elif self._head_normalize_output:
+                    head_output = torch.abs(head_output) / torch.sum(torch.abs(head_output), dim=2, keepdim=True)
+                # end if
+                head_outputs[head_name] = head_output
+            # end for
+            return head_outputs
+        # end if
+    # end forward
+
+    # Accumulate xTx and xTy
+    def accumulate(self, x, y, time_length, n_samples=0):
+        """
+        Accumulate xTx and xTy from all samples and timesteps of a batch or of a chunk of a batch
+        :param x: Input signal (batch size x time length x input dim)
+        :param y: Target outputs of each head (head name -> batch size x time length x head output dim)
+        :param time_length: Whole length of the samples (a chunk contributes 1 / time_length in averaged mode)
+        :param n_samples: Number of samples completed with this chunk (counted in averaged mode)
+        """
+        super(MultiHeadRRCell, self).accumulate(x, self._stack_targets(y), time_length, n_samples)
+    # end accumulate
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Targets of all heads as one tensor
+    def _stack_targets(self, y):
+        """
+        Targets of all heads as one tensor
+        :param y: Target outputs of each head (dictionary), or already stacked (tensor)
+        :return: Targets (batch size x time length x output dim)
+        """
+        if isinstance(y, dict):
+            if set(y.keys()) != set(self._heads.keys()):
+                raise Exception("Expected targets for heads {}, got {}".format(list(self._heads), list(y)))
+            # end if
+            return torch.cat([y[head_name] for head_name in self._heads], dim=-1)
+        else:
+            return y
+        # end if
+    # end _stack_targets
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Extra-information
+    def extra_repr(self):
+        """
+        Extra-information
+        """
+        s = super(MultiHeadRRCell, self).extra_repr()
+        s += ', heads={}'.format(self._heads)
+        return s
+    # end extra_repr
+
+    # endregion OVERRIDE
+
+# end MultiHeadRRCell
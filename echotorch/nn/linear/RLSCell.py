@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/linear/RLSCell.py
+# Description : Recursive Least Squares node
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+"""
+Created on 16 October 2026
+@author: Nils Schaetti
+"""
+
+# Imports
+import math
+import torch
+from ..Node import Node
+
+
+# Recursive Least Squares node
+class RLSCell(Node):
+    """
+    Recursive Least Squares node.
+    Output weights are updated online, each timestep weighting past ones by a forgetting factor, without finalize().
+    With a forgetting factor of 1, the weights after a sequence are the ridge regression weights of the sequence
+    (ridge_param on the non-averaged xTx).
+    """
+
+    # Constructor
+    def __init__(self, input_dim, output_dim, ridge_param=1.0, forgetting_factor=1.0, with_bias=True, chunk_size=1,
+                 n_streams=None, square_root=False, softmax_output=False, normalize_output=False, debug=Node.NO_DEBUG,
+                 test_case=None, dtype=torch.float32):
+        """
+        Constructor
+        :param input_dim: Feature space dimension
+        :param output_dim: Output space dimension
+        :param ridge_param: Initial regularization, the inverse covariance matrix starts at I / ridge_param
+        :param forgetting_factor: Weight of the past at each timestep (1.0 for no forgetting)
+        :param with_bias: Add a bias to the linear layer
+        :param chunk_size: Number of timesteps per update (1 for an update at each timestep)
+        :param n_streams: Number of independent readouts, one per sample of the batch, or None for one readout shared
+        by all samples
+        :param square_root: Propagate a Cholesky factor of the inverse covariance matrix with QR decompositions, slower
+        but numerically stable
+        :param softmax_output: Add a softmax output (normalize outputs) ?
+        :param normalize_output: Normalize outputs to sum to one ?
+        :param debug: Debug mode
+        :param test_case: Test case to call for test.
+        :param dtype: Data type
+        """
+        # Superclass
+        super(RLSCell, self).__init__(
+            input_dim=input_dim,
+            output_dim=output_dim,
+            debug=debug,
+            test_case=test_case,
+            dtype=dtype
+        )
+
+        # Properties
+        self._ridge_param = ridge_param
+        self._forgetting_factor = forgetting_factor
+        self._with_bias = with_bias
+        self._chunk_size = chunk_size
+        self._n_streams = n_streams
+        self._square_root = square_root
+        self._softmax_output = softmax_output
+        self._normalize_output = normalize_output
+        self._softmax = torch.nn.Softmax(dim=2)
+
+        # Size
+        if self._with_bias:
+            self._x_size = input_dim + 1
+        else:
+            self._x_size = input_dim
+        # end if
+
+        # Output weights and inverse covariance matrix (or its Cholesky factor), one per stream
+        readouts_size = (n_streams,) if n_streams is not None else ()
+        self.register_buffer('w_out', torch.zeros(readouts_size + (output_dim, self._x_size), dtype=dtype))
+        self.register_buffer('P', torch.zeros(readouts_size + (self._x_size, self._x_size), dtype=dtype))
+        self._init_P()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Forgetting factor
+    @property
+    def forgetting_factor(self):
+        """
+        Forgetting factor
+        :return: Weight of the past at each timestep
+        """
+        return self._forgetting_factor
+    # end forgetting_factor
+
+    # Set forgetting factor
+    @forgetting_factor.setter
+    def forgetting_factor(self, forgetting_factor):
+        """
+        Set forgetting factor
+        :param forgetting_factor: Weight of the past at each timestep
+        """
+        self._forgetting_factor = forgetting_factor
+    # end forgetting_factor
+
+    # Inverse covariance matrix
+    @property
+    def inverse_covariance(self):
+        """
+        Inverse covariance matrix
+        :return: Inverse covariance matrix ((n streams x) input dim (+1) x input dim (+1))
+        """
+        if self._square_root:
+            return torch.matmul(self.P, self.P.transpose(-1, -2))
+        # end if
+        return self.P
+    # end inverse_covariance
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Reset learning
+    def reset(self):
+        """
+        Reset learning
+        """
+        self.w_out.data.fill_(0.0)
+        self._init_P()
+
+        # Training mode again
+        self.train(True)
+    # end reset
+
+    # Forward
+    def forward(self, x, y=None):
+        """
+        Forward.
+        In training mode with targets, the outputs are predicted with the weights before each update (a priori).
+        :param x: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim), or None to predict only
+        :return: Outputs (batch size x time length x output dim)
+        """
+        # Add bias
+        if self._with_bias:
+            x = self._add_constant(x)
+        # end if
+
+        # Update or predict
+        if self.training and y is not None:
+            outputs = self._update(x, y)
+        else:
+            outputs = self._predict(x)
+        # end if
+
+        # Softmax or normalized output
+        if self._softmax_output:
+            return self._softmax(outputs)
+        elif self._normalize_output:
+            return torch.abs(outputs) / torch.sum(torch.abs(outputs), dim=2, keepdim=True)
+        else:
+            return outputs
+        # end if
+    # end forward
+
+    # Update with a batch or a chunk of a batch
+    def accumulate(self, x, y, time_length=None, n_samples=0):
+        """
+        Update with a batch or a chunk of a batch, same call as RRCell.accumulate()
+        :param x: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim)
+        :param time_length: Not used
+        :param n_samples: Not used
+        """
+        if self._with_bias:
+            x = self._add_constant(x)
+        # end if
+        self._update(x, y)
+    # end accumulate
+
+    # Finish training
+    def finalize(self):
+        """
+        Finish training, weights are already up to date
+        """
+        self.train(False)
+    # end finalize
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Initial inverse covariance matrix
+    def _init_P(self):
+        """
+        Initial inverse covariance matrix I / ridge_param (or its Cholesky factor)
+        """
+        scale = 1.0 / self._ridge_param
+        if self._square_root:
+            scale = math.sqrt(scale)
+        # end if
+        self.P.data.copy_(
+            torch.eye(self._x_size, dtype=self.P.dtype, device=self.P.device).expand_as(self.P) * scale
+        )
+    # end _init_P
+
+    # Predict outputs
+    def _predict(self, x):
+        """
+        Predict outputs
+        :param x: Input signal with bias (batch size x time length x x size)
+        :return: Outputs (batch size x time length x output dim)
+        """
+        if self._n_streams is not None:
+            self._check_streams(x)
+        # end if
+        return torch.matmul(x, self.w_out.transpose(-1, -2))
+    # end _predict
+
+    # Update weights chunk by chunk
+    def _update(self, x, y):
+        """
+        Update weights chunk by chunk
+        :param x: Input signal with bias (batch size x time length x x size)
+        :param y: Target outputs (batch size x time length x output dim)
+        :return: A priori outputs (batch size x time length x output dim)
+        """
+        n_batches, time_length = int(x.size(0)), int(x.size(1))
+        outputs = torch.empty(n_batches, time_length, self._output_dim, dtype=self._dtype, device=x.device)
+
+        # Check streams
+        if self._n_streams is not None:
+            self._check_streams(x)
+        # end if
+
+        # Weights and inverse covariance matrix of each readout, as views
+        n_readouts = self._n_streams if self._n_streams is not None else 1
+        w_out = self.w_out.view(n_readouts, self._output_dim, self._x_size)
+        P = self.P.view(n_readouts, self._x_size, self._x_size)
+
+        # For each chunk
+        for start in range(0, time_length, self._chunk_size):
+            end = min(start + self._chunk_size, time_length)
+            chunk_length = end - start
+
+            # Rows of each readout, timestep by timestep (n readouts x rows x x size)
+            if self._n_streams is None:
+                X = x[:, start:end].transpose(0, 1).reshape(1, chunk_length * n_batches, self._x_size)
+                Y = y[:, start:end].transpose(0, 1).reshape(1, chunk_length * n_batches, self._output_dim)
+                steps = torch.arange(chunk_length, dtype=self._dtype, device=x.device).repeat_interleave(n_batches)
+            else:
+                X = x[:, start:end]
+                Y = y[:, start:end]
+                steps = torch.arange(chunk_length, dtype=self._dtype, device=x.device)
+            # end if
+            X, Y = X.to(self._dtype), Y.to(self._dtype)
+
+            # A priori errors
+            predictions = torch.matmul(X, w_out.transpose(1, 2))
+            errors = Y - predictions
+
+            # Measurement weights, a row of step j is older by (chunk length - 1 - j) steps at the end of the chunk
+            noise = torch.pow(self._forgetting_factor, steps + 1.0)
+
+            # Gains (n readouts x x size x rows)
+            if self._square_root:
+                gains = self._square_root_gains(P, X, noise, chunk_length)
+            else:
+                gains = self._gains(P, X, noise, chunk_length)
+            # end if
+
+            # Update weights
+            w_out.add_(torch.matmul(gains, errors).transpose(1, 2))
+
+            # A priori outputs
+            if self._n_streams is None:
+                outputs[:, start:end] = predictions[0].view(chunk_length, n_batches, self._output_dim).transpose(0, 1)
+            else:
+                outputs[:, start:end] = predictions
+            # end if
+        # end for
+
+        return outputs
+    # end _update
+
+    # Gains and inverse covariance update
+    def _gains(self, P, X, noise, chunk_length):
+        """
+        Gains K = P X^T (R + X P X^T)^-1 and update P = (P - K X P) / forgetting^chunk length
+        :param P: Inverse covariance matrices, updated in place (n readouts x x size x x size)
+        :param X: Rows (n readouts x rows x x size)
+        :param noise: Diagonal of R (rows)
+        :param chunk_length: Number of timesteps in the chunk
+        :return: Gains (n readouts x x size x rows)
+        """
+        PX = torch.matmul(P, X.transpose(1, 2))
+        Re = torch.matmul(X, PX) + torch.diag(noise)
+        gains = torch.linalg.solve(Re, PX.transpose(1, 2)).transpose(1, 2)
+        new_P = (P - torch.matmul(gains, PX.transpose(1, 2))) / self._forgetting_factor ** chunk_length
+        P.copy_((new_P + new_P.transpose(1, 2)) / 2.0)
+        return gains
+    # end _gains
+
+    # Gains and Cholesky factor update with a QR decomposition
+    def _square_root_gains(self, S, X, noise, chunk_length):
+        """
+        Gains and Cholesky factor update, by triangularizing the pre-array [[R^1/2, X S], [0, S]] with P = S S^T
+        :param S: Cholesky factors of the inverse covariance matrices, updated in place (n readouts x x size x x size)
+        :param X: Rows (n readouts x rows x x size)
+        :param noise: Diagonal of R (rows)
+        :param chunk_length: Number of timesteps in the chunk
+        :return: Gains (n readouts x x size x rows)
+        """
+        n_readouts, n_rows = int(X.size(0)), int(X.size(1))
+
+        # Pre-array
+        pre_array = torch.zeros(
+            n_readouts, n_rows + self._x_size, n_rows + self._x_size, dtype=self._dtype, device=X.device
+        )
+        pre_array[:, :n_rows, :n_rows] = torch.diag(torch.sqrt(noise))
+        pre_array[:, :n_rows, n_rows:] = torch.matmul(X, S)
+        pre_array[:, n_rows:, n_rows:] = S
+
+        # Lower triangular post-array [[Re^1/2, 0], [K Re^1/2, S']]
+        post_array = torch.linalg.qr(pre_array.transpose(1, 2), mode='r')[1].transpose(1, 2)
+        gains = torch.linalg.solve_triangular(
+            post_array[:, :n_rows, :n_rows],
+            post_array[:, n_rows:, :n_rows],
+            upper=False,
+            left=False
+        )
+
+        # New factor
+        S.copy_(post_array[:, n_rows:, n_rows:] / math.sqrt(self._forgetting_factor ** chunk_length))
+        return gains
+    # end _square_root_gains
+
+    # Check the batch size against the number of streams
+    def _check_streams(self, x):
+        """
+        Check the batch size against the number of streams
+        :param x: Input signal (batch size x time length x x size)
+        """
+        if int(x.size(0)) != self._n_streams:
+            raise Exception("Expected a batch of {} streams, got {}".format(self._n_streams, x.size(0)))
+        # end if
+    # end _check_streams
+
+    # Add constant
+    def _add_constant(self, x):
+        """
+        Add constant
+        :param x: Input signal (batch size x time length x input dim)
+        :return: Input signal with a constant first feature
+        """
+        bias = torch.ones((x.size(0), x.size(1), 1), dtype=x.dtype, device=x.device)
+        return torch.cat((bias, x), dim=2)
+    # end _add_constant
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Extra-information
+    def extra_repr(self):
+        """
+        Extra-information
+        """
+        s = super(RLSCell, self).extra_repr()
+        s += (', ridge_param={_ridge_param}, forgetting_factor={_forgetting_factor}, with_bias={_with_bias}, '
+              'chunk_size={_chunk_size}, n_streams={_n_streams}, square_root={_square_root}')
+        return s.format(**self.__dict__)
+    # end extra_repr
+
+    # endregion OVERRIDE
+
+# end RLSCell
@@ -28,6 +28,8 @@ Created on 26 January 2018
 import torch.sparse
 import torch
 from ..Node import Node
+from ..functional.quantization import quantize_per_channel, quantized_linear
+from ..utils.SufficientStatistics import SufficientStatistics
 from torch.autograd import Variable
 
 
@@ -39,18 +41,25 @@ class RRCell(Node):
 
     # Constructor
     def __init__(self, input_dim, output_dim, ridge_param=0.0, with_bias=True, learning_algo='inv',
-                 softmax_output=False, normalize_output=False, averaged=True, debug=Node.NO_DEBUG, test_case=None,
-                 dtype=torch.float32):
+                 softmax_output=False, normalize_output=False, averaged=True, accumulation_dtype=None, pooling=None,
+                 debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Feature space dimension
         :param output_dim: Output space dimension
-        :param ridge_param: Ridge parameter
+        :param ridge_param: Ridge parameter, or a list of ridge parameters solved at once from one eigendecomposition,
+        the one with the lowest generalized cross-validation score being kept
         :param with_bias: Add a bias to the linear layer
-        :param learning_algo: Inverse (inv) or pseudo-inverse (pinv)
+        :param learning_algo: Inverse (inv), pseudo-inverse (pinv), Cholesky factorization (cholesky), LU solve
+        (solve), least squares (lstsq) or eigendecomposition (eigh)
         :param softmax_output: Add a softmax output (normalize outputs) ?
         :param normalize_output: Normalize outputs to sum to one ?
         :param averaged: Covariance matrix divided by the number of samples ?
+        :param accumulation_dtype: Data type of xTx and xTy and of the solve (e.g. torch.float64 with float32 states),
+        None for dtype
+        :param pooling: None for one target per timestep, or sequence-level readout with one target (or class label)
+        per sample on states pooled over time: 'last' (last state), 'mean' (average state) or a list of timesteps
+        whose states are concatenated (negative indices count from the end)
         :param debug: Debug mode
         :param test_case: Test case to call for test.
         :param dtype: Data type
@@ -73,23 +82,77 @@ class RRCell(Node):
         self._normalize_output = normalize_output
         self._softmax = torch.nn.Softmax(dim=2)
         self._averaged = averaged
+        self._accumulation_dtype = accumulation_dtype if accumulation_dtype is not None else dtype
         self._n_samples = 0
+        self._n_rows = 0
+        self._selected_ridge_param = None
+        self._gcv_scores = None
+
+        # Pooling over time, timesteps whose states are kept (None for the mean)
+        self._pooling = pooling
+        if pooling is None or pooling == 'mean':
+            self._pool_timesteps = None
+        elif pooling == 'last':
+            self._pool_timesteps = [-1]
+        elif isinstance(pooling, (list, tuple)):
+            self._pool_timesteps = [int(t) for t in pooling]
+        else:
+            raise Exception("Unknown pooling {}, expected None, 'last', 'mean' or a list of timesteps".format(pooling))
+        # end if
+        self._pool_features = None
+        self._pool_position = 0
 
-        # Size
+        # Size of the (pooled) features
+        n_pooled = len(self._pool_timesteps) if self._pool_timesteps is not None else 1
         if self._with_bias:
-            self._x_size = input_dim + 1
+            self._x_size = input_dim * n_pooled + 1
         else:
-            self._x_size = input_dim
+            self._x_size = input_dim * n_pooled
         # end if
 
         # Set it as buffer
-        self.register_buffer('xTx', Variable(torch.zeros(self._x_size, self._x_size, dtype=dtype), requires_grad=False))
-        self.register_buffer('xTy', Variable(torch.zeros(self._x_size, output_dim, dtype=dtype), requires_grad=False))
+        acc_dtype = self._accumulation_dtype
+        self.register_buffer('xTx', Variable(torch.zeros(self._x_size, self._x_size, dtype=acc_dtype), requires_grad=False))
+        self.register_buffer('xTy', Variable(torch.zeros(self._x_size, output_dim, dtype=acc_dtype), requires_grad=False))
+        self.register_buffer('yTy', Variable(torch.zeros(output_dim, dtype=acc_dtype), requires_grad=False))
         self.register_buffer('w_out', Variable(torch.zeros(output_dim, input_dim, dtype=dtype), requires_grad=False))
+        self.register_buffer('w_out_scale', None)
+        self._quantization = None
     # end __init__
 
     # region PROPERTIES
 
+    # Selected ridge parameter
+    @property
+    def selected_ridge_param(self):
+        """
+        Selected ridge parameter
+        :return: Ridge parameter with the lowest GCV score after finalize() with a list of ridge parameters, or None
+        """
+        return self._selected_ridge_param
+    # end selected_ridge_param
+
+    # GCV scores
+    @property
+    def gcv_scores(self):
+        """
+        GCV scores
+        :return: Generalized cross-validation score of each ridge parameter after finalize() with a list of ridge
+        parameters, or None
+        """
+        return self._gcv_scores
+    # end gcv_scores
+
+    # Output weights quantization
+    @property
+    def quantization(self):
+        """
+        Output weights quantization
+        :return: None (float weights), int8 or float16
+        """
+        return self._quantization
+    # end quantization
+
     # endregion PROPERTIES
 
     # region PUBLIC
@@ -102,20 +165,55 @@ class RRCell(Node):
         """
         self.xTx.data.fill_(0.0)
         self.xTy.data.fill_(0.0)
+        self.yTy.data.fill_(0.0)
         self.w_out.data.fill_(0.0)
         self._n_samples = 0
+        self._n_rows = 0
+        self._selected_ridge_param = None
+        self._gcv_scores = None
+        self._quantization = None
+        self.w_out_scale = None
+        self.w_out = self.w_out.to(self._dtype)
+        self._pool_features = None
+        self._pool_position = 0
 
         # Training mode again
         self.train(True)
     # end reset
 
+    # Export sufficient statistics
+    def statistics(self):
+        """
+        Export sufficient statistics (xTx, xTy, yTy and counts), which can be saved, summed over workers
+        and loaded back with load_statistics() before finalize()
+        :return: SufficientStatistics
+        """
+        return SufficientStatistics(
+            {'xTx': self.xTx, 'xTy': self.xTy, 'yTy': self.yTy},
+            {'n_samples': self._n_samples, 'n_rows': self._n_rows}
+        )
+    # end statistics
+
+    # Load sufficient statistics
+    def load_statistics(self, statistics):
+        """
+        Load sufficient statistics in place of the accumulated ones
+        :param statistics: SufficientStatistics exported by statistics() (or their sum)
+        """
+        self.xTx.data.copy_(statistics['xTx'])
+        self.xTy.data.copy_(statistics['xTy'])
+        self.yTy.data.copy_(statistics['yTy'])
+        self._n_samples = statistics['n_samples']
+        self._n_rows = statistics['n_rows']
+    # end load_statistics
+
     # Forward
     def forward(self, x, y=None):
         """
         Forward
         :param x: Input signal.
-        :param y: Target outputs
-        :return: Output or hidden states
+        :param y: Target outputs, or one target (or class label) per sample with pooling
+        :return: Output or hidden states (one output per sample with pooling)
         """
         # Batch size
         batch_size = x.size()[0]
@@ -123,88 +221,292 @@ class RRCell(Node):
         # Time length
         time_length = x.size()[1]
 
-        # Add bias
-        if self._with_bias:
-            x = self._add_constant(x)
-        # end if
-
         # Training or eval
         if self.training:
-            for b in range(batch_size):
-                if not self._averaged:
-                    self.xTx.data.add_(x[b].t().mm(x[b]).data)
-                    self.xTy.data.add_(x[b].t().mm(y[b]).data)
-                else:
-                    self.xTx.data.add_((x[b].t().mm(x[b]) / time_length).data)
-                    self.xTy.data.add_((x[b].t().mm(y[b]) / time_length).data)
-                    self._n_samples += 1.0
-            # end for
+            # Accumulate all samples
+            self.accumulate(x, y, time_length, n_samples=batch_size)
+            return x
+        elif not self.training:
+            # One row of pooled features per sample
+            if self._pooling is not None:
+                x = self._pool_chunk(x, time_length)
+            # end if
 
-            # Bias or not
+            # Add bias
             if self._with_bias:
-                return x[:, :, 1:]
+                x = self._add_constant(x)
+            # end if
+
+            # Outputs for all samples and timesteps
+            if self._quantization is not None:
+                outputs = quantized_linear(x, self.w_out, self.w_out_scale)
             else:
-                return x
+                outputs = torch.matmul(x, self.w_out.t())
             # end if
-        elif not self.training:
-            # Outputs
-            outputs = Variable(torch.zeros(batch_size, time_length, self._output_dim, dtype=self._dtype),
-                               requires_grad=False)
-            outputs = outputs.cuda() if self.w_out.is_cuda else outputs
-
-            # For each batch
-            for b in range(batch_size):
-                outputs[b] = torch.mm(self.w_out, x[b].t()).t()
-            # end for
 
             if self._softmax_output:
-                return self._softmax(outputs)
+                outputs = self._softmax(outputs)
             elif self._normalize_output:
-                return torch.abs(outputs) / torch.sum(torch.abs(outputs), axis=2).reshape(outputs.size(0), outputs.size(1), 1)
+                outputs = torch.abs(outputs) / torch.sum(torch.abs(outputs), axis=2).reshape(outputs.size(0), outputs.size(1), 1)
+            # end if
+
+            # One output per sample with pooling
+            if self._pooling is not None:
+                return outputs[:, 0]
             else:
                 return outputs
+            # end if
         # end if
 
     # end forward
 
+    # Accumulate xTx and xTy
+    def accumulate(self, x, y, time_length, n_samples=0):
+        """
+        Accumulate xTx and xTy from all samples and timesteps of a batch or of a chunk of a batch.
+        With pooling, the chunks of a batch must be given in order, the pooled features of each sample are added
+        when its last chunk arrives.
+        :param x: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim), or with pooling one target per sample
+        (batch size x output dim) or one class label per sample (batch size)
+        :param time_length: Whole length of the samples (a chunk contributes 1 / time_length in averaged mode)
+        :param n_samples: Number of samples completed with this chunk (counted in averaged mode)
+        """
+        if self._pooling is not None:
+            # Pooled features of the samples, once their last chunk is there
+            x = self._pool_chunk(x, time_length)
+            if x is not None:
+                self._accumulate_rows(x, self._sample_targets(y), 1, x.size(0))
+            # end if
+        else:
+            self._accumulate_rows(x, y, time_length, n_samples)
+        # end if
+    # end accumulate
+
+    # Output weights for several ridge parameters
+    def ridge_path(self, ridge_params):
+        """
+        Output weights for several ridge parameters from one symmetric eigendecomposition xTx = V diag(s) V^T,
+        wout(l) = (V diag(1 / (s + l)) V^T xTy)^T, scored by generalized cross-validation (the rotation-invariant
+        approximation of leave-one-out), GCV(l) = MSE(l) / (1 - df(l) / n)^2 with df(l) = sum(s / (s + l)).
+        Residuals are computed from xTx, xTy and yTy, without another pass over the data.
+        Can be called before finalize() or after it.
+        :param ridge_params: Ridge parameters (list or tensor of L values)
+        :return: Output weights (L x output dim x input dim (+1 with bias)), GCV scores (L)
+        """
+        # Averaged statistics
+        xTx, xTy, yTy = self.xTx, self.xTy, self.yTy
+        if self._averaged and self.training:
+            xTx, xTy, yTy = xTx / self._n_samples, xTy / self._n_samples, yTy / self._n_samples
+        # end if
+
+        # One eigendecomposition
+        ridge_params = torch.as_tensor(ridge_params, dtype=xTx.dtype, device=xTx.device).view(-1, 1, 1)
+        s, v = torch.linalg.eigh(xTx)
+        s = s.clamp(min=0.0).view(1, -1, 1)
+        z = v.t().mm(xTy).unsqueeze(0)
+
+        # wout^T = V diag(1 / (s + l)) V^T xTy for each l
+        shrink = 1.0 / (s + ridge_params)
+        w_outs = torch.matmul(v, shrink * z).transpose(1, 2)
+
+        # Residuals, ||y||^2 - sum(z^2 (s + 2l) / (s + l)^2)
+        rss = yTy.view(1, -1) - (z * z * (s + 2.0 * ridge_params) * shrink * shrink).sum(1)
+        mse = rss.clamp(min=0.0).mean(1)
+        if not self._averaged:
+            mse = mse / max(self._n_rows, 1)
+        # end if
+
+        # Effective degrees of freedom and GCV
+        df = (s * shrink).sum(1).view(-1)
+        gcv_scores = mse / (1.0 - df / max(self._n_rows, 1)) ** 2
+
+        return w_outs.to(self._dtype), gcv_scores
+    # end ridge_path
+
     # Finish training
     def finalize(self):
         """
-        Finalize training with inverse or pseudo-inverse
+        Finalize training with the learning method, or with one eigendecomposition for a list of ridge parameters
         """
         if self._averaged:
             # Average
             self.xTx = self.xTx / self._n_samples
             self.xTy = self.xTy / self._n_samples
+            self.yTy = self.yTy / self._n_samples
         # end if
 
+        # Not in training mode anymore
+        self.train(False)
+
+        # Several ridge parameters, keep the one with the lowest GCV score
+        if isinstance(self._ridge_param, (list, tuple, torch.Tensor)):
+            w_outs, self._gcv_scores = self.ridge_path(self._ridge_param)
+            best = int(torch.argmin(self._gcv_scores).item())
+            self._selected_ridge_param = float(torch.as_tensor(self._ridge_param, dtype=torch.float64).view(-1)[best])
+            self.w_out = w_outs[best]
+        else:
+            # wout = (xTx + ridge * I)^(-1)xTy
+            self.w_out = self._solve(self.xTx, self.xTy, self._ridge_param).t().to(self._dtype)
+        # end if
+    # end finalize
+
+    # Quantize the output weights
+    def quantize(self, mode='int8'):
+        """
+        Quantize the trained output weights per output channel (int8 with one scale per output, or float16).
+        Wout is replaced by its quantized values and dequantized on the fly at inference, reset() goes back to float.
+        :param mode: Quantization mode (int8 or float16)
+        """
+        if self.training:
+            raise Exception("Only a trained output layer can be quantized, call finalize() first")
+        elif self._quantization is not None:
+            raise Exception("Output weights are already quantized ({})".format(self._quantization))
+        # end if
+        self.w_out, self.w_out_scale = quantize_per_channel(self.w_out, mode)
+        self._quantization = mode
+    # end quantize
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Accumulate rows of features and targets
+    def _accumulate_rows(self, x, y, time_length, n_samples):
+        """
+        Accumulate rows of features and targets into xTx and xTy
+        :param x: Features (batch size x time length x input dim)
+        :param y: Targets (batch size x time length x output dim)
+        :param time_length: Whole length of the samples (a chunk contributes 1 / time_length in averaged mode)
+        :param n_samples: Number of samples completed with these rows (counted in averaged mode)
+        """
+        # Add bias
+        if self._with_bias:
+            x = self._add_constant(x)
+        # end if
+
+        # All timesteps of all samples as rows
+        x = x.reshape(-1, self._x_size).to(self._accumulation_dtype)
+        y = y.reshape(-1, self._output_dim).to(self._accumulation_dtype)
+
+        # Add to covariance matrices
+        if not self._averaged:
+            self.xTx.data.add_(x.t().mm(x).data)
+            self.xTy.data.add_(x.t().mm(y).data)
+            self.yTy.data.add_((y * y).sum(0).data)
+        else:
+            self.xTx.data.add_((x.t().mm(x) / time_length).data)
+            self.xTy.data.add_((x.t().mm(y) / time_length).data)
+            self.yTy.data.add_(((y * y).sum(0) / time_length).data)
+            self._n_samples += float(n_samples)
+        # end if
+
+        # Number of rows seen
+        self._n_rows += int(x.size(0))
+    # end _accumulate_rows
+
+    # Pool a chunk of states over time
+    def _pool_chunk(self, x, time_length):
+        """
+        Pool a chunk of states over time, the chunks of a batch being given in order
+        :param x: States (batch size x chunk length x input dim)
+        :param time_length: Whole length of the samples
+        :return: Pooled features (batch size x 1 x pooled input dim) once the last chunk is there, None before
+        """
+        n_batches, chunk_length = x.size(0), x.size(1)
+
+        # First chunk of a batch
+        if self._pool_features is None:
+            n_pooled = len(self._pool_timesteps) if self._pool_timesteps is not None else 1
+            self._pool_features = x.new_zeros(n_batches, n_pooled, self._input_dim)
+            self._pool_position = 0
+        # end if
+
+        # Sum or states at the pooled timesteps
+        start = self._pool_position
+        if self._pool_timesteps is None:
+            self._pool_features[:, 0] += x.sum(1)
+        else:
+            for pool_i, t in enumerate(self._pool_timesteps):
+                t = t if t >= 0 else time_length + t
+                if t < 0 or t >= time_length:
+                    raise Exception("Pooled timestep {} out of a sequence of length {}".format(t, time_length))
+                elif start <= t < start + chunk_length:
+                    self._pool_features[:, pool_i] = x[:, t - start]
+                # end if
+            # end for
+        # end if
+        self._pool_position += chunk_length
+
+        # Last chunk
+        if self._pool_position >= time_length:
+            features = self._pool_features
+            if self._pool_timesteps is None:
+                features = features / time_length
+            # end if
+            self._pool_features = None
+            return features.reshape(n_batches, 1, -1)
+        else:
+            return None
+        # end if
+    # end _pool_chunk
+
+    # One target per sample
+    def _sample_targets(self, y):
+        """
+        One target per sample
+        :param y: Targets (batch size x output dim) or class labels (batch size)
+        :return: Targets (batch size x output dim)
+        """
+        if y.dim() == 1:
+            return torch.nn.functional.one_hot(y.long(), self._output_dim)
+        elif y.dim() == 2:
+            return y
+        else:
+            raise Exception("Expected one target or one class label per sample with pooling, got {}".format(y.size()))
+        # end if
+    # end _sample_targets
+
+    # Solve (xTx + ridge * I) W = xTy
+    def _solve(self, xTx, xTy, ridge_param):
+        """
+        Solve (xTx + ridge * I) W = xTy with the learning algorithm
+        :param xTx: Covariance matrix xTx
+        :param xTy: Cross-covariance matrix xTy
+        :param ridge_param: Ridge parameter
+        :return: W (input dim (+1 with bias) x output dim)
+        """
         # Eye
-        eye_I = torch.eye(self._input_dim + self._with_bias, dtype=self._dtype)
-        eye_I = eye_I.cuda() if self.xTx.is_cuda else eye_I
+        eye_I = torch.eye(self._x_size, dtype=xTx.dtype, device=xTx.device)
 
-        # We need to solve wout = (xTx)^(-1)xTy
         # Covariance matrix xTx
-        ridge_xTx = self.xTx + self._ridge_param * eye_I
+        ridge_xTx = xTx + ridge_param * eye_I
 
-        # Inverse / pinverse
+        # Inverse, factorization or decomposition
         if self._learning_algo == "inv":
-            inv_xTx = ridge_xTx.inverse()
+            return torch.mm(ridge_xTx.inverse(), xTy)
         elif self._learning_algo == "pinv":
-            inv_xTx = ridge_xTx.pinverse()
+            return torch.mm(ridge_xTx.pinverse(), xTy)
+        elif self._learning_algo == "cholesky":
+            L, info = torch.linalg.cholesky_ex(ridge_xTx)
+            if info.item() > 0:
+                raise Exception(
+                    "xTx + ridge_param * I is not positive definite, increase the ridge parameter or use another "
+                    "learning method"
+                )
+            # end if
+            return torch.cholesky_solve(xTy, L)
+        elif self._learning_algo == "solve":
+            return torch.linalg.solve(ridge_xTx, xTy)
+        elif self._learning_algo == "lstsq":
+            return torch.linalg.lstsq(ridge_xTx, xTy).solution
+        elif self._learning_algo == "eigh":
+            s, v = torch.linalg.eigh(xTx)
+            return torch.mm(v, v.t().mm(xTy) / (s.clamp(min=0.0) + ridge_param).unsqueeze(1))
         else:
             raise Exception("Unknown learning method {}".format(self._learning_algo))
         # end if
-
-        # wout = (xTx)^(-1)xTy
-        self.w_out = torch.mm(inv_xTx, self.xTy).t()
-
-        # Not in training mode anymore
-        self.train(False)
-    # end finalize
-
-    # endregion PUBLIC
-
-    # region PRIVATE
+    # end _solve
 
     # Add constant
     def _add_constant(self, x):
@@ -233,7 +535,8 @@ class RRCell(Node):
         """
         s = super(RRCell, self).extra_repr()
         s += (', ridge_param={_ridge_param}, with_bias={_with_bias}, '
-              'learning_algo={_learning_algo}, softmax_output={_softmax_output}, averaged={_averaged}')
+              'learning_algo={_learning_algo}, softmax_output={_softmax_output}, averaged={_averaged}, '
+              'pooling={_pooling}')
         return s.format(**self.__dict__)
     # end extra_repr
 
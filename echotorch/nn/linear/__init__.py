@@ -27,9 +27,11 @@ Created on 29th of October, 2019
 # Imports
 from .IncForgRRCell import IncForgRRCell
 from .IncRRCell import IncRRCell
+from .MultiHeadRRCell import MultiHeadRRCell
+from .RLSCell import RLSCell
 from .RRCell import RRCell
 
 # All
 __all__ = [
-    'IncForgRRCell', 'IncRRCell', 'RRCell'
+    'IncForgRRCell', 'IncRRCell', 'MultiHeadRRCell', 'RLSCell', 'RRCell'
 ]
@@ -154,8 +154,96 @@ class DeepESN(Node):
         self._n_layers += 1
     # end append_layer
 
+    # Train the output layer chunk by chunk
+    def fit(self, u, y, chunk_size=1000, reset_state=True):
+        """
+        Train the output layer chunk by chunk.
+        States of all layers are accumulated into the xTx and xTy matrices of the output layer as they are produced,
+        so memory does not grow with the length of the sequences. All layers run over the whole sequences, the washout
+        is applied to the output layer. Call finalize() afterwards, as with forward().
+        :param u: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim)
+        :param chunk_size: Number of timesteps computed at once
+        :param reset_state: Reset states before the sequences ? (a boolean, or one boolean per sample)
+        """
+        # Output layer must be in training mode
+        if not self.training:
+            raise Exception("fit() needs an output layer in training mode, call reset() first")
+        # end if
+
+        # Sizes
+        n_batches = int(u.size(0))
+        time_length = int(u.size(1))
+
+        # Initial states of each layer
+        layer_states = [reservoir._init_batch_hidden(n_batches, reset_state) for reservoir in self._reservoirs]
+
+        # For each chunk
+        for start in range(0, time_length, chunk_size):
+            end = min(start + chunk_size, time_length)
+
+            # States of all layers for the chunk
+            hidden_states = self._stream_layers(u[:, start:end], layer_states)
+
+            # Accumulate states after the washout
+            first = max(self._washout - start, 0)
+            if first < end - start:
+                self._output.accumulate(
+                    hidden_states[:, first:],
+                    y[:, start + first:end],
+                    time_length - self._washout,
+                    n_samples=n_batches if end == time_length else 0
+                )
+            # end if
+        # end for
+
+        # Last states
+        for layer_i in range(self._n_layers):
+            self._reservoirs[layer_i].hidden.data = layer_states[layer_i].data
+        # end for
+    # end fit
+
     # region PRIVATE
 
+    # Run all layers over a chunk
+    def _stream_layers(self, u, layer_states):
+        """
+        Run all layers over a chunk from the given states
+        :param u: Inputs (batch size x chunk length x input dim)
+        :param layer_states: States of each layer before the chunk, replaced by the states after the chunk
+        :return: States of all layers (batch size x chunk length x hidden dim * n layers)
+        """
+        # States of all layers, each layer writes into its own slice
+        chunk_states = torch.empty(
+            u.size(0), u.size(1), self._hidden_dim * self._n_layers, dtype=self._dtype, device=u.device
+        )
+
+        # Input to first layer
+        layer_input = u
+
+        # For each layer
+        for layer_i in range(self._n_layers):
+            # Inputs of the layer
+            if self._input_type == 'IA' and layer_i > 0:
+                layer_input = torch.cat((layer_input, u), dim=2)
+            elif self._input_type == 'GE':
+                layer_input = u
+            elif self._input_type not in ['IF', 'IA']:
+                raise Exception("Unknown input type : {}".format(self._input_type))
+            # end if
+
+            # Run layer, its slice is the input of the next layer
+            layer_input = self._reservoirs[layer_i].stream(
+                layer_input,
+                layer_states[layer_i],
+                out=chunk_states[:, :, layer_i * self._hidden_dim:(layer_i + 1) * self._hidden_dim]
+            )
+            layer_states[layer_i] = layer_input[:, -1].clone()
+        # end for
+
+        return chunk_states
+    # end _stream_layers
+
     # Get hyperparameter value
     def _get_hyperparam_value(self, hyperparam, layer_i):
         """
@@ -241,38 +329,43 @@ class DeepESN(Node):
         # Sizes
         time_length = int(u.size(1))
         batch_sizes = int(u.size(0))
+        washout = min(self._washout, time_length)
 
-        # Keep hidden states
-        hidden_states = torch.zeros(batch_sizes, time_length, self._hidden_dim * self._n_layers, dtype=self._dtype)
+        # Keep hidden states after the washout, each layer writes into its own slice
+        hidden_states = torch.empty(
+            batch_sizes, time_length - washout, self._hidden_dim * self._n_layers, dtype=self._dtype, device=u.device
+        )
 
         # Input to first layer
         layer_input = u
 
         # Compute hidden states for each layer
         for layer_i in range(self._n_layers):
-            # Feed ESN
-            if self._input_type == 'IF':
-                layer_hidden_states = self._reservoirs[layer_i](layer_input, reset_state=reset_state)
-                hidden_states[:, :, layer_i*self._hidden_dim:(layer_i+1)*self._hidden_dim] = layer_hidden_states
-                layer_input = layer_hidden_states
-            elif self._input_type == 'IA':
-                # Add inputs for upper layers
-                if layer_i > 0:
-                    layer_input_with_u = torch.cat((layer_input, u), dim=2)
-                else:
-                    layer_input_with_u = u
-                # end if
-
-                # Go through ESN cell
-                layer_hidden_states = self._reservoirs[layer_i](layer_input_with_u, reset_state=reset_state)
-                hidden_states[:, :, layer_i * self._hidden_dim:(layer_i + 1) * self._hidden_dim] = layer_hidden_states
-                layer_input = layer_hidden_states
+            # Inputs of the layer
+            if self._input_type == 'IA' and layer_i > 0:
+                layer_input = torch.cat((layer_input, u), dim=2)
             elif self._input_type == 'GE':
-                layer_hidden_states = self._reservoirs[layer_i](u, reset_state=reset_state)
-                hidden_states[:, :, layer_i * self._hidden_dim:(layer_i + 1) * self._hidden_dim] = layer_hidden_states
-            else:
+                layer_input = u
+            elif self._input_type not in ['IF', 'IA']:
                 raise Exception("Unknown input type : {}".format(self._input_type))
             # end if
+
+            # Slice of the layer
+            layer_states = hidden_states[:, :, layer_i * self._hidden_dim:(layer_i + 1) * self._hidden_dim]
+
+            # The next layer needs the states during the washout
+            if washout > 0 and self._input_type != 'GE' and layer_i < self._n_layers - 1:
+                layer_input = self._reservoirs[layer_i](layer_input, reset_state=reset_state, washout=0)
+                layer_states.copy_(layer_input[:, washout:])
+            else:
+                # Go through ESN cell, its slice is the input of the next layer
+                layer_input = self._reservoirs[layer_i](
+                    layer_input,
+                    reset_state=reset_state,
+                    out=layer_states,
+                    washout=washout
+                )
+            # end if
         # end for
 
         # Learning algo
@@ -29,21 +29,31 @@ import torch
 import torch.sparse
 from torch.autograd import Variable
 import echotorch.utils
-# from echotorch.viz import Observable
+from echotorch.viz import Observable
 from ..Node import Node
+from ..functional.quantization import quantize_per_channel, quantized_linear
+from ..functional.reservoir import esn_recurrence, structured_esn_recurrence
+from ..utils.NoiseGenerator import NoiseGenerator
 
 
 # Echo State Network layer
 # Basis cell for ESN.
-class ESNCell(Node):
+class ESNCell(Node, Observable):
     """
     Echo State Network layer
     Basis cell for ESN
     """
 
+    # Sparse storage: maximum ratio of non-zero weights in Win to store it sparse too
+    SPARSE_DENSITY = 0.05
+
+    # Structured storage: maximum number of weights per row
+    STRUCTURED_MAX_PER_ROW = 4
+
     # Constructor
     def __init__(self, input_dim, output_dim, w, w_in, w_bias, input_scaling=1.0, nonlin_func=torch.tanh, washout=0,
-                 noise_generator=None, debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
+                 noise_generator=None, sparse=False, structured=False, fast_path=None, debug=Node.NO_DEBUG,
+                 test_case=None, dtype=torch.float32):
         """
         Constructor
         :param input_dim: Input dimension
@@ -54,7 +64,17 @@ class ESNCell(Node):
         :param w_bias: Internal units bias vector Wbias
         :param nonlin_func: Non-linear function applied to the units
         :param washout: Period to ignore in training at the beginning
-        :param noise_generator: Noise generator used to add noise to states before non-linearity
+        :param noise_generator: Noise added to states before non-linearity, a NoiseGenerator (drawn in bulk) or a
+        function of the reservoir size (called for each timestep and each sample)
+        :param sparse: Store W (and Win if less than SPARSE_DENSITY of its weights are non-zero) as CSR sparse
+        matrices, for large reservoirs with few connections. State dicts keep the storage of the cell and load into
+        cells with another storage.
+        :param structured: Store W as its few non-zero weights per row (cycles, cycles with jumps, delay lines,
+        permutation plus diagonal) and compute the recurrence with gathers in O(N). W must have at most
+        STRUCTURED_MAX_PER_ROW non-zero weights per row. Reading w then gives a dense copy (changing it in place has no
+        effect), assigning w stores the new matrix's structure.
+        :param fast_path: Use the fused recurrence when no hooks, filters or noise are active (None), always (True) or
+        never (False).
         :param debug: Debug mode
         :param test_case: Test case to call for test.
         :param dtype: Data type used for vectors/matrices.
@@ -69,23 +89,41 @@ class ESNCell(Node):
         )
 
         # Init. Observable super-class
-        # Observable.__init__(self)
+        Observable.__init__(self)
 
         # Params
         self._input_scaling = input_scaling
         self._nonlin_func = nonlin_func
         self._washout = washout
         self._noise_generator = noise_generator
+        self._fast_path = fast_path
         self._dtype = dtype
 
+        # Structured storage
+        w_structure = self._w_structure(w) if structured else None
+
+        # Sparse or dense storage
+        sparse = sparse and w_structure is None
+
         # Init hidden state
         self.register_buffer('hidden', self._init_hidden())
 
         # Initialize input weights
+        if sparse and ESNCell.density(w_in) < ESNCell.SPARSE_DENSITY:
+            w_in = w_in.to_sparse_csr()
+        # end if
         self.register_buffer('w_in', Variable(w_in, requires_grad=False))
-
-        # Initialize reservoir weights randomly
-        self.register_buffer('w', Variable(w, requires_grad=False))
+        self.register_buffer('w_in_scale', None)
+        self._input_quantization = None
+
+        # Initialize reservoir weights (None if W is only stored as its structure)
+        if w_structure is not None:
+            self.register_buffer('w', None)
+            self.register_buffer('w_index', w_structure[0])
+            self.register_buffer('w_values', w_structure[1])
+        else:
+            self.register_buffer('w', Variable(w.to_sparse_csr() if sparse else w, requires_grad=False))
+        # end if
 
         # Initialize bias
         self.register_buffer('w_bias', Variable(w_bias, requires_grad=False))
@@ -120,6 +158,46 @@ class ESNCell(Node):
         self._washout = washout
     # end washout
 
+    # Fast path mode
+    @property
+    def fast_path(self):
+        """
+        Fast path mode
+        :return: None (automatic), True (always fused) or False (always general loop)
+        """
+        return self._fast_path
+    # end fast_path
+
+    # Set fast path mode
+    @fast_path.setter
+    def fast_path(self, fast_path):
+        """
+        Set fast path mode
+        :param fast_path: None (automatic), True (always fused) or False (always general loop)
+        """
+        self._fast_path = fast_path
+    # end fast_path
+
+    # W is stored as a sparse matrix ?
+    @property
+    def is_sparse(self):
+        """
+        W is stored as a sparse matrix ?
+        :return: True if W is a CSR sparse matrix
+        """
+        return not self.is_structured and self.w.layout == torch.sparse_csr
+    # end is_sparse
+
+    # W is stored as its structure ?
+    @property
+    def is_structured(self):
+        """
+        W is stored as its structure ?
+        :return: True if W is stored as its non-zero weights per row
+        """
+        return self._buffers['w'] is None
+    # end is_structured
+
     # Get W's spectral radius
     @property
     def spectral_radius(self):
@@ -127,6 +205,9 @@ class ESNCell(Node):
         Get W's spectral radius
         :return: W's spectral radius
         """
+        if self.is_structured:
+            return echotorch.utils.spectral_radius(self._structured_w(torch.sparse_csr))
+        # end if
         return echotorch.utils.spectral_radius(self.w)
     # end spectral_radius
 
@@ -137,7 +218,11 @@ class ESNCell(Node):
         Change spectral radius
         :param sp: New spectral radius
         """
-        self.w *= sp / echotorch.utils.spectral_radius(self.w)
+        if self.is_structured:
+            self.w_values = self.w_values * (sp / self.spectral_radius)
+        else:
+            self.w = self.w * (sp / echotorch.utils.spectral_radius(self.w))
+        # end if
     # end spectral_radius
 
     # Get input scaling
@@ -160,10 +245,36 @@ class ESNCell(Node):
         return self._nonlin_func
     # end nonlin_func
 
+    # Input weights quantization
+    @property
+    def input_quantization(self):
+        """
+        Input weights quantization
+        :return: None (float weights), int8 or float16
+        """
+        return self._input_quantization
+    # end input_quantization
+
     # endregion PROPERTIES
 
     # region PUBLIC
 
+    # Quantize the input weights
+    def quantize_inputs(self, mode='int8'):
+        """
+        Quantize the input weights Win per reservoir unit (int8 with one scale per unit, or float16).
+        Win is replaced by its quantized values and dequantized on the fly in the input layer.
+        :param mode: Quantization mode (int8 or float16)
+        """
+        if self._input_quantization is not None:
+            raise Exception("Input weights are already quantized ({})".format(self._input_quantization))
+        elif self.w_in.layout == torch.sparse_csr:
+            raise Exception("Sparse input weights cannot be quantized")
+        # end if
+        self.w_in, self.w_in_scale = quantize_per_channel(self.w_in, mode)
+        self._input_quantization = mode
+    # end quantize_inputs
+
     # Reset hidden layer
     def reset_hidden(self):
         """
@@ -184,12 +295,20 @@ class ESNCell(Node):
     # end set_hidden
 
     # Forward
-    def forward(self, u, reset_state=True):
-        """
-        Forward pass function
-        :param u: Input signal
-        :param reset_state: Reset state at each batch ?
-        :return: Resulting hidden states
+    def forward(self, u, reset_state=True, out=None, washout=None):
+        """
+        Forward pass function.
+        All samples of the batch are advanced in lockstep with a (batch, reservoir) hidden state, and only the states
+        after the washout are stored.
+        :param u: Input signal (batch size x time length x input dim)
+        :param reset_state: Reset state at each batch ? (a boolean, or one boolean per sample). Without reset, each
+        sample continues from the last state of the sample at the same position in the previous batch if the batch
+        size did not change, and from the last state of the last sample otherwise. Samples of a batch are not chained
+        (sample b does not start from the end of sample b - 1).
+        :param out: Tensor (or view) where the states after the washout are written
+        (batch size x time length - washout x reservoir size), or None to allocate it
+        :param washout: Washout for this call, or None for the washout of the cell
+        :return: Resulting hidden states (batch size x time length - washout x reservoir size)
         """
         # Time length
         time_length = int(u.size()[1])
@@ -197,30 +316,213 @@ class ESNCell(Node):
         # Number of batches
         n_batches = int(u.size()[0])
 
-        # Outputs
-        outputs = Variable(torch.zeros(n_batches, time_length, self.output_dim, dtype=self.dtype))
-        outputs = outputs.cuda() if self.hidden.is_cuda else outputs
+        # Washout
+        washout = self._washout if washout is None else washout
+        washout = min(washout, time_length)
+
+        # Initial states for each sample
+        self.hidden.data = self._init_batch_hidden(n_batches, reset_state).data
 
         # For each sample
         for b in range(n_batches):
-            # Reset hidden layer
-            if reset_state:
-                self.reset_hidden()
-            # end if
-
             # Pre-update hook
             u[b, :] = self._pre_update_hook(u[b, :], self._forward_calls, b)
 
             # Observe inputs
             self.observation_point('U', u[b, :])
+        # end for
+
+        # Post-update hooks need the states of the whole sequence
+        if type(self)._post_update_hook is not Node._post_update_hook:
+            outputs = self._states(u)
+            for b in range(n_batches):
+                outputs[b, :] = self._post_update_hook(outputs[b, :], u[b, :], self._forward_calls, b)
+            # end for
+            outputs = outputs[:, washout:] if out is None else out.copy_(outputs[:, washout:])
+        else:
+            outputs = self._states(u, washout, out)
+        # end if
+
+        # For each sample
+        for b in range(n_batches):
+            # Post states update handlers
+            for handler in self._post_states_update_handlers:
+                handler(outputs[b], u[b, washout:], self._forward_calls, b)
+            # end for
+
+            # Observe states
+            self.observation_point('X', outputs[b])
+        # end for
+
+        # Count calls to forward
+        self._forward_calls += 1
+
+        return outputs
+    # end forward
+
+    # Run the recurrence from given states
+    def stream(self, u, x, out=None):
+        """
+        Run the recurrence from given states.
+        Used to push chunks of live streams: there is no washout, sequence-level hooks and observation points are
+        not called, and the hidden state of the cell is left untouched.
+        :param u: Inputs (n streams x chunk length x input dim)
+        :param x: States of the streams before the chunk (n streams x reservoir size)
+        :param out: Tensor (or view) where the states are written, or None to allocate it
+        :return: States (n streams x chunk length x reservoir size)
+        """
+        # Keep hidden state of the cell
+        last_hidden = self.hidden.data
+        self.hidden.data = x.data.clone()
+
+        # Compute states
+        try:
+            outputs = self._states(u, out=out)
+        finally:
+            self.hidden.data = last_hidden
+        # end try
+
+        return outputs
+    # end stream
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # Compute the states of a sequence from the current hidden states
+    def _states(self, u, washout=0, out=None):
+        """
+        Compute the states of a sequence from the current hidden states
+        :param u: Inputs (batch size x time length x input dim)
+        :param washout: Number of first states not stored
+        :param out: Tensor (or view) where the states after the washout are written, or None to allocate it
+        :return: States after the washout (batch size x time length - washout x reservoir size)
+        """
+        # Do we need to call step hooks for each sample ?
+        step_hooks = self._has_step_hooks()
+
+        # Noise for the whole sequence
+        noise = self._noise_block(int(u.size(0)), int(u.size(1)))
+
+        # Input pre-projection for the whole sequence (None if the input layer must be computed step by step)
+        inputs_win = self._input_projection(u)
+        if inputs_win is not None and noise is not None:
+            inputs_win = inputs_win + noise
+        # end if
+
+        # Fused recurrence or general loop
+        if self._use_fast_path(step_hooks, inputs_win):
+            return self._fused_layer(inputs_win, washout, out)
+        else:
+            return self._general_layer(u, inputs_win, step_hooks, noise, washout, out)
+        # end if
+    # end _states
+
+    # Can the fused recurrence be used ?
+    def _use_fast_path(self, step_hooks, inputs_win):
+        """
+        Can the fused recurrence be used ?
+        The fused recurrence needs pre-projected inputs (noise included), a dense or structured W with the default
+        recurrent and reservoir layers, a tanh non-linearity, a leaky post-nonlinearity and no step hooks or neural
+        filters.
+        :param step_hooks: Step hooks or neural filters are active ?
+        :param inputs_win: Projected inputs, or None if the input layer is computed at each step
+        :return: True if the fused recurrence is used
+        """
+        # Forced general loop
+        if self._fast_path is False:
+            return False
+        # end if
+
+        # Fused recurrence possible ?
+        fusable = not step_hooks and inputs_win is not None and \
+            self._nonlin_func is torch.tanh and not self.is_sparse and \
+            type(self)._recurrent_layer is ESNCell._recurrent_layer and not self._has_custom_reservoir_layer() and \
+            self._fused_leaky_rate() is not None
+
+        # Forced but not possible
+        if self._fast_path is True and not fusable:
+            raise Exception("Fast path forced but hooks, neural filters or a custom layer are active")
+        # end if
+
+        return fusable
+    # end _use_fast_path
+
+    # Leaky rate of the post-nonlinearity for the fused recurrence
+    def _fused_leaky_rate(self):
+        """
+        Leaky rate of the post-nonlinearity for the fused recurrence
+        :return: Leaky rate, or None if the post-nonlinearity cannot be fused
+        """
+        if type(self)._post_nonlinearity is ESNCell._post_nonlinearity:
+            return 1.0
+        # end if
+        return None
+    # end _fused_leaky_rate
+
+    # Compute all states with the fused recurrence
+    def _fused_layer(self, inputs_win, washout=0, out=None):
+        """
+        Compute all states with the fused recurrence
+        :param inputs_win: Projected inputs with bias (batch size x time length x reservoir size)
+        :param washout: Number of first states not stored
+        :param out: Tensor (or view) where the states after the washout are written, or None to allocate it
+        :return: States after the washout (batch size x time length - washout x reservoir size)
+        """
+        if self.is_structured:
+            outputs, last_states = structured_esn_recurrence(
+                inputs_win, self.w_index, self.w_values, self.hidden, float(self._fused_leaky_rate()), washout, out
+            )
+        else:
+            outputs, last_states = esn_recurrence(
+                inputs_win, self.w, self.hidden, float(self._fused_leaky_rate()), washout, out
+            )
+        # end if
+
+        # New last states
+        self.hidden.data = last_states.data
+
+        return outputs
+    # end _fused_layer
+
+    # Compute all states step by step with hooks, filters and noise
+    def _general_layer(self, u, inputs_win, step_hooks, noise=None, washout=0, out=None):
+        """
+        Compute all states step by step with hooks, filters and noise
+        :param u: Inputs (batch size x time length x input dim)
+        :param inputs_win: Projected inputs with bias and noise, or None if the input layer is computed at each step
+        :param step_hooks: Call step hooks and neural filters ?
+        :param noise: Noise added before the non-linearity when the input layer is computed at each step
+        :param washout: Number of first states not stored
+        :param out: Tensor (or view) where the states after the washout are written, or None to allocate it
+        :return: States after the washout (batch size x time length - washout x reservoir size)
+        """
+        n_batches, time_length = int(u.size(0)), int(u.size(1))
+
+        # Outputs after the washout
+        if out is None:
+            outputs = Variable(
+                torch.zeros(n_batches, max(time_length - washout, 0), self.output_dim, dtype=self.dtype)
+            )
+            outputs = outputs.cuda() if self.hidden.is_cuda else outputs
+        else:
+            outputs = out
+        # end if
 
-            # For each steps
-            for t in range(time_length):
-                # Current input
-                ut = u[b, t] * self._input_scaling
+        # For each steps
+        for t in range(time_length):
+            # Current inputs
+            ut = u[:, t] * self._input_scaling
 
+            # Inputs already projected ?
+            if inputs_win is None:
                 # Pre-hook
-                ut = self._pre_step_update_hook(ut, self._forward_calls, b, t)
+                if step_hooks:
+                    ut = torch.stack(
+                        [self._pre_step_update_hook(ut[b], self._forward_calls, b, t) for b in range(n_batches)],
+                        dim=0
+                    )
+                # end if
 
                 # Compute input layer
                 u_win = self._input_layer(ut)
@@ -231,48 +533,37 @@ class ESNCell(Node):
                 # Add everything
                 x = self._reservoir_layer(u_win, x_w)
 
-                # Apply activation function
-                x = self.nonlin_func(x)
-
-                # Post nonlinearity
-                x = self._post_nonlinearity(x)
-
-                # Post-hook
-                x = self._post_step_update_hook(x.view(self.output_dim), ut, self._forward_calls, b, t)
-
-                # Neural filter
-                for neural_filter_handler in self._neural_filter_handlers:
-                    x = neural_filter_handler(x, ut, self._forward_calls, b, t, t < self._washout)
+                # Add noise
+                if noise is not None:
+                    x = x + noise[:, t]
                 # end if
+            else:
+                # Apply W to x and add projected inputs (with bias and noise)
+                x = inputs_win[:, t] + self._recurrent_layer(self.hidden)
+            # end if
 
-                # New last state
-                self.hidden.data = x.data
+            # Apply activation function
+            x = self.nonlin_func(x)
 
-                # Add to outputs
-                outputs[b, t] = self.hidden
-            # end for
+            # Post nonlinearity
+            x = self._post_nonlinearity(x)
 
-            # Post-update hook
-            outputs[b, :] = self._post_update_hook(outputs[b, :], u[b, :], self._forward_calls, b)
+            # Post-hook and neural filters
+            if step_hooks:
+                x = torch.stack([self._step_filters(x[b], ut[b], b, t) for b in range(n_batches)], dim=0)
+            # end if
 
-            # Post states update handlers
-            for handler in self._post_states_update_handlers:
-                handler(outputs[b, self._washout:], u[b, self._washout:], self._forward_calls, b)
-            # end for
+            # New last states
+            self.hidden.data = x.data
 
-            # Observe states
-            self.observation_point('X', outputs[b, self._washout:])
+            # Add to outputs
+            if t >= washout:
+                outputs[:, t - washout] = self.hidden
+            # end if
         # end for
 
-        # Count calls to forward
-        self._forward_calls += 1
-
-        return outputs[:, self._washout:]
-    # end forward
-
-    # endregion PUBLIC
-
-    # region PRIVATE
+        return outputs
+    # end _general_layer
 
     # Compute post nonlinearity hook
     def _post_nonlinearity(self, x):
@@ -288,37 +579,145 @@ class ESNCell(Node):
     def _reservoir_layer(self, u_win, x_w):
         """
         Compute reservoir layer
-        :param u_win: Processed inputs
-        :param x_w: Processed states
+        :param u_win: Processed inputs (batch size x reservoir size)
+        :param x_w: Processed states (batch size x reservoir size)
         :return: States before non-linearity
         """
+        return u_win + x_w + self.w_bias
+    # end _reservoir_layer
+
+    # Is the reservoir layer overridden ?
+    def _has_custom_reservoir_layer(self):
+        """
+        Is the reservoir layer overridden ?
+        Pre-projected inputs skip _reservoir_layer, so a subclass overriding it needs the step by step loop.
+        :return: True if a subclass overrides _reservoir_layer
+        """
+        return type(self)._reservoir_layer is not ESNCell._reservoir_layer
+    # end _has_custom_reservoir_layer
+
+    # Noise added to states before non-linearity
+    def _noise_block(self, n_batches, time_length):
+        """
+        Noise added to states before non-linearity, for a whole sequence.
+        A NoiseGenerator draws the whole block at once, other noise generator functions are called for each sample and
+        each timestep, sample by sample as in the per-sample loop (all timesteps of sample 0, then of sample 1, ...).
+        :param n_batches: Batch size
+        :param time_length: Time length
+        :return: Noise (batch size x time length x reservoir size), or None without noise generator
+        """
         if self._noise_generator is None:
-            return u_win + x_w + self.w_bias
+            return None
+        elif isinstance(self._noise_generator, NoiseGenerator):
+            noise = self._noise_generator.sample_sequence(n_batches, time_length, self._output_dim)
         else:
-            return u_win + x_w + self.w_bias + self._noise_generator(self._output_dim)
+            noise = torch.stack(
+                [
+                    torch.stack([self._noise_generator(self._output_dim) for _ in range(time_length)], dim=0)
+                    for _ in range(n_batches)
+                ],
+                dim=0
+            ) if time_length > 0 and n_batches > 0 else torch.zeros(n_batches, time_length, self._output_dim)
         # end if
-    # end _reservoir_layer
+        return noise.to(device=self.hidden.device, dtype=self.dtype)
+    # end _noise_block
 
     # Compute recurrent layer
     def _recurrent_layer(self, xt):
         """
         Compute recurrent layer
-        :param xt: Reservoir state at t-1
-        :return: Processed state
-        """
-        return self.w.mv(self.hidden)
+        :param xt: Reservoir states at t-1 (batch size x reservoir size)
+        :return: Processed states
+        """
+        if self.is_structured:
+            n_weights, n_units = self.w_index.size()
+            return (xt.index_select(1, self.w_index.view(-1)).view(-1, n_weights, n_units) * self.w_values).sum(1)
+        elif self.w.layout == torch.sparse_csr:
+            return torch.sparse.mm(self.w, xt.t()).t()
+        else:
+            return xt.mm(self.w.t())
+        # end if
     # end _recurrent_layer
 
     # Compute input layer
     def _input_layer(self, ut):
         """
         Compute input layer
-        :param ut: Inputs
+        :param ut: Inputs (batch size x input dim)
         :return: Processed inputs
         """
-        return self.w_in.mv(ut)
+        if self._input_quantization is not None:
+            return quantized_linear(ut, self.w_in, self.w_in_scale)
+        elif self.w_in.layout == torch.sparse_csr:
+            return torch.sparse.mm(self.w_in, ut.t()).t()
+        else:
+            return ut.mm(self.w_in.t())
+        # end if
     # end _input_layer
 
+    # Input pre-projection for a whole sequence
+    def _input_projection(self, u):
+        """
+        Input pre-projection for a whole sequence.
+        Subclasses which override _input_layer must override this method to enable the pre-projection.
+        :param u: Inputs (batch size x time length x input dim)
+        :return: Projected inputs with bias (batch size x time length x reservoir size), or None if the input and
+        reservoir layers have to be computed at each timestep.
+        """
+        if type(self)._input_layer is not ESNCell._input_layer or self._has_custom_reservoir_layer() or \
+                type(self)._pre_step_update_hook is not Node._pre_step_update_hook:
+            return None
+        # end if
+        return self._project_inputs(u)
+    # end _input_projection
+
+    # Compute u * Win^T + Wbias for a whole sequence in one matrix product
+    def _project_inputs(self, u):
+        """
+        Compute u * Win^T + Wbias for a whole sequence in one matrix product
+        :param u: Inputs (batch size x time length x input dim)
+        :return: Projected inputs (batch size x time length x reservoir size)
+        """
+        n_batches, time_length = u.size(0), u.size(1)
+        u_scaled = (u * self._input_scaling).reshape(n_batches * time_length, -1)
+        if self._input_quantization is not None:
+            inputs_win = quantized_linear(u_scaled, self.w_in, self.w_in_scale, bias=self.w_bias)
+        elif self.w_in.layout == torch.sparse_csr:
+            inputs_win = torch.sparse.mm(self.w_in, u_scaled.t()).t() + self.w_bias
+        else:
+            inputs_win = torch.addmm(self.w_bias, u_scaled, self.w_in.t())
+        # end if
+        return inputs_win.reshape(n_batches, time_length, self.output_dim)
+    # end _project_inputs
+
+    # Build W from its structure
+    def _structured_w(self, layout=torch.strided):
+        """
+        Build W from its structure
+        :param layout: torch.strided (dense) or torch.sparse_csr
+        :return: W (reservoir size x reservoir size)
+        """
+        return ESNCell.unstructure(self.w_index, self.w_values, layout)
+    # end _structured_w
+
+    # Structure of W for structured storage
+    def _w_structure(self, w):
+        """
+        Structure of W for structured storage
+        :param w: Reservoir matrix
+        :return: (index, values) tensors (weights per row x reservoir size)
+        """
+        w_structure = ESNCell.structure(w, ESNCell.STRUCTURED_MAX_PER_ROW)
+        if w_structure is None:
+            raise Exception(
+                "Structured storage needs at most {} non-zero weights per row in W".format(
+                    ESNCell.STRUCTURED_MAX_PER_ROW
+                )
+            )
+        # end if
+        return w_structure
+    # end _w_structure
+
     # Init hidden layer
     def _init_hidden(self):
         """
@@ -328,10 +727,209 @@ class ESNCell(Node):
         return Variable(torch.zeros(self.output_dim, dtype=self.dtype), requires_grad=False)
     # end _init_hidden
 
+    # Initial hidden states for a batch
+    def _init_batch_hidden(self, n_batches, reset_state):
+        """
+        Initial hidden states for a batch.
+        Samples not reset continue from the last state of the same row of the previous batch, or from the last state of
+        its last sample if the batch size changed.
+        :param n_batches: Number of samples in the batch
+        :param reset_state: Reset state ? (a boolean, or one boolean per sample)
+        :return: Initial states (batch size x reservoir size)
+        """
+        # Last states, one per sample if the batch size did not change
+        last_hidden = self.hidden.view(-1, self.output_dim)
+        if last_hidden.size(0) != n_batches:
+            last_hidden = last_hidden[-1].expand(n_batches, self.output_dim)
+        # end if
+
+        # Reset all, none, or some samples
+        if isinstance(reset_state, bool):
+            if reset_state:
+                return torch.zeros_like(last_hidden)
+            else:
+                return last_hidden.clone()
+            # end if
+        else:
+            reset_mask = torch.as_tensor(reset_state, dtype=torch.bool, device=last_hidden.device).expand(n_batches)
+            return last_hidden.masked_fill(reset_mask.view(n_batches, 1), 0.0)
+        # end if
+    # end _init_batch_hidden
+
+    # Are step hooks or neural filters active ?
+    def _has_step_hooks(self):
+        """
+        Are step hooks or neural filters active ?
+        :return: True if per-sample step hooks have to be called
+        """
+        return type(self)._pre_step_update_hook is not Node._pre_step_update_hook or \
+            type(self)._post_step_update_hook is not Node._post_step_update_hook or \
+            len(self._neural_filter_handlers) > 0
+    # end _has_step_hooks
+
+    # Apply post-step hook and neural filters to one sample
+    def _step_filters(self, x, ut, sample_i, t):
+        """
+        Apply post-step hook and neural filters to one sample
+        :param x: Reservoir state of the sample at time t
+        :param ut: Input of the sample at time t
+        :param sample_i: Position of the sample in the batch
+        :param t: Timestep
+        :return: Filtered state
+        """
+        # Post-hook
+        x = self._post_step_update_hook(x.view(self.output_dim), ut, self._forward_calls, sample_i, t)
+
+        # Neural filter
+        for neural_filter_handler in self._neural_filter_handlers:
+            x = neural_filter_handler(x, ut, self._forward_calls, sample_i, t, t < self._washout)
+        # end for
+
+        return x
+    # end _step_filters
+
     # endregion PRIVATE
 
+    # region STATIC
+
+    # Ratio of non-zero elements in a matrix
+    @staticmethod
+    def density(m):
+        """
+        Ratio of non-zero elements in a matrix
+        :param m: Matrix (dense or sparse)
+        :return: Density in [0, 1]
+        """
+        if m.layout != torch.strided:
+            return m._nnz() / float(m.numel())
+        else:
+            return torch.count_nonzero(m).item() / float(m.numel())
+        # end if
+    # end density
+
+    # Non-zero weights of each row of a matrix
+    @staticmethod
+    def structure(m, max_per_row):
+        """
+        Non-zero weights of each row of a matrix, as (index, values) with
+        m[i, index[j, i]] = values[j, i], rows with fewer weights being padded with zero values.
+        :param m: Square dense matrix
+        :param max_per_row: Maximum number of non-zero weights per row
+        :return: (index, values) tensors (weights per row x size), or None if a row has more than max_per_row weights
+        """
+        # Non-zero weights and their maximum per row
+        if m.layout != torch.strided:
+            m = m.to_dense()
+        # end if
+        non_zero = m != 0
+        n_weights = max(int(non_zero.sum(dim=1).max().item()) if m.numel() > 0 else 0, 1)
+        if n_weights > max_per_row:
+            return None
+        # end if
+
+        # Columns of the non-zero weights first in each row
+        index = torch.argsort((~non_zero).to(torch.int8), dim=1, stable=True)[:, :n_weights]
+        return index.t().contiguous(), m.gather(1, index).t().contiguous()
+    # end structure
+
+    # Matrix from its non-zero weights per row
+    @staticmethod
+    def unstructure(index, values, layout=torch.strided):
+        """
+        Matrix from its non-zero weights per row, the inverse of structure()
+        :param index: Columns of the weights (weights per row x size)
+        :param values: Weights (weights per row x size)
+        :param layout: torch.strided (dense) or torch.sparse_csr
+        :return: Square matrix (size x size)
+        """
+        n_weights, n_units = index.size()
+        rows = torch.arange(n_units, device=index.device).repeat(n_weights)
+        m = torch.sparse_coo_tensor(
+            torch.stack((rows, index.reshape(-1)), dim=0),
+            values.reshape(-1),
+            (n_units, n_units)
+        ).coalesce()
+        return m.to_sparse_csr() if layout == torch.sparse_csr else m.to_dense()
+    # end unstructure
+
+    # endregion STATIC
+
     # region OVERRIDE
 
+    # Get attribute, W is densified on demand if stored as its structure
+    def __getattr__(self, name):
+        """
+        Get attribute, W is densified on demand if stored as its structure
+        :param name: Attribute name
+        :return: Attribute value
+        """
+        if name == 'w' and '_buffers' in self.__dict__ and 'w_index' in self._buffers and self._buffers['w'] is None:
+            return self._structured_w()
+        # end if
+        return super(ESNCell, self).__getattr__(name)
+    # end __getattr__
+
+    # Set attribute, assigning W to a structured cell stores its structure
+    def __setattr__(self, name, value):
+        """
+        Set attribute, assigning W to a structured cell stores its structure
+        :param name: Attribute name
+        :param value: Value
+        """
+        if name == 'w' and '_buffers' in self.__dict__ and 'w_index' in self._buffers and self._buffers['w'] is None:
+            self.w_index, self.w_values = self._w_structure(value)
+        else:
+            super(ESNCell, self).__setattr__(name, value)
+        # end if
+    # end __setattr__
+
+    # Load hidden states of any batch size, and W and Win saved with another storage
+    def _load_from_state_dict(self, state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys,
+                              error_msgs):
+        """
+        Load the hidden states of any batch size (forward leaves one row per sample of the last batch), and W and Win
+        from a state dict saved with another storage (dense or sparse W, or W's structure)
+        :param state_dict: State dict
+        :param prefix: Prefix of this module's keys
+        """
+        # Hidden states of the last batch (batch size x reservoir size), or of a cell not run yet (reservoir size)
+        hidden = state_dict.get(prefix + 'hidden')
+        if hidden is not None and hidden.size() != self.hidden.size():
+            self.hidden = torch.empty_like(hidden, dtype=self.hidden.dtype, device=self.hidden.device)
+        # end if
+
+        # W stored as a matrix or as its structure
+        w_key, index_key, values_key = prefix + 'w', prefix + 'w_index', prefix + 'w_values'
+        if self.is_structured and w_key in state_dict:
+            # Structure of the saved W
+            self.w_index, self.w_values = self._w_structure(state_dict.pop(w_key))
+            state_dict[index_key], state_dict[values_key] = self.w_index, self.w_values
+        elif self.is_structured and index_key in state_dict:
+            # The saved structure may have another number of weights per row
+            self.w_index = torch.empty_like(state_dict[index_key])
+            self.w_values = torch.empty_like(state_dict[values_key])
+        elif not self.is_structured and index_key in state_dict:
+            # W from the saved structure
+            state_dict[w_key] = ESNCell.unstructure(
+                state_dict.pop(index_key), state_dict.pop(values_key), self.w.layout
+            )
+        # end if
+
+        # Dense or sparse W and Win saved with the other layout, or another number of non-zero weights
+        for name in ('w', 'w_in'):
+            buffer, saved = self._buffers[name], state_dict.get(prefix + name)
+            if buffer is not None and saved is not None and buffer.layout == torch.sparse_csr:
+                self._buffers[name] = saved.to_sparse_csr()
+                state_dict[prefix + name] = self._buffers[name]
+            elif buffer is not None and saved is not None and saved.layout != torch.strided:
+                state_dict[prefix + name] = saved.to_dense()
+            # end if
+        # end for
+        super(ESNCell, self)._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+        )
+    # end _load_from_state_dict
+
     # Extra-information
     def extra_repr(self):
         """
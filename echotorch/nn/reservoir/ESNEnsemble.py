@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/reservoir/ESNEnsemble.py
+# Description : An ensemble of Echo State Networks run together.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+"""
+Created on 16 October 2026
+@author: Nils Schaetti
+"""
+
+# Imports
+import torch
+import torch.nn as nn
+from echotorch.nn.linear.RRCell import RRCell
+from ..Node import Node
+from ..functional.reservoir import ensemble_recurrence
+
+
+# Ensemble of Echo State Networks
+class ESNEnsemble(Node):
+    """
+    Ensemble of K leaky-integrated Echo State Networks with their own W, Win, Wbias, leaky rate, input scaling
+    and ridge regression output layer. All reservoirs are advanced with one batched matrix product per timestep.
+    Reservoirs of different sizes are padded with units which stay at zero.
+    """
+
+    # Constructor
+    def __init__(self, input_dim, output_dim, w, w_in, w_bias, leaky_rate=1.0, input_scaling=1.0, ridge_param=0.0,
+                 with_bias=True, learning_algo='inv', softmax_output=False, normalize_output=False, washout=0,
+                 debug=Node.NO_DEBUG, test_case=None, dtype=torch.float32):
+        """
+        Constructor
+        :param input_dim: Input dimension
+        :param output_dim: Output dimension
+        :param w: Internal weight matrices (K x N x N tensor, or list of K square matrices)
+        :param w_in: Input-internal weight matrices (K x N x input dim tensor, or list of K matrices)
+        :param w_bias: Internal units bias vectors (K x N tensor, or list of K vectors)
+        :param leaky_rate: Leaky rate (one value, or one per reservoir)
+        :param input_scaling: Input scaling (one value, or one per reservoir)
+        :param ridge_param: Ridge parameter of the output layers (one value, or one per reservoir)
+        :param with_bias: Add a bias to the output layers ?
+        :param learning_algo: Learning method of the output layers (inv, pinv, cholesky, solve, lstsq, eigh)
+        :param softmax_output: Add a softmax output layer
+        :param normalize_output: Normalize outputs to sum to one
+        :param washout: Washout period (ignore timesteps at the beginning of each sample)
+        :param debug: Debug mode
+        :param test_case: Test case to call for test
+        :param dtype: Data type
+        """
+        super(ESNEnsemble, self).__init__(
+            input_dim=input_dim,
+            output_dim=output_dim,
+            debug=debug,
+            test_case=test_case,
+            dtype=dtype
+        )
+
+        # Size of each reservoir
+        self._sizes = [int(w_k.size(0)) for w_k in w]
+        self._n_members = len(self._sizes)
+        self._hidden_dim = max(self._sizes)
+        self._washout = washout
+
+        # Stacked matrices
+        self.register_buffer('w', self._stack(w, (self._hidden_dim, self._hidden_dim)))
+        self.register_buffer('w_in', self._stack(w_in, (self._hidden_dim, input_dim)))
+        self.register_buffer('w_bias', self._stack(w_bias, (self._hidden_dim,)))
+        self.register_buffer('leaky_rates', self._per_member(leaky_rate))
+        self.register_buffer('input_scalings', self._per_member(input_scaling))
+
+        # Hidden states (K x batch size x N)
+        self.register_buffer('hidden', torch.zeros(self._n_members, 1, self._hidden_dim, dtype=dtype))
+
+        # Output layers
+        ridge_params = self._per_member(ridge_param).tolist()
+        self._outputs = nn.ModuleList()
+        for member_i in range(self._n_members):
+            output = RRCell(
+                input_dim=self._sizes[member_i],
+                output_dim=output_dim,
+                ridge_param=ridge_params[member_i],
+                with_bias=with_bias,
+                learning_algo=learning_algo,
+                softmax_output=softmax_output,
+                normalize_output=normalize_output,
+                debug=debug,
+                test_case=test_case,
+                dtype=dtype
+            )
+            self._outputs.append(output)
+            self.add_trainable(output)
+        # end for
+    # end __init__
+
+    # region PROPERTIES
+
+    # Number of reservoirs
+    @property
+    def n_members(self):
+        """
+        Number of reservoirs
+        :return: Number of reservoirs in the ensemble
+        """
+        return self._n_members
+    # end n_members
+
+    # Reservoir sizes
+    @property
+    def sizes(self):
+        """
+        Reservoir sizes
+        :return: List of reservoir sizes
+        """
+        return self._sizes
+    # end sizes
+
+    # Output layers
+    @property
+    def outputs(self):
+        """
+        Output layers
+        :return: List of RRCell output layers
+        """
+        return self._outputs
+    # end outputs
+
+    # Get washout
+    @property
+    def washout(self):
+        """
+        Get washout
+        :return: Washout length
+        """
+        return self._washout
+    # end washout
+
+    # Set washout
+    @washout.setter
+    def washout(self, washout):
+        """
+        Washout
+        :param washout: New washout
+        """
+        self._washout = washout
+    # end washout
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Reset layer (not trained)
+    def reset(self):
+        """
+        Reset layer (not trained)
+        """
+        for output in self._outputs:
+            output.reset()
+        # end for
+
+        # Training mode again
+        self.train(True)
+    # end reset
+
+    # Reset hidden layer
+    def reset_hidden(self):
+        """
+        Reset hidden layer
+        """
+        self.hidden.fill_(0.0)
+    # end reset_hidden
+
+    # Forward
+    def forward(self, u, y=None, reset_state=True):
+        """
+        Forward
+        :param u: Input signal (batch size x time length x input dim)
+        :param y: Target outputs (batch size x time length x output dim), or None if prediction
+        :param reset_state: Reset hidden states to zero or keep old ones ?
+        :return: Hidden states of each reservoir (training) or outputs of each reservoir (eval), as
+        (K x batch size x time length - washout x N) and (K x batch size x time length - washout x output dim) tensors
+        """
+        # Sizes
+        n_batches = int(u.size(0))
+        time_length = int(u.size(1))
+
+        # Initial states
+        if reset_state or self.hidden.size(1) != n_batches:
+            self.hidden.data = torch.zeros(
+                self._n_members, n_batches, self._hidden_dim, dtype=self.dtype, device=self.hidden.device
+            )
+        # end if
+
+        # Projected inputs of all reservoirs (K x batch size x time length x N)
+        inputs_win = torch.matmul(
+            u.reshape(1, n_batches * time_length, self._input_dim).to(self.dtype),
+            self.w_in.transpose(1, 2)
+        )
+        inputs_win = inputs_win * self.input_scalings.view(-1, 1, 1) + self.w_bias.unsqueeze(1)
+        inputs_win = inputs_win.view(self._n_members, n_batches, time_length, self._hidden_dim)
+
+        # All reservoirs in one recurrence, only states after the washout are stored
+        hidden_states, last_states = ensemble_recurrence(
+            inputs_win,
+            self.w,
+            self.hidden,
+            self.leaky_rates,
+            self._washout
+        )
+        self.hidden.data = last_states.data
+
+        # Output layer of each reservoir
+        outputs = list()
+        for member_i in range(self._n_members):
+            member_states = hidden_states[member_i, :, :, :self._sizes[member_i]]
+            if self.training:
+                self._outputs[member_i](member_states, y[:, self._washout:])
+            else:
+                outputs.append(self._outputs[member_i](member_states, None))
+            # end if
+        # end for
+
+        # States (training) or outputs (eval)
+        if self.training:
+            return hidden_states
+        else:
+            return torch.stack(outputs, dim=0)
+        # end if
+    # end forward
+
+    # endregion PUBLIC
+
+    # region PRIVATE
+
+    # One value per member
+    def _per_member(self, value):
+        """
+        One value per member
+        :param value: One value or a list of K values
+        :return: Tensor of K values
+        """
+        if isinstance(value, (list, tuple, torch.Tensor)):
+            if len(value) != self._n_members:
+                raise Exception("Expected {} values, got {}".format(self._n_members, len(value)))
+            # end if
+            return torch.as_tensor(value, dtype=self.dtype).clone()
+        else:
+            return torch.full((self._n_members,), float(value), dtype=self.dtype)
+        # end if
+    # end _per_member
+
+    # Stack matrices of each member, padded with zeros
+    def _stack(self, matrices, size):
+        """
+        Stack matrices of each member, padded with zeros
+        :param matrices: List of K matrices (or K x ... tensor)
+        :param size: Padded size of one matrix
+        :return: Tensor (K x size)
+        """
+        stacked = torch.zeros((self._n_members,) + size, dtype=self.dtype)
+        for member_i in range(self._n_members):
+            m = matrices[member_i]
+            stacked[(member_i,) + tuple(slice(0, s) for s in m.size())] = m.to(self.dtype)
+        # end for
+        return stacked
+    # end _stack
+
+    # endregion PRIVATE
+
+    # region OVERRIDE
+
+    # Extra-information
+    def extra_repr(self):
+        """
+        Extra-information
+        :return: String
+        """
+        s = super(ESNEnsemble, self).extra_repr()
+        s += ', n_members={_n_members}, sizes={_sizes}, washout={_washout}'
+        return s.format(**self.__dict__)
+    # end extra_repr
+
+    # endregion OVERRIDE
+
+# end ESNEnsemble
@@ -30,7 +30,7 @@ import torch.sparse
 from torch.autograd import Variable
 
 import echotorch.utils
-from echotorch.visualisation import Observable
+from echotorch.viz import Observable
 from .LiESNCell import LiESNCell
 
 
@@ -87,7 +87,7 @@ class FreeRunESNCell(LiESNCell, Observable):
         :param t: Timestep.
         """
         if self._w_fdb is not None:
-            return torch.mv(self._w_fdb, self.hidden) + self._feedback_noise(self._output_dim)
+            return torch.mv(self._w_fdb, self.hidden[sample_i]) + self._feedback_noise(self._output_dim)
         else:
             return inputs
         # end if
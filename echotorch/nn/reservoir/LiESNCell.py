@@ -55,12 +55,24 @@ class LiESNCell(ESNCell):
     def _post_nonlinearity(self, x):
         """
         Compute post nonlinearity hook
-        :param x: Reservoir state at time t
-        :return: Reservoir state
+        :param x: Reservoir states at time t (batch size x reservoir size)
+        :return: Reservoir states
         """
-        return self.hidden.mul(1.0 - self._leaky_rate) + x.view(self.output_dim).mul(self._leaky_rate)
+        return self.hidden.mul(1.0 - self._leaky_rate) + x.mul(self._leaky_rate)
     # end _post_nonlinearity
 
+    # Leaky rate of the post-nonlinearity for the fused recurrence
+    def _fused_leaky_rate(self):
+        """
+        Leaky rate of the post-nonlinearity for the fused recurrence
+        :return: Leaky rate, or None if the post-nonlinearity cannot be fused
+        """
+        if type(self)._post_nonlinearity is LiESNCell._post_nonlinearity:
+            return self._leaky_rate
+        # end if
+        return None
+    # end _fused_leaky_rate
+
     # Extra-information
     def extra_repr(self):
         """
@@ -26,11 +26,12 @@ from .DeepESN import DeepESN
 from .EESN import EESN
 from echotorch.models.reservoir.ESN import ESN
 from .ESNCell import ESNCell
+from .ESNEnsemble import ESNEnsemble
 from .GatedESN import GatedESN
 from .HESN import HESN
 from .LiESNCell import LiESNCell
 
 # All
 __all__ = [
-    'BDESN', 'BDESNPCA', 'DeepESN', 'EESN', 'ESN', 'ESNCell', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'StackedESN'
+    'BDESN', 'BDESNPCA', 'DeepESN', 'EESN', 'ESN', 'ESNCell', 'ESNEnsemble', 'GatedESN', 'HESN', 'LiESN', 'LiESNCell', 'StackedESN'
 ]
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/utils/LazyDiagnostics.py
+# Description : Diagnostics of the last training step, computed when read.
+# Date : 17th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+
+# Diagnostics of the last training step, computed when read
+class LazyDiagnostics(object):
+    """
+    Mixin for nodes with diagnostics of their last training step (norms, ranks, singular values, errors).
+    The step only records its inputs with _set_diagnostics_inputs(), and each diagnostic property calls
+    _diagnostic(), which computes the value on first read and caches it until the next step.
+    """
+
+    # Record the inputs of a training step
+    def _set_diagnostics_inputs(self, inputs):
+        """
+        Record the inputs of a training step, and forget the diagnostics of the previous one
+        :param inputs: Dictionary of tensors the diagnostics are computed from
+        """
+        self._diagnostics_inputs = inputs
+        self._diagnostics = dict()
+    # end _set_diagnostics_inputs
+
+    # Diagnostic of the last step, computed once when first read
+    def _diagnostic(self, name, default, compute):
+        """
+        Diagnostic of the last step, computed once when first read
+        :param name: Diagnostic name
+        :param default: Value before any step
+        :param compute: Function of the step's inputs computing the diagnostic
+        :return: Diagnostic value
+        """
+        if getattr(self, '_diagnostics_inputs', None) is None:
+            return default
+        elif name not in self._diagnostics:
+            self._diagnostics[name] = compute(self._diagnostics_inputs)
+        # end if
+        return self._diagnostics[name]
+    # end _diagnostic
+
+# end LazyDiagnostics
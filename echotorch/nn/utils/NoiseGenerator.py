@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/utils/NoiseGenerator.py
+# Description : Seeded noise generator drawing noise in bulk.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import math
+import torch
+
+
+# Seeded noise generator
+class NoiseGenerator(object):
+    """
+    Seeded noise generator.
+    Noise is computed element-wise from uniform draws (inverse CDF for the normal distribution), so drawing a whole
+    block at once gives exactly the same values as drawing it piece by piece in the same order.
+    """
+
+    # Constructor
+    def __init__(self, distribution='normal', mean=0.0, std=1.0, low=-1.0, high=1.0, seed=None,
+                 dtype=torch.float32):
+        """
+        Constructor
+        :param distribution: Noise distribution (normal or uniform)
+        :param mean: Mean (normal distribution)
+        :param std: Standard deviation (normal distribution)
+        :param low: Lower bound (uniform distribution)
+        :param high: Upper bound (uniform distribution)
+        :param seed: Random seed (None for a random seed)
+        :param dtype: Data type
+        """
+        # Check distribution
+        if distribution not in ['normal', 'uniform']:
+            raise Exception("Unknown noise distribution : {}".format(distribution))
+        # end if
+
+        # Properties
+        self._distribution = distribution
+        self._mean = mean
+        self._std = std
+        self._low = low
+        self._high = high
+        self._dtype = dtype
+
+        # Random generator
+        self._generator = torch.Generator()
+        self.manual_seed(seed if seed is not None else self._generator.seed())
+    # end __init__
+
+    # region PROPERTIES
+
+    # Seed
+    @property
+    def seed(self):
+        """
+        Seed
+        :return: Seed of the generator
+        """
+        return self._seed
+    # end seed
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # Set seed
+    def manual_seed(self, seed):
+        """
+        Set seed and restart the sequence of draws
+        :param seed: Random seed
+        """
+        self._seed = seed
+        self._generator.manual_seed(seed)
+    # end manual_seed
+
+    # Restart the sequence of draws
+    def reset(self):
+        """
+        Restart the sequence of draws from the seed
+        """
+        self._generator.manual_seed(self._seed)
+    # end reset
+
+    # Draw noise
+    def sample(self, size):
+        """
+        Draw noise
+        :param size: Size of the noise tensor (elements are drawn in row-major order)
+        :return: Noise tensor
+        """
+        u = torch.rand(size, generator=self._generator, dtype=self._dtype)
+        if self._distribution == 'uniform':
+            return u.mul_(self._high - self._low).add_(self._low)
+        else:
+            # Inverse CDF, open interval (-1, 1) for erfinv
+            eps = torch.finfo(self._dtype).eps
+            u = u.mul_(2.0).sub_(1.0).clamp_(min=-1.0 + eps)
+            return torch.erfinv(u).mul_(math.sqrt(2.0) * self._std).add_(self._mean)
+        # end if
+    # end sample
+
+    # Draw noise for sequences
+    def sample_sequence(self, n_batches, time_length, dim):
+        """
+        Draw noise for sequences, timestep by timestep then sample by sample, as drawing (batch size x dim) at each
+        timestep would.
+        :param n_batches: Batch size
+        :param time_length: Time length
+        :param dim: Dimension
+        :return: Noise (batch size x time length x dim)
+        """
+        return self.sample((time_length, n_batches, dim)).transpose(0, 1)
+    # end sample_sequence
+
+    # endregion PUBLIC
+
+    # region OVERRIDE
+
+    # Call as a noise generator function
+    def __call__(self, *size):
+        """
+        Call as a noise generator function
+        :param size: Size of the noise tensor
+        :return: Noise tensor
+        """
+        return self.sample(size)
+    # end __call__
+
+    # endregion OVERRIDE
+
+# end NoiseGenerator
@@ -23,6 +23,7 @@
 import torch
 import torch.nn as nn
 from ..Node import Node
+from .NoiseGenerator import NoiseGenerator
 from torch.autograd import Variable
 
 
@@ -55,8 +56,19 @@ class NoiseInjection(Node):
     def forward(self, x):
         """
         Forward
-        :return:
+        :param x: States (batch size x time length x input dim, or any size with a NoiseGenerator)
+        :return: Noisy states
         """
+        # Seeded generator : noise drawn in bulk for the whole block
+        if isinstance(self._noise_generator, NoiseGenerator):
+            if x.dim() == 3:
+                noise = self._noise_generator.sample_sequence(x.size(0), x.size(1), x.size(2))
+            else:
+                noise = self._noise_generator.sample(x.size())
+            # end if
+            return x + noise.to(device=x.device, dtype=x.dtype)
+        # end if
+
         return x + self._noise_generator(self._input_dim)
     # end forward
 
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/nn/utils/SufficientStatistics.py
+# Description : Mergeable training statistics of a node.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+
+
+# Mergeable training statistics
+class SufficientStatistics(object):
+    """
+    Mergeable training statistics of a node (sums such as xTx and xTy, and counts).
+    Statistics of the same node trained on different parts of a dataset are summed with +, and the sum is loaded
+    back into the node with load_statistics() before finalize().
+    """
+
+    # Constructor
+    def __init__(self, tensors, counts=None):
+        """
+        Constructor
+        :param tensors: Dictionary of summed tensors (copied)
+        :param counts: Dictionary of summed counts
+        """
+        self._tensors = {name: tensor.detach().clone() for name, tensor in tensors.items()}
+        self._counts = dict(counts) if counts is not None else dict()
+    # end __init__
+
+    # region PROPERTIES
+
+    # Summed tensors
+    @property
+    def tensors(self):
+        """
+        Summed tensors
+        :return: Dictionary of tensors
+        """
+        return self._tensors
+    # end tensors
+
+    # Summed counts
+    @property
+    def counts(self):
+        """
+        Summed counts
+        :return: Dictionary of counts
+        """
+        return self._counts
+    # end counts
+
+    # endregion PROPERTIES
+
+    # region PUBLIC
+
+    # To a device or a data type
+    def to(self, *args, **kwargs):
+        """
+        To a device or a data type
+        :return: New statistics
+        """
+        return SufficientStatistics(
+            {name: tensor.to(*args, **kwargs) for name, tensor in self._tensors.items()},
+            self._counts
+        )
+    # end to
+
+    # State dictionary
+    def state_dict(self):
+        """
+        State dictionary, for serialization
+        :return: Dictionary of tensors and counts
+        """
+        return {'tensors': self._tensors, 'counts': self._counts}
+    # end state_dict
+
+    # Save to a file
+    def save(self, path):
+        """
+        Save to a file
+        :param path: File path
+        """
+        torch.save(self.state_dict(), path)
+    # end save
+
+    # endregion PUBLIC
+
+    # region STATIC
+
+    # From a state dictionary
+    @staticmethod
+    def from_state_dict(state_dict):
+        """
+        From a state dictionary
+        :param state_dict: Dictionary of tensors and counts
+        :return: Statistics
+        """
+        return SufficientStatistics(state_dict['tensors'], state_dict['counts'])
+    # end from_state_dict
+
+    # Load from a file
+    @staticmethod
+    def load(path):
+        """
+        Load from a file
+        :param path: File path
+        :return: Statistics
+        """
+        return SufficientStatistics.from_state_dict(torch.load(path))
+    # end load
+
+    # Sum of statistics
+    @staticmethod
+    def merge(statistics):
+        """
+        Sum of statistics
+        :param statistics: List of statistics of the same node
+        :return: Summed statistics
+        """
+        if len(statistics) == 0:
+            raise Exception("Nothing to merge")
+        # end if
+        merged = statistics[0]
+        for other in statistics[1:]:
+            merged = merged + other
+        # end for
+        return merged
+    # end merge
+
+    # endregion STATIC
+
+    # region OVERRIDE
+
+    # Get a tensor or a count
+    def __getitem__(self, name):
+        """
+        Get a tensor or a count
+        :param name: Name
+        :return: Tensor or count
+        """
+        if name in self._tensors:
+            return self._tensors[name]
+        # end if
+        return self._counts[name]
+    # end __getitem__
+
+    # Sum of two statistics
+    def __add__(self, other):
+        """
+        Sum of two statistics
+        :param other: Statistics of the same node
+        :return: Summed statistics
+        """
+        if set(self._tensors.keys()) != set(other.tensors.keys()) or \
+                set(self._counts.keys()) != set(other.counts.keys()):
+            raise Exception("Cannot merge statistics of different nodes")
+        # end if
+        return SufficientStatistics(
+            {name: tensor + other.tensors[name].to(tensor.device) for name, tensor in self._tensors.items()},
+            {name: count + other.counts[name] for name, count in self._counts.items()}
+        )
+    # end __add__
+
+    # Sum with 0, for sum()
+    def __radd__(self, other):
+        """
+        Sum with 0, for sum()
+        :param other: 0 or statistics
+        :return: Summed statistics
+        """
+        if isinstance(other, int) and other == 0:
+            return self
+        # end if
+        return self.__add__(other)
+    # end __radd__
+
+    # String
+    def __repr__(self):
+        """
+        String
+        :return: Description of the statistics
+        """
+        return "SufficientStatistics(tensors={}, counts={})".format(
+            {name: tuple(tensor.size()) for name, tensor in self._tensors.items()},
+            self._counts
+        )
+    # end __repr__
+
+    # endregion OVERRIDE
+
+# end SufficientStatistics
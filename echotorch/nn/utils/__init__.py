@@ -1,4 +1,8 @@
 
 
 from .Identity import Identity
-from .JoinStates import JoinStates
\ No newline at end of file
+from .JoinStates import JoinStates
+from .LazyDiagnostics import LazyDiagnostics
+from .NoiseGenerator import NoiseGenerator
+from .NoiseInjection import NoiseInjection
+from .SufficientStatistics import SufficientStatistics
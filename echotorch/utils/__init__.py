@@ -24,11 +24,18 @@
 # from .matrix_generation import UniformMatrixGenerator
 
 # Error measure
-from .error_measures import nrmse, nmse, rmse, mse, perplexity, cumperplexity, generalized_squared_cosine
+from .error_measures import nrmse, nmse, rmse, mse, perplexity, cumperplexity, generalized_squared_cosine, \
+    generalized_squared_cosine_matrix
 
 # Random functions
 from .random import manual_seed
 
+# Parallel training
+from .parallel_training import parallel_statistics, parallel_fit
+
+# Quantization
+from .quantization import quantize_model
+
 # Utility function
 from .utility_functions import align_pattern, compute_correlation_matrix, spectral_radius, deep_spectral_radius, \
     normalize, average_prob, max_average_through_time, compute_singular_values, compute_similarity_matrix, \
@@ -39,8 +46,13 @@ from .utility_functions import align_pattern, compute_correlation_matrix, spectr
 __all__ = [
     # Error measures
     'nrmse', 'nmse', 'rmse', 'mse', 'perplexity', 'cumperplexity', 'generalized_squared_cosine',
+    'generalized_squared_cosine_matrix',
     # Random functions
     'manual_seed',
+    # Parallel training
+    'parallel_statistics', 'parallel_fit',
+    # Quantization
+    'quantize_model',
     # Utility functions
     'align_pattern', 'compute_correlation_matrix', 'spectral_radius', 'deep_spectral_radius', 'normalize',
     'average_prob', 'max_average_through_time', 'compute_singular_values', 'compute_similarity_matrix',
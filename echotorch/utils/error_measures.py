@@ -196,3 +196,25 @@ def generalized_squared_cosine(m1, m2):
 
     return num / den
 # end generalized_squared_cosine
+
+
+# Generalized square cosine between all pairs of matrices
+def generalized_squared_cosine_matrix(ms1, ms2=None):
+    """
+    Generalized square cosine between all pairs of symmetric positive semi-definite matrices (e.g. conceptor or
+    correlation matrices). For such matrices ||Sa^1/2 Ua^T Ub Sb^1/2||^2 = <m1, m2> and ||Sa|| = ||m1||, so the
+    whole matrix comes from one product of the flattened matrices, without SVD.
+    :param ms1: First matrices (K1 x N x N)
+    :param ms2: Second matrices (K2 x N x N), None for ms1
+    :return: Generalized square cosines (K1 x K2), symmetric if ms2 is None
+    """
+    # Flattened matrices
+    f1 = ms1.reshape(ms1.size(0), -1)
+    f2 = f1 if ms2 is None else ms2.reshape(ms2.size(0), -1)
+
+    # Frobenius products and norms
+    num = torch.mm(f1, f2.t())
+    den = torch.norm(f1, dim=1).unsqueeze(1) * torch.norm(f2, dim=1).unsqueeze(0)
+
+    return num / den
+# end generalized_squared_cosine_matrix
@@ -217,14 +217,18 @@ class GeneticOptimizer(Optimizer):
 
         # For each iteration
         for epoch in range(iterations):
-            # Test each member of the population
-            fitness_values = self._evaluate_with_workers(
-                test_function,
-                population,
-                datasets,
-                *args,
-                **kwargs
-            )
+            # Test the whole population at once, or each member
+            if self.get_parameter('batch_evaluation'):
+                fitness_values = self._evaluate_population(test_function, population, datasets, *args, **kwargs)
+            else:
+                fitness_values = self._evaluate_with_workers(
+                    test_function,
+                    population,
+                    datasets,
+                    *args,
+                    **kwargs
+                )
+            # end if
 
             # Sort individuals from the best to the worse
             if self.get_parameter('target') == 'min':
@@ -268,7 +272,7 @@ class GeneticOptimizer(Optimizer):
         # end for
 
         # Get the best model
-        model, fitness_value = test_function(best_individual[0], datasets, **kwargs)
+        model, fitness_value = self._evaluate_individual(test_function, best_individual[0], datasets, **kwargs)
 
         return model, best_individual[0], best_individual[1]
     # end _optimize_func
@@ -23,7 +23,7 @@
 import torch
 import numpy as np
 import math
-from itertools import product
+from itertools import product, islice
 from .Optimizer import Optimizer
 from .OptimizerFactory import optimizer_factory
 
@@ -41,7 +41,7 @@ class GridSearchOptimizer(Optimizer):
         :param kwargs: Argument for the optimizer
         """
         # Set default parameter values
-        super(GridSearchOptimizer, self).__init__(num_workers=num_workers)
+        super(GridSearchOptimizer, self).__init__(num_workers=num_workers, batch_size=32)
 
         # Set parameters
         self._set_parameters(args=kwargs)
@@ -109,20 +109,34 @@ class GridSearchOptimizer(Optimizer):
         # Save fitness values
         winner = (None, math.inf)
 
-        # Test each member of the population
-        for r, param_individual in enumerate(parameter_population):
-            # Test the model
-            _, fitness_value = test_function(param_individual, datasets, **kwargs)
+        # Test each member of the population, or batches of members at once
+        batch_size = self.get_parameter('batch_size') if self.get_parameter('batch_evaluation') else 1
+        while True:
+            # Next members
+            param_batch = list(islice(parameter_population, batch_size))
+            if len(param_batch) == 0:
+                break
+            # end if
 
-            # Keep if it is the best
-            if (self.get_parameter('target') == 'min' and fitness_value < winner[1]) or \
-                    (self.get_parameter('target') == 'max' and fitness_value > winner[1]):
-                winner = (param_individual, fitness_value)
+            # Test the models
+            if self.get_parameter('batch_evaluation'):
+                results = self._evaluate_population(test_function, param_batch, datasets, **kwargs)
+            else:
+                _, fitness_value = test_function(param_batch[0], datasets, **kwargs)
+                results = [(param_batch[0], fitness_value, None)]
             # end if
-        # end for
+
+            for param_individual, fitness_value, _ in results:
+                # Keep if it is the best
+                if (self.get_parameter('target') == 'min' and fitness_value < winner[1]) or \
+                        (self.get_parameter('target') == 'max' and fitness_value > winner[1]):
+                    winner = (param_individual, fitness_value)
+                # end if
+            # end for
+        # end while
 
         # Get the best model
-        model, fitness_value = test_function(winner[0], datasets, **kwargs)
+        model, fitness_value = self._evaluate_individual(test_function, winner[0], datasets, **kwargs)
 
         return model, winner[0], fitness_value
     # end _optimize_func
@@ -42,6 +42,7 @@ class Optimizer(object):
         # Default generation parameters
         self._parameters = dict()
         self._parameters['target'] = 'min'
+        self._parameters['batch_evaluation'] = False
 
         # Initialize hooks
         self._hooks = dict()
@@ -230,6 +231,46 @@ class Optimizer(object):
         return overall_results
     # end _evaluate_with_workers
 
+    # Evaluate a whole population with one call to the test function
+    def _evaluate_population(self, test_function, population, datasets, *args, **kwargs):
+        """
+        Evaluate a whole population with one call to the test function (batch evaluation).
+        The test function receives the list of parameter dictionaries and returns a list of models and a list of
+        fitness values, for example from an ESNEnsemble.
+        :param test_function: The function that maps a list of parameter dictionaries and the datasets to a list
+        of models and a list of fitness values.
+        :param population: List of parameter dictionaries
+        :param datasets: Datasets given to the test function
+        :return: A list of tuples (parameters, fitness value, model)
+        """
+        # Evaluate all individuals
+        models, fitness_values = test_function(population, datasets, *args, **kwargs)
+
+        return [
+            (param_individual, fitness_value, model)
+            for param_individual, fitness_value, model in zip(population, fitness_values, models)
+        ]
+    # end _evaluate_population
+
+    # Evaluate one set of parameters
+    def _evaluate_individual(self, test_function, param_individual, datasets, *args, **kwargs):
+        """
+        Evaluate one set of parameters, with a population of one in batch evaluation
+        :param test_function: The test function
+        :param param_individual: Parameter dictionary
+        :param datasets: Datasets given to the test function
+        :return: Model, fitness value
+        """
+        if self.get_parameter('batch_evaluation'):
+            _, fitness_value, model = self._evaluate_population(
+                test_function, [param_individual], datasets, *args, **kwargs
+            )[0]
+            return model, fitness_value
+        else:
+            return test_function(param_individual, datasets, *args, **kwargs)
+        # end if
+    # end _evaluate_individual
+
     # Optimize function to override
     def _optimize_func(self, test_function, param_ranges, datasets, *args, **kwargs):
         """
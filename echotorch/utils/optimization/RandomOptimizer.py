@@ -87,18 +87,25 @@ class RandomOptimizer(Optimizer):
         # Save fitness values
         fitness_values = np.zeros(R)
 
-        # Test each member of the population
-        for r, param_individual in enumerate(parameter_population):
-            # Test the model
-            _, fitness_value = test_function(
-                param_individual,
-                datasets,
-                **kwargs
-            )
-
-            # Save fitness value
-            fitness_values[r] = fitness_value
-        # end for
+        # Test the whole population at once, or each member
+        if self.get_parameter('batch_evaluation'):
+            for r, (_, fitness_value, _) in enumerate(
+                    self._evaluate_population(test_function, parameter_population, datasets, **kwargs)):
+                fitness_values[r] = fitness_value
+            # end for
+        else:
+            for r, param_individual in enumerate(parameter_population):
+                # Test the model
+                _, fitness_value = test_function(
+                    param_individual,
+                    datasets,
+                    **kwargs
+                )
+
+                # Save fitness value
+                fitness_values[r] = fitness_value
+            # end for
+        # end if
 
         # Get the best parameter values
         if self.get_parameter('target') == 'min':
@@ -110,11 +117,7 @@ class RandomOptimizer(Optimizer):
         # end if
 
         # Get the best model
-        model, fitness_value = test_function(
-            parameters=best_param,
-            datasets=datasets,
-            **kwargs
-        )
+        model, fitness_value = self._evaluate_individual(test_function, best_param, datasets, **kwargs)
 
         return model, best_param, fitness_value
     # end _optimize_func
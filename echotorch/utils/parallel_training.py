@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/utils/parallel_training.py
+# Description : Train output layers over dataset shards in local worker processes.
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import copy
+import torch
+from torch.utils.data import DataLoader, Subset
+from .worker_pool import map_in_workers, worker_state
+
+
+# Node whose statistics are collected
+def _statistics_node(model, node):
+    """
+    Node whose statistics are collected
+    :param model: Model
+    :param node: Attribute name, or None for the model itself
+    :return: Node with statistics() and load_statistics()
+    """
+    return model if node is None else getattr(model, node)
+# end _statistics_node
+
+
+# Statistics of one shard
+def _shard_statistics(shard_i, n_shards):
+    """
+    Statistics of one shard, the samples shard_i, shard_i + n_shards, ...
+    :param shard_i: Shard index
+    :param n_shards: Number of shards
+    :return: SufficientStatistics of the shard
+    """
+    state = worker_state()
+    model = state['model']
+    dataset = state['dataset']
+    node = _statistics_node(model, state['node'])
+
+    # Fresh statistics
+    node.reset()
+    model.train(True)
+
+    # Feed the samples of the shard
+    loader = DataLoader(Subset(dataset, range(shard_i, len(dataset), n_shards)), batch_size=state['batch_size'])
+    with torch.no_grad():
+        for batch in loader:
+            model(batch[0], batch[1])
+        # end for
+    # end with
+
+    return node.statistics()
+# end _shard_statistics
+
+
+# Sufficient statistics of a dataset computed in parallel
+def parallel_statistics(model, dataset, n_workers=2, node='output', batch_size=1, n_threads=1):
+    """
+    Sufficient statistics of a dataset computed in parallel.
+    The dataset is split into n_workers shards, each worker process runs a copy of the model in training mode over
+    its shard, and the statistics of the workers are summed.
+    :param model: Model to train (e.g. an ESN)
+    :param dataset: Dataset of (inputs, targets) samples
+    :param n_workers: Number of worker processes
+    :param node: Attribute of the model whose statistics are collected (e.g. output), or None for the model itself
+    :param batch_size: Batch size in each worker
+    :param n_threads: Number of torch threads in each worker
+    :return: Summed SufficientStatistics
+    """
+    # In this process, the model is copied like in the workers so that it is not reset nor left in training mode
+    if n_workers <= 1:
+        model = copy.deepcopy(model)
+    # end if
+
+    # One shard per worker
+    state = {'model': model, 'dataset': dataset, 'node': node, 'batch_size': batch_size}
+    n_shards = max(n_workers, 1)
+    statistics = map_in_workers(
+        _shard_statistics, [(shard_i, n_shards) for shard_i in range(n_shards)], state, n_workers, n_threads
+    )
+    return sum(statistics)
+# end parallel_statistics
+
+
+# Train a model over a dataset in parallel
+def parallel_fit(model, dataset, n_workers=2, node='output', batch_size=1, n_threads=1):
+    """
+    Train a model over a dataset in parallel: statistics are computed by worker processes, summed, loaded into the
+    model and the model is finalized.
+    :param model: Model to train (e.g. an ESN)
+    :param dataset: Dataset of (inputs, targets) samples
+    :param n_workers: Number of worker processes
+    :param node: Attribute of the model whose statistics are collected (e.g. output), or None for the model itself
+    :param batch_size: Batch size in each worker
+    :param n_threads: Number of torch threads in each worker
+    :return: Trained model
+    """
+    statistics = parallel_statistics(model, dataset, n_workers, node, batch_size, n_threads)
+    _statistics_node(model, node).load_statistics(statistics)
+    model.finalize()
+    return model
+# end parallel_fit
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/utils/quantization.py
+# Description : Post-training quantization of trained ESN models.
+# Date : 17th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+from .error_measures import nrmse
+
+
+# Memory used by the input and output weights
+def _weights_bytes(model):
+    """
+    Memory used by the input and output weights
+    :param model: ESN model
+    :return: Number of bytes of Win, Wout and their scales
+    """
+    tensors = [model.cell.w_in, model.cell.w_in_scale, model.output.w_out, model.output.w_out_scale]
+    return sum(t.numel() * t.element_size() for t in tensors if t is not None)
+# end _weights_bytes
+
+
+# Quantize a trained ESN
+def quantize_model(model, mode='int8', calibration_inputs=None, calibration_targets=None, quantize_inputs=True):
+    """
+    Quantize a trained ESN (or LiESN) in place: per-channel int8 or float16 output weights Wout, and input
+    weights Win, dequantized on the fly at inference.
+    With calibration inputs, the outputs of the float and of the quantized model are compared.
+    :param model: Trained ESN model (finalized, output layer with a quantize() method)
+    :param mode: Quantization mode (int8 or float16)
+    :param calibration_inputs: Calibration inputs (batch size x time length x input dim), or None
+    :param calibration_targets: Calibration targets (batch size x time length - washout x output dim), or None
+    :param quantize_inputs: Quantize Win too ?
+    :return: Report as a dictionary, with the memory of the weights before and after (bytes_before, bytes_after),
+    and with calibration inputs the NRMSE of the quantized outputs against the float outputs (output_nrmse), their
+    maximum absolute difference (max_abs_error), and with calibration targets the NRMSE of both models against the
+    targets (float_nrmse, quantized_nrmse)
+    """
+    # Only trained models
+    if model.training:
+        raise Exception("Only a trained model can be quantized, call finalize() first")
+    # end if
+
+    # Report
+    report = {'mode': mode, 'bytes_before': _weights_bytes(model)}
+
+    # Outputs of the float model
+    if calibration_inputs is not None:
+        with torch.no_grad():
+            float_outputs = model(calibration_inputs)
+        # end with
+    # end if
+
+    # Quantize weights
+    model.output.quantize(mode)
+    if quantize_inputs:
+        model.cell.quantize_inputs(mode)
+    # end if
+    report['bytes_after'] = _weights_bytes(model)
+
+    # Accuracy on the calibration set
+    if calibration_inputs is not None:
+        with torch.no_grad():
+            quantized_outputs = model(calibration_inputs)
+        # end with
+        report['output_nrmse'] = nrmse(quantized_outputs, float_outputs)
+        report['max_abs_error'] = float(torch.max(torch.abs(quantized_outputs - float_outputs)))
+        if calibration_targets is not None:
+            report['float_nrmse'] = nrmse(float_outputs, calibration_targets)
+            report['quantized_nrmse'] = nrmse(quantized_outputs, calibration_targets)
+        # end if
+    # end if
+
+    return report
+# end quantize_model
@@ -26,6 +26,8 @@ from .error_measures import nrmse, generalized_squared_cosine
 from scipy.interpolate import interp1d
 import numpy.linalg as lin
 from scipy import stats
+from scipy import sparse
+import scipy.sparse.linalg as sparse_linalg
 import scipy.integrate as integrate
 import matplotlib.pyplot as plt
 
@@ -422,15 +424,67 @@ def compute_singular_values(stats):
 def spectral_radius(m):
     """
     Compute spectral radius of a square 2-D tensor
-    :param m: squared 2D tensor
+    :param m: squared 2D tensor (dense, or sparse COO/CSR)
     :return:
     """
+    # Sparse matrices, only the largest eigenvalue is computed
+    if m.layout != torch.strided:
+        return sparse_spectral_radius(m)
+    # end if
+
     # return torch.max(torch.abs(torch.eig(m)[0])).item()
     eigenvalues = torch.linalg.eigvals(m)
     return torch.max(torch.abs(eigenvalues)).item()
 # end spectral_radius
 
 
+# Compute spectral radius of a sparse square 2-D tensor
+def sparse_spectral_radius(m):
+    """
+    Compute spectral radius of a sparse square 2-D tensor with ARPACK (scipy)
+    :param m: squared sparse 2D tensor (COO or CSR)
+    :return: Spectral radius
+    """
+    # To CSR on the CPU
+    m = m.cpu()
+    if m.layout != torch.sparse_csr:
+        m = m.to_sparse_csr()
+    # end if
+
+    # Empty matrix
+    if m._nnz() == 0:
+        return 0.0
+    # end if
+
+    # ARPACK needs k < n - 1
+    if m.size(0) < 8:
+        return spectral_radius(m.to_dense())
+    # end if
+
+    # Scipy CSR matrix
+    m_sp = sparse.csr_matrix(
+        (m.values().double().numpy(), m.col_indices().numpy(), m.crow_indices().numpy()),
+        shape=tuple(m.size())
+    )
+
+    # Largest magnitude eigenvalues (a few of them, as they are often clustered on the circle)
+    try:
+        eigenvalues = sparse_linalg.eigs(
+            m_sp,
+            k=6,
+            ncv=min(m.size(0) - 1, 64),
+            which='LM',
+            maxiter=200,
+            v0=np.ones(m.size(0)),
+            return_eigenvectors=False
+        )
+    except sparse_linalg.ArpackNoConvergence:
+        return spectral_radius(m.to_dense())
+    # end try
+    return float(np.max(np.abs(eigenvalues)))
+# end sparse_spectral_radius
+
+
 # Compute spectral radius of a square 2-D tensor for stacked-ESN
 def deep_spectral_radius(m, leaky_rate):
     """
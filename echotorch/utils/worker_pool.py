@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# File : echotorch/utils/worker_pool.py
+# Description : Run a function over a list of tasks in local worker processes sharing a read-only state.
+# Date : 17th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import torch.multiprocessing as mp
+
+
+# State shared by the tasks of a worker process
+_worker_state = dict()
+
+
+# State shared by the tasks of this worker process
+def worker_state():
+    """
+    State shared by the tasks of this worker process (or of this process when run in it)
+    :return: Dictionary given to map_in_workers()
+    """
+    return _worker_state
+# end worker_state
+
+
+# Initialize a worker process
+def _init_worker(state, n_threads):
+    """
+    Initialize a worker process
+    :param state: Dictionary shared by the tasks
+    :param n_threads: Number of torch threads in the worker, or None to keep the current number
+    """
+    if n_threads is not None:
+        torch.set_num_threads(n_threads)
+    # end if
+    _worker_state.clear()
+    _worker_state.update(state)
+# end _init_worker
+
+
+# Run a function over a list of tasks in worker processes
+def map_in_workers(function, tasks, state, n_workers=1, n_threads=1, chunksize=None):
+    """
+    Run a function over a list of tasks in worker processes.
+    Each worker receives the state once, at start-up (without pickling when processes are forked), and the function
+    reads it with worker_state(). With one worker, the tasks run in this process.
+    :param function: Module-level function of the arguments of a task
+    :param tasks: List of tuples of arguments
+    :param state: Dictionary shared by the tasks
+    :param n_workers: Number of worker processes (1 for this process)
+    :param n_threads: Number of torch threads in each worker
+    :param chunksize: Number of tasks sent to a worker at once, or None for the pool's default
+    :return: List of the results, in the order of the tasks
+    """
+    # In this process
+    if n_workers <= 1:
+        _init_worker(state, None)
+        try:
+            return [function(*task) for task in tasks]
+        finally:
+            _worker_state.clear()
+        # end try
+    # end if
+
+    # Fork keeps the state in memory without pickling it
+    start_method = 'fork' if 'fork' in mp.get_all_start_methods() else 'spawn'
+    context = mp.get_context(start_method)
+    with context.Pool(n_workers, initializer=_init_worker, initargs=(state, n_threads)) as pool:
+        return pool.starmap(function, tasks, chunksize=chunksize)
+    # end with
+# end map_in_workers
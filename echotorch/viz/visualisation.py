@@ -179,16 +179,13 @@ def show_sv_for_increasing_aperture(conceptor, factor, title):
     ax.set_ylim(0, 1.5)
     ax.grid(True)
 
-    # For each aperture multiplication
-    for i in range(5):
-        # Compute SVD
-        _, S, _ = torch.svd(conceptor.get_C())
+    # Singular values for the aperture multiplied 0 to 4 times by factor
+    sweep = conceptor.aperture_sweep([conceptor.aperture * math.pow(factor, i) for i in range(5)])
 
+    # For each aperture multiplication
+    for S in sweep['singular_values']:
         # Plot
         ax.plot(S.numpy(), '--')
-
-        # Multiply all conceptor's aperture by 10
-        conceptor.multiply_aperture(factor)
     # end for
 
     # Show
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_conceptors.py
+# Description : Test conceptor matrices and aperture
+# Date : 17th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import importlib
+import math
+import unittest.mock
+import torch
+import echotorch.nn.conceptors as ecnc
+from echotorch.utils import generalized_squared_cosine, nrmse, quota, rank
+from . import EchoTorchTestCase
+
+
+# Test case : conceptor matrices and aperture
+class Test_Conceptors(EchoTorchTestCase):
+    """
+    Test conceptor matrices and aperture
+    """
+    # region PRIVATE
+
+    # Create a conceptor learned from random states
+    def _conceptor(self, dim=30, aperture=10.0, seed=1):
+        """
+        Create a conceptor learned from random states
+        :return: Conceptor (finalized)
+        """
+        torch.manual_seed(seed)
+        mixing = torch.randn(dim, dim, dtype=torch.float64) / dim
+        conceptor = ecnc.Conceptor(input_dim=dim, aperture=aperture, dtype=torch.float64)
+        conceptor.filter_fit(torch.tanh(torch.matmul(torch.randn(2, 200, dim, dtype=torch.float64), mixing)))
+        conceptor.finalize()
+        return conceptor
+    # end _conceptor
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Change of aperture from the cached eigendecomposition
+    def test_aperture_change(self):
+        """
+        Change of aperture from the cached eigendecomposition
+        """
+        A = self._conceptor()
+        self.assertTensorAlmostEqual(A.C, ecnc.Conceptor.computeC(A.R, 10.0), 0.000001)
+        self.assertTensorAlmostEqual(A.SV, torch.linalg.svdvals(A.C), 0.000001)
+
+        # New aperture
+        A.aperture = 3.0
+        self.assertTensorAlmostEqual(A.C, ecnc.Conceptor.computeC(A.R, 3.0), 0.000001)
+        self.assertAlmostEqual(A.quota, torch.sum(torch.linalg.svdvals(A.C)).item() / 30, 6)
+
+        # PHI with C learned from R, and with C set directly
+        B = A.copy()
+        B.set_C(A.C.clone(), 3.0, compute_R=False)
+        A.PHI(4.0)
+        B.PHI(4.0)
+        self.assertAlmostEqual(A.aperture, 12.0)
+        self.assertTensorAlmostEqual(A.C, ecnc.Conceptor.computeC(A.R, 12.0), 0.000001)
+        self.assertTensorAlmostEqual(B.C, A.C, 0.000001)
+
+        # R learned again
+        A.filter_fit(torch.randn(100, 30, dtype=torch.float64))
+        A.update_C()
+        self.assertTensorAlmostEqual(A.C, ecnc.Conceptor.computeC(A.R, 12.0), 0.000001)
+    # end test_aperture_change
+
+    # Quota and norm curves for several apertures
+    def test_aperture_sweep(self):
+        """
+        Quota and norm curves for several apertures
+        """
+        A = self._conceptor()
+        apertures = torch.logspace(-1, 3, 200, dtype=torch.float64)
+        sweep = A.aperture_sweep(apertures)
+        self.assertEqual(sweep['singular_values'].size(), (200, 30))
+
+        # Same curves as conceptors computed one by one
+        for aperture_i in [0, 77, 199]:
+            C = ecnc.Conceptor.computeC(A.R, apertures[aperture_i].item())
+            self.assertAlmostEqual(sweep['quota'][aperture_i].item(), torch.trace(C).item() / 30, 6)
+            self.assertAlmostEqual(sweep['norm'][aperture_i].item(), torch.linalg.norm(C).item(), 6)
+        # end for
+
+        # Quota grows with the aperture
+        self.assertTrue(bool(torch.all(sweep['quota'][1:] >= sweep['quota'][:-1])))
+
+        # Delta measure
+        delta, d_norm = A.delta(2.0, 0.01)
+        norms = A.aperture_sweep([A.aperture * 1.99, A.aperture * 2.01])['norm']
+        self.assertAlmostEqual(d_norm, norms[1].item() ** 2 - norms[0].item() ** 2, 6)
+        self.assertGreater(delta, 0.0)
+    # end test_aperture_sweep
+
+    # Boolean operations on cached eigen-factors
+    def test_logic(self):
+        """
+        Boolean operations on cached eigen-factors
+        """
+        A = self._conceptor(seed=1)
+        B = self._conceptor(seed=2)
+        D = self._conceptor(seed=3)
+        eye = torch.eye(30, dtype=torch.float64)
+
+        # Full rank AND and OR (same aperture, the correlation matrices add up)
+        self.assertTensorAlmostEqual(
+            A.AND(B).C, torch.inverse(torch.inverse(A.C) + torch.inverse(B.C) - eye), 0.000001
+        )
+        self.assertTensorAlmostEqual(A.OR(B).C, ecnc.Conceptor.computeC(A.R + B.R, 10.0), 0.000001)
+        self.assertTensorAlmostEqual(A.NOT().C, eye - A.C, 0.000001)
+        self.assertTensorAlmostEqual(A.NOT().R, ecnc.Conceptor.computeR(eye - A.C, 0.1), 0.0001)
+
+        # Commuting operands
+        P = A.copy()
+        P.aperture = 40.0
+        self.assertTensorAlmostEqual(
+            A.AND(P).C, torch.inverse(torch.inverse(A.C) + torch.inverse(P.C) - eye), 0.000001
+        )
+
+        # Lists of conceptors
+        self.assertTensorAlmostEqual(
+            ecnc.Conceptor.OR_all([A, B, D]).C, ecnc.Conceptor.computeC(A.R + B.R + D.R, 10.0), 0.000001
+        )
+        self.assertTensorAlmostEqual(ecnc.Conceptor.AND_all([A, B, D]).C, A.AND(B).AND(D).C, 0.000001)
+
+        # Singular operands intersect on their ranges (20 + 20 - 30 dimensions)
+        torch.manual_seed(4)
+        S1 = ecnc.Conceptor(input_dim=30, aperture=10.0, dtype=torch.float64)
+        S1.filter_fit(torch.matmul(torch.randn(100, 20, dtype=torch.float64), torch.randn(20, 30, dtype=torch.float64)))
+        S1.finalize()
+        S2 = ecnc.Conceptor(input_dim=30, aperture=10.0, dtype=torch.float64)
+        S2.filter_fit(torch.matmul(torch.randn(100, 20, dtype=torch.float64), torch.randn(20, 30, dtype=torch.float64)))
+        S2.finalize()
+        S = S1.AND(S2, tol=1e-10, compute_R=False)
+        self.assertEqual(int(torch.linalg.matrix_rank(S.C, atol=1e-8)), 10)
+        self.assertTensorAlmostEqual(S.C, S.C.t(), 0.000001)
+
+        # Set of conceptors
+        conceptors = ecnc.ConceptorSet(input_dim=30, dtype=torch.float64)
+        conceptors.add(0, A)
+        conceptors.add(1, B)
+        self.assertTensorAlmostEqual(conceptors.A().C, A.OR(B).C, 0.000001)
+        self.assertTensorAlmostEqual(conceptors.F(), eye - A.OR(B).C, 0.000001)
+    # end test_logic
+
+    # Cached unions of a set of conceptors
+    def test_set_unions(self):
+        """
+        Cached unions of a set of conceptors
+        """
+        members = [self._conceptor(seed=seed) for seed in range(5)]
+        x = torch.randn(20, 30, dtype=torch.float64)
+
+        # Union updated on add
+        conceptors = ecnc.ConceptorSet(input_dim=30, dtype=torch.float64)
+        for k, conceptor in enumerate(members[:4]):
+            conceptors.add(k, conceptor)
+            self.assertTensorAlmostEqual(
+                conceptors.A().C, ecnc.Conceptor.OR_all(members[:k + 1], compute_R=False).C, 0.000001
+            )
+        # end for
+
+        # All but each one
+        for k in range(4):
+            others = ecnc.Conceptor.OR_all([members[j] for j in range(4) if j != k], compute_R=False)
+            self.assertTensorAlmostEqual(
+                conceptors.Eneg(k, x), ecnc.Conceptor.evidence(others.NOT(compute_R=False), x), 0.000001
+            )
+        # end for
+
+        # Delete, replace, and train a member in place
+        conceptors.delete(1)
+        self.assertTensorAlmostEqual(
+            conceptors.A().C, ecnc.Conceptor.OR_all([members[0], members[2], members[3]]).C, 0.000001
+        )
+        conceptors[3] = members[4]
+        self.assertTensorAlmostEqual(
+            conceptors.Eneg(0, x),
+            ecnc.Conceptor.evidence(members[2].OR(members[4]).NOT(), x),
+            0.000001
+        )
+        members[2].aperture = 2.0
+        self.assertTensorAlmostEqual(
+            conceptors.A().C, ecnc.Conceptor.OR_all([members[0], members[2], members[4]]).C, 0.000001
+        )
+    # end test_set_unions
+
+    # Evidences of all conceptors in one pass
+    def test_evidences(self):
+        """
+        Evidences of all conceptors in one pass
+        """
+        conceptors = ecnc.ConceptorSet(input_dim=30, dtype=torch.float64)
+        for k in range(3):
+            conceptors.add(k, self._conceptor(seed=k))
+        # end for
+        x = torch.randn(2, 40, 30, dtype=torch.float64)
+
+        # Evidences of a conceptor, step by step
+        C = conceptors[1].C
+        expected = torch.tensor([[torch.dot(torch.mv(C, x[b, t]), x[b, t]) / torch.dot(x[b, t], x[b, t])
+                                  for t in range(40)] for b in range(2)], dtype=torch.float64)
+        self.assertTensorAlmostEqual(ecnc.Conceptor.evidence(conceptors[1], x), expected, 0.000001)
+        self.assertTensorAlmostEqual(conceptors[1].E(x[0]), expected[0], 0.000001)
+
+        # Positive, negative and total evidences
+        evidence_functions = [('positive', conceptors.Eplus), ('negative', conceptors.Eneg), ('both', conceptors.E)]
+        for based_on, evidence in evidence_functions:
+            evidences = conceptors.evidences(x, based_on=based_on)
+            self.assertEqual(evidences.size(), (2, 40, 3))
+            for k in range(3):
+                self.assertTensorAlmostEqual(evidences[1, :, k], evidence(k, x[1]), 0.000001)
+            # end for
+            self.assertTensorAlmostEqual(
+                conceptors.evidences(x[0], based_on=based_on, average=True), torch.mean(evidences[0], dim=0), 0.000001
+            )
+        # end for
+    # end test_evidences
+
+    # Similarity and intersection matrices
+    def test_pairwise_matrices(self):
+        """
+        Similarity and intersection matrices
+        """
+        conceptors = ecnc.ConceptorSet(input_dim=30, dtype=torch.float64)
+        for k in range(4):
+            conceptors.add(k, self._conceptor(seed=k, aperture=2.0 + k))
+        # end for
+
+        # Expected matrices, pair by pair
+        similarities = torch.zeros(4, 4)
+        quotas = torch.zeros(4, 4)
+        ranks = torch.zeros(4, 4, dtype=torch.long)
+        for i in range(4):
+            for j in range(4):
+                similarities[i, j] = generalized_squared_cosine(conceptors[i].C, conceptors[j].C)
+                E = ecnc.Conceptor.operator_AND(conceptors[i], conceptors[j])
+                E.PHI(2.0)
+                quotas[i, j] = quota(E.C)
+                ranks[i, j] = rank(E.C)
+            # end for
+        # end for
+
+        # Batched generalized squared cosine, and pairwise with another function
+        self.assertTensorAlmostEqual(conceptors.similarity_matrix(), similarities, 0.0001)
+        self.assertTensorAlmostEqual(
+            conceptors.similarity_matrix(sim_func=lambda a, b: generalized_squared_cosine(a, b)), similarities, 0.0001
+        )
+
+        # Intersections, in this process and in worker processes
+        self.assertTensorAlmostEqual(conceptors.intersection_matrix(gamma=2.0), quotas, 0.0001)
+        self.assertTensorAlmostEqual(conceptors.intersection_matrix(gamma=2.0, n_workers=2), quotas, 0.0001)
+        self.assertTensorEqual(conceptors.intersection_matrix(return_rank=True, gamma=2.0), ranks)
+    # end test_pairwise_matrices
+
+    # Incremental loading with forgetting, diagnostics computed only when read
+    def test_lazy_diagnostics(self):
+        """
+        Incremental loading with forgetting, diagnostics computed only when read
+        """
+        reservoir_size = 50
+        torch.manual_seed(1)
+        w = torch.randn(reservoir_size, reservoir_size, dtype=torch.float64)
+        w *= 1.2 / torch.max(torch.abs(torch.linalg.eigvals(w)))
+        esn_cell = ecnc.IncForgSPESNCell(
+            input_dim=1,
+            output_dim=reservoir_size,
+            conceptors=ecnc.ConceptorSet(input_dim=reservoir_size),
+            w=w,
+            w_in=torch.randn(reservoir_size, 1, dtype=torch.float64) * 1.5,
+            w_bias=torch.randn(reservoir_size, dtype=torch.float64) * 0.25,
+            aperture=10,
+            ridge_param_inc=0.01,
+            ridge_param_up=0.01,
+            washout=50,
+            fill_left=True,
+            loading_method=ecnc.SPESNCell.INPUTS_SIMULATION,
+            dtype=torch.float64
+        )
+
+        # No diagnostic before the first load
+        self.assertEqual(esn_cell.d_rank, 0)
+        self.assertIsNone(esn_cell.d_SVs)
+
+        # Count the ranks, errors and singular values computed for diagnostics
+        cell_module = importlib.import_module('echotorch.nn.conceptors.IncForgSPESNCell')
+        with unittest.mock.patch.object(cell_module, 'rank', wraps=rank) as rank_mock, \
+                unittest.mock.patch.object(cell_module, 'nrmse', wraps=nrmse) as nrmse_mock, \
+                unittest.mock.patch.object(torch.linalg, 'svdvals', wraps=torch.linalg.svdvals) as svdvals_mock:
+            # Loading computes none of them
+            D_before = None
+            for p in range(4):
+                D_before = esn_cell.D.clone()
+                u = torch.sin(torch.arange(150, dtype=torch.float64) * 2.0 * math.pi / (5.0 + 0.7 * p))
+                esn_cell(u.view(1, 150, 1))
+            # end for
+            self.assertEqual(rank_mock.call_count + nrmse_mock.call_count + svdvals_mock.call_count, 0)
+
+            # Reading a diagnostic computes it once for this load
+            d_rank = esn_cell.d_rank
+            esn_cell.d_rank
+            d_SVs = esn_cell.d_SVs
+            dinc_nrmse = esn_cell.dinc_nrmse
+            esn_cell.dinc_nrmse
+            self.assertEqual((rank_mock.call_count, svdvals_mock.call_count, nrmse_mock.call_count), (1, 1, 1))
+        # end with
+
+        # Values of the last load, D before the load rebuilt without a copy
+        self.assertEqual(d_rank, rank(esn_cell.D))
+        self.assertTensorAlmostEqual(d_SVs, torch.svd(esn_cell.D)[1], 0.0001)
+        self.assertAlmostEqual(float(esn_cell.d_magnitude), float(torch.norm(esn_cell.D)), 4)
+        self.assertAlmostEqual(
+            float(esn_cell.d_gradient), float(torch.norm(esn_cell.D) - torch.norm(D_before)), 6
+        )
+        self.assertTensorAlmostEqual(esn_cell._D_before_load(esn_cell._diagnostics_inputs), D_before, 0.000001)
+        self.assertIsInstance(float(dinc_nrmse), float)
+    # end test_lazy_diagnostics
+
+    # endregion TESTS
+
+# end Test_Conceptors
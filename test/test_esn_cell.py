@@ -0,0 +1,558 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_esn_cell.py
+# Description : Test the execution engines of reservoir cells
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.nn.conceptors as ecnc
+import echotorch.nn.reservoir as etrs
+import echotorch.utils.matrix_generation as mg
+from echotorch.nn.reservoir.FreeRunESNCell import FreeRunESNCell
+from echotorch.nn.utils import NoiseGenerator, NoiseInjection
+from . import EchoTorchTestCase
+
+
+# Test case : execution engines of reservoir cells
+class Test_ESN_Cell(EchoTorchTestCase):
+    """
+    Test the execution engines of reservoir cells
+    """
+    # region PRIVATE
+
+    # Create reservoir matrices
+    def _matrices(self, input_dim=3, reservoir_size=30, dtype=torch.float64):
+        """
+        Create reservoir matrices
+        :param input_dim: Input dimension
+        :param reservoir_size: Reservoir size
+        :param dtype: Data type
+        :return: W, Win, Wbias
+        """
+        torch.manual_seed(1)
+        w = torch.randn(reservoir_size, reservoir_size, dtype=dtype) * 0.1
+        w_in = torch.randn(reservoir_size, input_dim, dtype=dtype)
+        w_bias = torch.randn(reservoir_size, dtype=dtype) * 0.1
+        return w, w_in, w_bias
+    # end _matrices
+
+    # Reference states computed sample by sample, step by step
+    def _reference_states(self, u, w, w_in, w_bias, input_scaling=1.0, leaky_rate=1.0, washout=0):
+        """
+        Reference states computed sample by sample, step by step
+        :param u: Inputs (batch size x time length x input dim)
+        :return: States (batch size x time length - washout x reservoir size)
+        """
+        outputs = torch.zeros(u.size(0), u.size(1), w.size(0), dtype=u.dtype)
+        for b in range(u.size(0)):
+            x = torch.zeros(w.size(0), dtype=u.dtype)
+            for t in range(u.size(1)):
+                x_new = torch.tanh(w_in.mv(u[b, t] * input_scaling) + w.mv(x) + w_bias)
+                x = (1.0 - leaky_rate) * x + leaky_rate * x_new
+                outputs[b, t] = x
+            # end for
+        # end for
+        return outputs[:, washout:]
+    # end _reference_states
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Batched recurrence gives the same states as the per-sample recurrence
+    def test_batched_recurrence(self):
+        """
+        Batched recurrence gives the same states as the per-sample recurrence
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(4, 50, 3, dtype=torch.float64)
+
+        # ESN and Li-ESN cells
+        esn_cell = etrs.ESNCell(
+            input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, input_scaling=0.5, washout=10,
+            dtype=torch.float64
+        )
+        li_esn_cell = etrs.LiESNCell(
+            leaky_rate=0.3, input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, input_scaling=0.5,
+            washout=10, dtype=torch.float64
+        )
+
+        # Compare with reference
+        self.assertTensorAlmostEqual(
+            esn_cell(u.clone()),
+            self._reference_states(u, w, w_in, w_bias, input_scaling=0.5, washout=10),
+            0.0001
+        )
+        self.assertTensorAlmostEqual(
+            li_esn_cell(u.clone()),
+            self._reference_states(u, w, w_in, w_bias, input_scaling=0.5, leaky_rate=0.3, washout=10),
+            0.0001
+        )
+        self.assertTensorSize(esn_cell.hidden, [4, 30])
+    # end test_batched_recurrence
+
+    # States carried over between batches without reset
+    def test_reset_state(self):
+        """
+        States carried over between batches without reset
+        """
+        w, w_in, w_bias = self._matrices()
+        u1 = torch.randn(2, 20, 3, dtype=torch.float64)
+        u2 = torch.randn(2, 15, 3, dtype=torch.float64)
+        u3 = torch.randn(3, 15, 3, dtype=torch.float64)
+        esn_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+
+        # Same batch size, each sample continues its own row
+        esn_cell(u1.clone())
+        self.assertTensorAlmostEqual(
+            esn_cell(u2.clone(), reset_state=False),
+            self._reference_states(torch.cat((u1, u2), dim=1), w, w_in, w_bias, washout=20),
+            0.0001
+        )
+
+        # Some samples reset
+        esn_cell(u1.clone())
+        states = esn_cell(u2.clone(), reset_state=[True, False])
+        self.assertTensorAlmostEqual(states[0], self._reference_states(u2, w, w_in, w_bias)[0], 0.0001)
+        self.assertTensorAlmostEqual(
+            states[1],
+            self._reference_states(torch.cat((u1, u2), dim=1), w, w_in, w_bias, washout=20)[1],
+            0.0001
+        )
+
+        # Other batch size, all samples continue from the last sample
+        esn_cell(u1.clone())
+        self.assertTensorAlmostEqual(
+            esn_cell(u3.clone(), reset_state=False),
+            self._reference_states(torch.cat((u1[1:].expand(3, 20, 3), u3), dim=1), w, w_in, w_bias, washout=20),
+            0.0001
+        )
+
+        # The states of the last batch are saved, and loaded into a cell not run yet
+        new_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+        self.assertTensorSize(new_cell.hidden, [30])
+        esn_cell(u1.clone())
+        new_cell.load_state_dict(esn_cell.state_dict())
+        self.assertTensorEqual(new_cell.hidden, esn_cell.hidden)
+        self.assertTensorAlmostEqual(
+            new_cell(u2.clone(), reset_state=False), esn_cell(u2.clone(), reset_state=False), 0.0001
+        )
+
+        # And into a cell run with another batch size
+        new_cell(u3.clone())
+        new_cell.load_state_dict(esn_cell.state_dict())
+        self.assertTensorSize(new_cell.hidden, [2, 30])
+    # end test_reset_state
+
+    # Feedback of each sample's own states in a batch
+    def test_free_run_feedback(self):
+        """
+        Feedback of each sample's own states in a batch
+        """
+        w, w_in, w_bias = self._matrices()
+        w_fdb = torch.randn(3, 30, dtype=torch.float64) * 0.1
+        u = torch.randn(2, 20, 3, dtype=torch.float64)
+        free_run_cell = FreeRunESNCell(
+            feedback_noise=lambda size: 0.0, leaky_rate=1.0, input_dim=3, output_dim=30, w=w, w_in=w_in,
+            w_bias=w_bias, dtype=torch.float64
+        )
+
+        # Samples driven by their inputs, then by the feedback of their previous state
+        last_states = free_run_cell(u.clone())[:, -1]
+        free_run_cell.set_feedbacks(w_fdb)
+        states = free_run_cell(u.clone(), reset_state=False)
+        for b in range(2):
+            x = last_states[b]
+            for t in range(20):
+                x = torch.tanh(w_in.mv(w_fdb.mv(x)) + w.mv(x) + w_bias)
+                self.assertTensorAlmostEqual(states[b, t], x, 0.0001)
+            # end for
+        # end for
+    # end test_free_run_feedback
+
+    # Neural filters are called for each sample and each timestep
+    def test_neural_filters(self):
+        """
+        Neural filters are called for each sample and each timestep
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(3, 20, 3, dtype=torch.float64)
+        esn_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+
+        # Filter which zeroes the states of the second sample
+        calls = list()
+
+        def neural_filter(x, ut, forward_i, sample_i, t, washout):
+            calls.append((sample_i, t))
+            return x * 0.0 if sample_i == 1 else x
+        # end neural_filter
+
+        esn_cell.connect("neural-filter", neural_filter)
+        states = esn_cell(u.clone())
+
+        # Check calls and states
+        self.assertEqual(len(calls), 3 * 20)
+        self.assertTensorAlmostEqual(states[1], torch.zeros(20, 30, dtype=torch.float64), 0.0001)
+        self.assertTensorAlmostEqual(states[0], self._reference_states(u, w, w_in, w_bias)[0], 0.0001)
+    # end test_neural_filters
+
+    # Reset state per sample
+    def test_reset_state_per_sample(self):
+        """
+        Reset state per sample
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(2, 20, 3, dtype=torch.float64)
+        esn_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+
+        # First pass, then continue only the second sample
+        esn_cell(u.clone())
+        states = esn_cell(u.clone(), reset_state=[True, False])
+
+        # Reference for the continued sample
+        reference = self._reference_states(torch.cat((u, u), dim=1), w, w_in, w_bias)
+        self.assertTensorAlmostEqual(states[0], reference[0, :20], 0.0001)
+        self.assertTensorAlmostEqual(states[1], reference[1, 20:], 0.0001)
+    # end test_reset_state_per_sample
+
+    # Cells overriding the input layer are not pre-projected
+    def test_input_projection_override(self):
+        """
+        Cells overriding the input layer are not pre-projected
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(2, 20, 3, dtype=torch.float64)
+
+        # Cell with a doubled input layer
+        class DoubleInputESNCell(etrs.ESNCell):
+            def _input_layer(self, ut):
+                return 2.0 * super(DoubleInputESNCell, self)._input_layer(ut)
+            # end _input_layer
+        # end DoubleInputESNCell
+
+        # Cells
+        esn_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+        double_esn_cell = DoubleInputESNCell(
+            input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64
+        )
+
+        # Pre-projection only for the base cell
+        self.assertIsNotNone(esn_cell._input_projection(u))
+        self.assertIsNone(double_esn_cell._input_projection(u))
+        self.assertTensorAlmostEqual(
+            double_esn_cell(u.clone()),
+            self._reference_states(u, w, 2.0 * w_in, w_bias),
+            0.0001
+        )
+
+        # Cell with a doubled bias in the reservoir layer
+        class DoubleBiasESNCell(etrs.ESNCell):
+            def _reservoir_layer(self, u_win, x_w):
+                return super(DoubleBiasESNCell, self)._reservoir_layer(u_win, x_w) + self.w_bias
+            # end _reservoir_layer
+        # end DoubleBiasESNCell
+
+        # Not pre-projected either, even with the fast path allowed
+        double_bias_cell = DoubleBiasESNCell(
+            input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64
+        )
+        self.assertIsNone(double_bias_cell._input_projection(u))
+        self.assertFalse(double_bias_cell._use_fast_path(False, double_bias_cell._project_inputs(u)))
+        self.assertTensorAlmostEqual(
+            double_bias_cell(u.clone()),
+            self._reference_states(u, w, w_in, 2.0 * w_bias),
+            0.0001
+        )
+    # end test_input_projection_override
+
+    # Sparse reservoir execution
+    def test_sparse_reservoir(self):
+        """
+        Sparse reservoir execution
+        """
+        w, w_in, w_bias = self._matrices(reservoir_size=100)
+        w[torch.rand(100, 100) > 0.02] = 0.0
+        u = torch.randn(2, 30, 3, dtype=torch.float64)
+
+        # Sparse and dense cells
+        sparse_cell = etrs.ESNCell(
+            input_dim=3, output_dim=100, w=w, w_in=w_in, w_bias=w_bias, sparse=True, dtype=torch.float64
+        )
+        dense_cell = etrs.ESNCell(
+            input_dim=3, output_dim=100, w=w, w_in=w_in, w_bias=w_bias, sparse=False, dtype=torch.float64
+        )
+
+        # Same states and spectral radius
+        self.assertTrue(sparse_cell.is_sparse)
+        self.assertFalse(dense_cell.is_sparse)
+        self.assertTensorAlmostEqual(sparse_cell(u.clone()), dense_cell(u.clone()), 0.0001)
+        self.assertAlmostEqual(sparse_cell.spectral_radius, dense_cell.spectral_radius, 4)
+
+        # Change spectral radius on the sparse form
+        sparse_cell.spectral_radius = 0.9
+        self.assertTrue(sparse_cell.is_sparse)
+        self.assertAlmostEqual(sparse_cell.spectral_radius, 0.9, 4)
+
+        # Sparse storage is opt-in
+        w_large = torch.roll(torch.eye(1000, dtype=torch.float64), 1, dims=1)
+        _, w_in_large, w_bias_large = self._matrices(reservoir_size=1000)
+        self.assertFalse(
+            etrs.ESNCell(input_dim=3, output_dim=1000, w=w_large, w_in=w_in_large, w_bias=w_bias_large).is_sparse
+        )
+
+        # State dicts load across dense and sparse storage
+        dense_cell.load_state_dict(sparse_cell.state_dict())
+        self.assertFalse(dense_cell.is_sparse)
+        self.assertAlmostEqual(dense_cell.spectral_radius, 0.9, 4)
+        dense_cell.spectral_radius = 0.5
+        sparse_cell.load_state_dict(dense_cell.state_dict())
+        self.assertTrue(sparse_cell.is_sparse)
+        self.assertTensorAlmostEqual(sparse_cell(u.clone()), dense_cell(u.clone()), 0.0001)
+    # end test_sparse_reservoir
+
+    # Fused recurrence gives the same states as the general loop
+    def test_fast_path(self):
+        """
+        Fused recurrence gives the same states as the general loop
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(3, 40, 3, dtype=torch.float64)
+
+        # Fused and general cells
+        for leaky_rate in [1.0, 0.4]:
+            fast_cell = etrs.LiESNCell(
+                leaky_rate=leaky_rate, input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, washout=5,
+                fast_path=True, dtype=torch.float64
+            )
+            slow_cell = etrs.LiESNCell(
+                leaky_rate=leaky_rate, input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, washout=5,
+                fast_path=False, dtype=torch.float64
+            )
+            self.assertTrue(fast_cell._use_fast_path(False, u))
+            self.assertFalse(slow_cell._use_fast_path(False, u))
+            self.assertTensorAlmostEqual(fast_cell(u.clone()), slow_cell(u.clone()), 0.0001)
+            self.assertTensorAlmostEqual(fast_cell.hidden, slow_cell.hidden, 0.0001)
+
+            # States are carried over
+            self.assertTensorAlmostEqual(
+                fast_cell(u.clone(), reset_state=False),
+                slow_cell(u.clone(), reset_state=False),
+                0.0001
+            )
+        # end for
+
+        # Automatic selection falls back with neural filters, forcing the fast path fails
+        esn_cell = etrs.ESNCell(input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64)
+        self.assertTrue(esn_cell._use_fast_path(esn_cell._has_step_hooks(), u))
+        esn_cell.connect("neural-filter", lambda x, ut, forward_i, sample_i, t, washout: x)
+        self.assertFalse(esn_cell._use_fast_path(esn_cell._has_step_hooks(), u))
+        esn_cell.fast_path = True
+        self.assertRaises(Exception, esn_cell, u.clone())
+    # end test_fast_path
+
+    # Structured reservoir execution
+    def test_structured_reservoir(self):
+        """
+        Structured reservoir execution
+        """
+        _, w_in, w_bias = self._matrices(reservoir_size=100)
+        u = torch.randn(2, 30, 3, dtype=torch.float64)
+
+        # Cycle with jumps and permutation plus diagonal
+        cycle_generator = mg.matrix_factory.get_generator(
+            "cycle_with_jumps", cycle_weight=0.5, jump_weight=0.3, jump_size=7
+        )
+        w_cycle = cycle_generator.generate(size=(100, 100), dtype=torch.float64)
+        w_permutation = torch.eye(100, dtype=torch.float64)[torch.randperm(100)] * 0.7 + \
+            torch.eye(100, dtype=torch.float64) * 0.2
+
+        # For each topology
+        for w in [w_cycle, w_permutation]:
+            structured_cell = etrs.LiESNCell(
+                leaky_rate=0.5, input_dim=3, output_dim=100, w=w, w_in=w_in, w_bias=w_bias, structured=True,
+                dtype=torch.float64
+            )
+            dense_cell = etrs.LiESNCell(
+                leaky_rate=0.5, input_dim=3, output_dim=100, w=w, w_in=w_in, w_bias=w_bias, dtype=torch.float64
+            )
+
+            # Same W, states and spectral radius
+            self.assertTrue(structured_cell.is_structured)
+            self.assertFalse(dense_cell.is_structured)
+            self.assertFalse(structured_cell.is_sparse)
+            self.assertTensorEqual(structured_cell.w, w)
+            self.assertTensorAlmostEqual(structured_cell(u.clone()), dense_cell(u.clone()), 0.0001)
+            structured_cell.fast_path = False
+            self.assertTensorAlmostEqual(structured_cell(u.clone()), dense_cell(u.clone()), 0.0001)
+            self.assertAlmostEqual(structured_cell.spectral_radius, dense_cell.spectral_radius, 4)
+
+            # Change spectral radius on the structure
+            structured_cell.spectral_radius = 0.9
+            self.assertTrue(structured_cell.is_structured)
+            self.assertAlmostEqual(structured_cell.spectral_radius, 0.9, 4)
+        # end for
+
+        # Structured storage is opt-in, and needs few weights per row
+        w_large = torch.roll(torch.eye(400, dtype=torch.float64), 1, dims=1)
+        _, w_in_large, w_bias_large = self._matrices(reservoir_size=400)
+        self.assertFalse(
+            etrs.ESNCell(input_dim=3, output_dim=400, w=w_large, w_in=w_in_large, w_bias=w_bias_large).is_structured
+        )
+        self.assertIsNone(etrs.ESNCell.structure(torch.ones(10, 10), 4))
+        self.assertRaises(
+            Exception, etrs.ESNCell, input_dim=3, output_dim=100, w=torch.ones(100, 100, dtype=torch.float64),
+            w_in=w_in, w_bias=w_bias, structured=True, dtype=torch.float64
+        )
+
+        # Assigning W stores its structure, or fails with too many weights per row
+        structured_cell = etrs.ESNCell(
+            input_dim=3, output_dim=100, w=w_cycle, w_in=w_in, w_bias=w_bias, structured=True, dtype=torch.float64
+        )
+        structured_cell.w = w_permutation
+        self.assertTrue(structured_cell.is_structured)
+        self.assertTensorEqual(structured_cell.w, w_permutation)
+        with self.assertRaises(Exception):
+            structured_cell.w = torch.ones(100, 100, dtype=torch.float64)
+        # end with
+
+        # State dicts load across dense and structured storage
+        dense_cell = etrs.ESNCell(
+            input_dim=3, output_dim=100, w=w_cycle, w_in=w_in, w_bias=w_bias, dtype=torch.float64
+        )
+        self.assertNotIn('w', structured_cell.state_dict())
+        dense_cell.load_state_dict(structured_cell.state_dict())
+        self.assertTensorEqual(dense_cell.w, w_permutation)
+        dense_cell.w = w_cycle
+        structured_cell.load_state_dict(dense_cell.state_dict())
+        self.assertTrue(structured_cell.is_structured)
+        self.assertTensorEqual(structured_cell.w, w_cycle)
+        self.assertTensorAlmostEqual(structured_cell(u.clone()), dense_cell(u.clone()), 0.0001)
+    # end test_structured_reservoir
+
+    # Seeded noise drawn in bulk
+    def test_noise_generator(self):
+        """
+        Seeded noise drawn in bulk
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(3, 25, 3, dtype=torch.float64)
+
+        # Bulk and step by step draws are identical
+        noise_generator = NoiseGenerator(std=0.1, seed=5, dtype=torch.float64)
+        bulk_noise = noise_generator.sample_sequence(3, 25, 30)
+        noise_generator.reset()
+        step_noise = torch.stack([noise_generator.sample((3, 30)) for _ in range(25)], dim=1)
+        self.assertTensorEqual(bulk_noise, step_noise)
+
+        # Fused and general loop give identical states with the same seed
+        states = list()
+        for fast_path in [True, False]:
+            esn_cell = etrs.LiESNCell(
+                leaky_rate=0.5, input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, fast_path=fast_path,
+                noise_generator=NoiseGenerator(std=0.1, seed=5, dtype=torch.float64), dtype=torch.float64
+            )
+            states.append(esn_cell(u.clone()))
+        # end for
+        self.assertTensorEqual(states[0], states[1])
+
+        # Noise functions are still called for each timestep and each sample
+        calls = list()
+
+        def noise_function(size):
+            calls.append(size)
+            return torch.zeros(size, dtype=torch.float64)
+        # end noise_function
+
+        esn_cell = etrs.ESNCell(
+            input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, noise_generator=noise_function,
+            dtype=torch.float64
+        )
+        self.assertTensorAlmostEqual(esn_cell(u.clone()), self._reference_states(u, w, w_in, w_bias), 0.0001)
+        self.assertEqual(calls, [30] * 3 * 25)
+
+        # In the order of the per-sample loop, all timesteps of a sample before the next sample
+        def counter_function(size):
+            calls.append(size)
+            return torch.full((size,), float(len(calls) - 1), dtype=torch.float64)
+        # end counter_function
+
+        calls.clear()
+        esn_cell = etrs.ESNCell(
+            input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, noise_generator=counter_function,
+            dtype=torch.float64
+        )
+        order = torch.arange(3 * 25, dtype=torch.float64).view(3, 25, 1).expand(3, 25, 30)
+        self.assertTensorEqual(esn_cell._noise_block(3, 25), order)
+
+        # Noise injection shares the generator
+        noise_injection = NoiseInjection(
+            input_dim=30, noise_generator=NoiseGenerator(std=0.1, seed=5, dtype=torch.float64), dtype=torch.float64
+        )
+        self.assertTensorEqual(noise_injection(torch.zeros(3, 25, 30, dtype=torch.float64)), bulk_noise)
+    # end test_noise_generator
+
+    # States are only stored after the washout
+    def test_washout_storage(self):
+        """
+        States are only stored after the washout
+        """
+        w, w_in, w_bias = self._matrices()
+        u = torch.randn(3, 40, 3, dtype=torch.float64)
+        reference = self._reference_states(u, w, w_in, w_bias, leaky_rate=0.5)
+
+        # Fused and general loop write into a view of a caller-provided tensor
+        for fast_path in [True, False]:
+            esn_cell = etrs.LiESNCell(
+                leaky_rate=0.5, input_dim=3, output_dim=30, w=w, w_in=w_in, w_bias=w_bias, washout=15,
+                fast_path=fast_path, dtype=torch.float64
+            )
+            buffer = torch.zeros(3, 25, 40, dtype=torch.float64)
+            states = esn_cell(u.clone(), out=buffer[:, :, 5:35])
+            self.assertEqual(states.size(), (3, 25, 30))
+            self.assertTensorAlmostEqual(buffer[:, :, 5:35], reference[:, 15:], 0.0001)
+            self.assertEqual(buffer[:, :, :5].abs().sum().item(), 0.0)
+
+            # Washout longer than the sequences, last states are kept
+            self.assertEqual(esn_cell(u.clone(), washout=50).size(), (3, 0, 30))
+            self.assertTensorAlmostEqual(esn_cell.hidden, reference[:, -1], 0.0001)
+        # end for
+
+        # Deep ESN with a washout gives the same output layer as the chunked fit
+        y = torch.randn(3, 40, 1, dtype=torch.float64)
+        w_in_upper = {'IF': w, 'IA': torch.cat((w, w_in), dim=1), 'GE': w_in}
+        for input_type in ['IF', 'IA', 'GE']:
+            deep_esns = [
+                etrs.DeepESN(
+                    n_layers=2, input_dim=3, hidden_dim=30, output_dim=1, w_generator=w,
+                    win_generator=[w_in, w_in_upper[input_type]], wbias_generator=w_bias, leak_rate=[0.3, 0.6],
+                    ridge_param=0.001, washout=10,
+                    input_type=input_type, dtype=torch.float64
+                )
+                for _ in range(2)
+            ]
+            deep_esns[0](u.clone(), y)
+            deep_esns[1].fit(u.clone(), y, chunk_size=7)
+            self.assertTensorAlmostEqual(deep_esns[0]._output.xTx, deep_esns[1]._output.xTx, 0.0001)
+            self.assertTensorAlmostEqual(deep_esns[0]._output.xTy, deep_esns[1]._output.xTy, 0.0001)
+        # end for
+    # end test_washout_storage
+
+    # endregion TESTS
+
+# end Test_ESN_Cell
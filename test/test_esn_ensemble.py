@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_esn_ensemble.py
+# Description : Test the ensemble of ESNs and the batch evaluation of populations
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.nn.conceptors as ecnc
+import echotorch.nn.reservoir as etrs
+import echotorch.models.reservoir as etmr
+import echotorch.utils.optimization as optim
+from . import EchoTorchTestCase
+
+
+# Test case : ensemble of ESNs
+class Test_ESN_Ensemble(EchoTorchTestCase):
+    """
+    Test the ensemble of ESNs and the batch evaluation of populations
+    """
+    # region PRIVATE
+
+    # Reservoir matrices of each member
+    def _members(self, sizes, input_dim=2):
+        """
+        Reservoir matrices of each member
+        :param sizes: Reservoir sizes
+        :param input_dim: Input dimension
+        :return: Lists of W, Win and Wbias
+        """
+        torch.manual_seed(1)
+        w = [torch.randn(n, n, dtype=torch.float64) * 0.1 for n in sizes]
+        w_in = [torch.randn(n, input_dim, dtype=torch.float64) for n in sizes]
+        w_bias = [torch.randn(n, dtype=torch.float64) * 0.1 for n in sizes]
+        return w, w_in, w_bias
+    # end _members
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Ensemble gives the same outputs as independent Li-ESNs
+    def test_ensemble_outputs(self):
+        """
+        Ensemble gives the same outputs as independent Li-ESNs
+        """
+        sizes, leaky_rates, ridge_params = [20, 30, 25], [1.0, 0.5, 0.3], [0.001, 0.01, 0.1]
+        w, w_in, w_bias = self._members(sizes)
+        u = torch.randn(3, 60, 2, dtype=torch.float64)
+        y = torch.randn(3, 60, 1, dtype=torch.float64)
+
+        # Train the ensemble
+        esn_ensemble = etrs.ESNEnsemble(
+            input_dim=2, output_dim=1, w=w, w_in=w_in, w_bias=w_bias, leaky_rate=leaky_rates,
+            ridge_param=ridge_params, washout=5, dtype=torch.float64
+        )
+        esn_ensemble(u, y)
+        esn_ensemble.finalize()
+        outputs = esn_ensemble(u)
+        self.assertTensorSize(outputs, [3, 3, 55, 1])
+
+        # Compare with each Li-ESN
+        for member_i, reservoir_size in enumerate(sizes):
+            li_esn = etmr.LiESN(
+                input_dim=2, hidden_dim=reservoir_size, output_dim=1, leaky_rate=leaky_rates[member_i],
+                w_generator=w[member_i], win_generator=w_in[member_i], wbias_generator=w_bias[member_i],
+                ridge_param=ridge_params[member_i], washout=5, dtype=torch.float64
+            )
+            li_esn(u, y)
+            li_esn.finalize()
+            self.assertTensorAlmostEqual(outputs[member_i], li_esn(u), 0.0001)
+        # end for
+    # end test_ensemble_outputs
+
+    # Optimizers score a whole population in one call
+    def test_batch_evaluation(self):
+        """
+        Optimizers score a whole population in one call
+        """
+        u = torch.randn(2, 50, 2, dtype=torch.float64)
+        y = u[:, :, :1].clone()
+        calls = list()
+
+        # Score a population with one ensemble
+        def population_function(population, datasets):
+            calls.append(len(population))
+            w, w_in, w_bias = self._members([20] * len(population))
+            esn_ensemble = etrs.ESNEnsemble(
+                input_dim=2, output_dim=1, w=w, w_in=w_in, w_bias=w_bias,
+                leaky_rate=[p['leaky_rate'] for p in population], ridge_param=[p['ridge_param'] for p in population],
+                dtype=torch.float64
+            )
+            esn_ensemble(*datasets)
+            esn_ensemble.finalize()
+            errors = torch.mean((esn_ensemble(datasets[0]) - datasets[1]) ** 2, dim=(1, 2, 3))
+            return [esn_ensemble] * len(population), errors.tolist()
+        # end population_function
+
+        # Grid search by batches of 4
+        grid_optimizer = optim.optimizer_factory.get_optimizer('grid-search', batch_evaluation=True, batch_size=4)
+        _, best_param, best_error = grid_optimizer.optimize(
+            population_function,
+            {'leaky_rate': [0.2, 0.6, 1.0], 'ridge_param': [0.0001, 10.0]},
+            (u, y)
+        )
+        self.assertEqual(calls, [4, 2, 1])
+        self.assertEqual(best_param['ridge_param'], 0.0001)
+    # end test_batch_evaluation
+
+    # endregion TESTS
+
+# end Test_ESN_Ensemble
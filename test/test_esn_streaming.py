@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_esn_streaming.py
+# Description : Test the streaming APIs of ESN models
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import torch
+import echotorch.nn.conceptors as ecnc
+import echotorch.models.reservoir as etmr
+import echotorch.nn.reservoir as etrs
+from . import EchoTorchTestCase
+
+
+# Test case : streaming APIs
+class Test_ESN_Streaming(EchoTorchTestCase):
+    """
+    Test the streaming APIs of ESN models
+    """
+    # region PRIVATE
+
+    # Create and train a Li-ESN
+    def _trained_li_esn(self, input_dim=2, hidden_dim=40, output_dim=1):
+        """
+        Create and train a Li-ESN
+        :param input_dim: Input dimension
+        :param hidden_dim: Reservoir size
+        :param output_dim: Output dimension
+        :return: Trained Li-ESN
+        """
+        torch.manual_seed(1)
+        w = torch.randn(hidden_dim, hidden_dim, dtype=torch.float64) * 0.1
+        w_in = torch.randn(hidden_dim, input_dim, dtype=torch.float64)
+        w_bias = torch.randn(hidden_dim, dtype=torch.float64) * 0.1
+        li_esn = etmr.LiESN(
+            input_dim=input_dim, hidden_dim=hidden_dim, output_dim=output_dim, leaky_rate=0.5, w_generator=w,
+            win_generator=w_in, wbias_generator=w_bias, ridge_param=0.001, dtype=torch.float64
+        )
+
+        # Train on a random regression
+        u = torch.randn(4, 100, input_dim, dtype=torch.float64)
+        y = torch.randn(4, 100, output_dim, dtype=torch.float64)
+        li_esn(u, y)
+        li_esn.finalize()
+        return li_esn
+    # end _trained_li_esn
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Chunks and steps give the same outputs as the whole sequence
+    def test_push_chunk_and_step(self):
+        """
+        Chunks and steps give the same outputs as the whole sequence
+        """
+        li_esn = self._trained_li_esn()
+        u = torch.randn(3, 30, 2, dtype=torch.float64)
+        reference = li_esn(u.clone())
+
+        # Streams 0, 1, 2 in chunks
+        outputs = torch.cat((li_esn.push_chunk(u[:, :10]), li_esn.push_chunk(u[:, 10:25])), dim=1)
+        self.assertTensorAlmostEqual(outputs, reference[:, :25], 0.0001)
+
+        # Finish streams 2 and 0 step by step, in another order
+        for t in range(25, 30):
+            self.assertTensorAlmostEqual(
+                li_esn.step(u[[2, 0], t], stream_ids=[2, 0]),
+                reference[[2, 0], t],
+                0.0001
+            )
+        # end for
+
+        # A new stream starts from a zero state
+        self.assertTensorAlmostEqual(li_esn.push_chunk(u[1, :5], stream_ids=['new']), reference[1, :5], 0.0001)
+        self.assertEqual(li_esn.streams, [0, 1, 2, 'new'])
+
+        # Closing a stream keeps the others
+        li_esn.close_stream(0)
+        self.assertEqual(li_esn.streams, [1, 2, 'new'])
+        self.assertTensorAlmostEqual(li_esn.step(u[1, 25], stream_ids=[1]), reference[1, 25], 0.0001)
+        li_esn.reset_streams()
+        self.assertTensorSize(li_esn.stream_states, [0, 40])
+    # end test_push_chunk_and_step
+
+    # Open streams are not saved with the model
+    def test_streams_state_dict(self):
+        """
+        Open streams are not saved with the model
+        """
+        li_esn = self._trained_li_esn()
+        li_esn.push_chunk(torch.randn(3, 10, 2, dtype=torch.float64))
+        self.assertNotIn('stream_states', li_esn.state_dict())
+
+        # A model without streams loads the state dict
+        other_esn = self._trained_li_esn()
+        other_esn.load_state_dict(li_esn.state_dict())
+        self.assertEqual(other_esn.streams, [])
+        self.assertTensorSize(other_esn.stream_states, [0, 40])
+    # end test_streams_state_dict
+
+    # Chunked fit gives the same output layer as forward
+    def test_fit(self):
+        """
+        Chunked fit gives the same output layer as forward
+        """
+        torch.manual_seed(2)
+        w = torch.randn(30, 30, dtype=torch.float64) * 0.1
+        w_in = torch.randn(30, 2, dtype=torch.float64)
+        w_bias = torch.randn(30, dtype=torch.float64) * 0.1
+        u = torch.randn(3, 95, 2, dtype=torch.float64)
+        y = torch.randn(3, 95, 1, dtype=torch.float64)
+
+        # Forward and chunked fit
+        li_esns = [
+            etmr.LiESN(
+                input_dim=2, hidden_dim=30, output_dim=1, leaky_rate=0.3, w_generator=w, win_generator=w_in,
+                wbias_generator=w_bias, ridge_param=0.001, washout=12, dtype=torch.float64
+            )
+            for _ in range(2)
+        ]
+        li_esns[0](u.clone(), y)
+        li_esns[1].fit(u.clone(), y, chunk_size=10)
+        self.assertTensorAlmostEqual(li_esns[0].output.xTx, li_esns[1].output.xTx, 0.0001)
+        self.assertTensorAlmostEqual(li_esns[0].output.xTy, li_esns[1].output.xTy, 0.0001)
+        self.assertTensorAlmostEqual(li_esns[0].hidden, li_esns[1].hidden, 0.0001)
+        self.assertEqual(li_esns[0].output._n_samples, li_esns[1].output._n_samples)
+        li_esns[0].finalize()
+        li_esns[1].finalize()
+        self.assertTensorAlmostEqual(li_esns[0].w_out, li_esns[1].w_out, 0.0001)
+
+        # Deep ESN
+        deep_esns = [
+            etrs.DeepESN(
+                n_layers=2, input_dim=2, hidden_dim=30, output_dim=1, w_generator=w, win_generator=[w_in, w],
+                wbias_generator=w_bias, leak_rate=[0.3, 0.6], ridge_param=0.001, dtype=torch.float64
+            )
+            for _ in range(2)
+        ]
+        deep_esns[0](u.clone(), y)
+        deep_esns[1].fit(u.clone(), y, chunk_size=7)
+        self.assertTensorAlmostEqual(deep_esns[0]._output.xTx, deep_esns[1]._output.xTx, 0.0001)
+        self.assertTensorAlmostEqual(deep_esns[0]._output.xTy, deep_esns[1]._output.xTy, 0.0001)
+    # end test_fit
+
+    # endregion TESTS
+
+# end Test_ESN_Streaming
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+#
+# File : test/test_rr_cell.py
+# Description : Test ridge regression output layers
+# Date : 16th of October, 2026
+#
+# This file is part of EchoTorch.  EchoTorch is free software: you can
+# redistribute it and/or modify it under the terms of the GNU General Public
+# License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright Nils Schaetti <nils.schaetti@unine.ch>
+
+# Imports
+import os
+import tempfile
+import unittest.mock
+import torch
+from torch.utils.data import TensorDataset
+import echotorch.nn.conceptors as ecnc
+import echotorch.models.reservoir as etmr
+from echotorch.nn.features.PCACell import PCACell
+from echotorch.nn.linear import RRCell, IncRRCell, IncForgRRCell, MultiHeadRRCell, RLSCell
+from echotorch.nn.utils import SufficientStatistics
+from echotorch.utils import parallel_fit, parallel_statistics, quantize_model
+from . import EchoTorchTestCase
+
+
+# Test case : ridge regression output layers
+class Test_RR_Cell(EchoTorchTestCase):
+    """
+    Test ridge regression output layers
+    """
+    # region PRIVATE
+
+    # Create states and targets
+    def _data(self, n_batches=4, time_length=50, input_dim=20, output_dim=2, dtype=torch.float64):
+        """
+        Create states and targets
+        :return: States (batch size x time length x input dim), targets (batch size x time length x output dim)
+        """
+        torch.manual_seed(3)
+        x = torch.tanh(torch.randn(n_batches, time_length, input_dim, dtype=dtype))
+        w = torch.randn(input_dim, output_dim, dtype=dtype)
+        y = torch.matmul(x, w) + 0.3 * torch.randn(n_batches, time_length, output_dim, dtype=dtype)
+        return x, y
+    # end _data
+
+    # endregion PRIVATE
+
+    # region TESTS
+
+    # Several ridge parameters from one eigendecomposition
+    def test_ridge_path(self):
+        """
+        Several ridge parameters from one eigendecomposition
+        """
+        x, y = self._data()
+        ridge_params = [0.0001, 0.01, 0.1, 1.0, 10.0]
+
+        # For each normalization
+        for averaged in [True, False]:
+            multi_cell = RRCell(
+                input_dim=20, output_dim=2, ridge_param=ridge_params, averaged=averaged, dtype=torch.float64
+            )
+            multi_cell(x, y)
+            w_outs, gcv_scores = multi_cell.ridge_path(ridge_params)
+
+            # Same weights as one finalize per ridge parameter
+            for ridge_i, ridge_param in enumerate(ridge_params):
+                rr_cell = RRCell(
+                    input_dim=20, output_dim=2, ridge_param=ridge_param, averaged=averaged, dtype=torch.float64
+                )
+                rr_cell(x, y)
+                rr_cell.finalize()
+                self.assertTensorAlmostEqual(w_outs[ridge_i], rr_cell.w_out, 0.0001)
+            # end for
+
+            # GCV scores from the data
+            x_bias = torch.cat((torch.ones(200, 1, dtype=torch.float64), x.reshape(-1, 20)), dim=1)
+            y_flat = y.reshape(-1, 2)
+            scale = 1.0 / 200.0 if averaged else 1.0
+            for ridge_i, ridge_param in enumerate(ridge_params):
+                hat = x_bias.mm(
+                    torch.linalg.inv(scale * x_bias.t().mm(x_bias) + ridge_param * torch.eye(21, dtype=torch.float64))
+                ).mm(x_bias.t()) * scale
+                mse = ((y_flat - hat.mm(y_flat)) ** 2).mean()
+                gcv = mse / (1.0 - torch.trace(hat) / 200.0) ** 2
+                self.assertAlmostEqual(gcv_scores[ridge_i].item(), gcv.item(), 6)
+            # end for
+
+            # Finalize keeps the best ridge parameter
+            multi_cell.finalize()
+            best = int(torch.argmin(gcv_scores).item())
+            self.assertEqual(multi_cell.selected_ridge_param, ridge_params[best])
+            self.assertTensorAlmostEqual(multi_cell.w_out, w_outs[best], 0.0001)
+            self.assertTensorAlmostEqual(multi_cell.ridge_path(ridge_params)[1], gcv_scores, 0.0001)
+            self.assertEqual(multi_cell(x).size(), (4, 50, 2))
+        # end for
+    # end test_ridge_path
+
+    # Learning methods and float64 accumulation
+    def test_learning_algos(self):
+        """
+        Learning methods and float64 accumulation
+        """
+        x, y = self._data()
+
+        # Reference with the inverse
+        rr_cell = RRCell(input_dim=20, output_dim=2, ridge_param=0.01, learning_algo='inv', dtype=torch.float64)
+        rr_cell(x, y)
+        rr_cell.finalize()
+
+        # Same weights with each learning method
+        for learning_algo in ['pinv', 'cholesky', 'solve', 'lstsq', 'eigh']:
+            algo_cell = RRCell(
+                input_dim=20, output_dim=2, ridge_param=0.01, learning_algo=learning_algo, dtype=torch.float64
+            )
+            algo_cell(x, y)
+            algo_cell.finalize()
+            self.assertTensorAlmostEqual(algo_cell.w_out, rr_cell.w_out, 0.0001)
+        # end for
+
+        # Float32 states accumulated in float64
+        acc_cell = RRCell(
+            input_dim=20, output_dim=2, ridge_param=0.01, learning_algo='cholesky', accumulation_dtype=torch.float64
+        )
+        acc_cell(x.float(), y.float())
+        self.assertEqual(acc_cell.xTx.dtype, torch.float64)
+        acc_cell.finalize()
+        self.assertEqual(acc_cell.w_out.dtype, torch.float32)
+        self.assertTensorAlmostEqual(acc_cell.w_out.double(), rr_cell.w_out, 0.0001)
+        self.assertEqual(acc_cell(x.float()).dtype, torch.float32)
+
+        # Cholesky needs a positive definite matrix
+        singular_cell = RRCell(input_dim=20, output_dim=2, learning_algo='cholesky', dtype=torch.float64)
+        singular_cell(x[:, :5, :], y[:, :5, :])
+        self.assertRaises(Exception, singular_cell.finalize)
+    # end test_learning_algos
+
+    # Batched accumulation and inference give the sample by sample results
+    def test_batched_forward(self):
+        """
+        Batched accumulation and inference give the sample by sample results
+        """
+        x, y = self._data(n_batches=3, time_length=40, input_dim=10, output_dim=2)
+        x_bias = torch.cat((torch.ones(3, 40, 1, dtype=torch.float64), x), dim=2)
+
+        for averaged in (True, False):
+            rr_cell = RRCell(input_dim=10, output_dim=2, ridge_param=0.01, averaged=averaged, dtype=torch.float64)
+            rr_cell(x, y)
+
+            # Each sample weighted by 1 / time length in averaged mode
+            xTx = torch.zeros(11, 11, dtype=torch.float64)
+            xTy = torch.zeros(11, 2, dtype=torch.float64)
+            for b in range(3):
+                xTx += x_bias[b].t().mm(x_bias[b]) / (40.0 if averaged else 1.0)
+                xTy += x_bias[b].t().mm(y[b]) / (40.0 if averaged else 1.0)
+            # end for
+            self.assertTensorAlmostEqual(rr_cell.xTx, xTx, 0.000001)
+            self.assertTensorAlmostEqual(rr_cell.xTy, xTy, 0.000001)
+            self.assertEqual(rr_cell._n_samples, 3.0 if averaged else 0)
+
+            # Outputs of all samples at once
+            rr_cell.finalize()
+            rr_cell.train(False)
+            outputs = rr_cell(x)
+            for b in range(3):
+                self.assertTensorAlmostEqual(outputs[b], torch.mm(rr_cell.w_out, x_bias[b].t()).t(), 0.000001)
+            # end for
+        # end for
+    # end test_batched_forward
+
+    # Batched inference and free space computed once per batch in the incremental cell
+    def test_incremental_batch(self):
+        """
+        Batched inference and free space computed once per batch in the incremental cell
+        """
+        x, y = self._data(n_batches=3, time_length=40, input_dim=10, output_dim=1)
+
+        # Conceptor occupying part of the space
+        conceptor = ecnc.Conceptor(input_dim=10, aperture=1.0, dtype=torch.float64)
+        conceptor(torch.randn(1, 100, 10, dtype=torch.float64) * torch.linspace(0.1, 1.0, 10, dtype=torch.float64))
+        conceptor.finalize()
+        conceptors = ecnc.ConceptorSet(input_dim=10, dtype=torch.float64)
+        conceptors.add(0, conceptor)
+
+        # Batched and sample by sample training
+        inc_cells = [
+            IncRRCell(input_dim=10, output_dim=1, conceptors=conceptors, ridge_param=0.01, dtype=torch.float64)
+            for _ in range(2)
+        ]
+        inc_cells[0](x, y)
+        for b in range(3):
+            inc_cells[1]._update_Wout_loading(x[b], y[b])
+        # end for
+        self.assertTensorAlmostEqual(inc_cells[0].w_out, inc_cells[1].w_out, 0.0001)
+
+        # Batched inference
+        inc_cells[0].train(False)
+        outputs = inc_cells[0](x)
+        for b in range(3):
+            self.assertTensorAlmostEqual(outputs[b], torch.mm(inc_cells[0].w_out, x[b].t()).t(), 0.0001)
+        # end for
+    # end test_incremental_batch
+
+    # Recursive least squares readout
+    def test_rls(self):
+        """
+        Recursive least squares readout
+        """
+        x, y = self._data(n_batches=3, time_length=30, input_dim=8)
+
+        # Ridge regression on all samples
+        rr_cell = RRCell(input_dim=8, output_dim=2, ridge_param=0.5, averaged=False, dtype=torch.float64)
+        rr_cell(x, y)
+        rr_cell.finalize()
+
+        # Same weights whatever the form and the chunk size
+        for square_root in [False, True]:
+            for chunk_size in [1, 7]:
+                rls_cell = RLSCell(
+                    input_dim=8, output_dim=2, ridge_param=0.5, chunk_size=chunk_size, square_root=square_root,
+                    dtype=torch.float64
+                )
+                outputs = rls_cell(x, y)
+                self.assertEqual(outputs.size(), (3, 30, 2))
+                self.assertTensorAlmostEqual(rls_cell.w_out, rr_cell.w_out, 0.0001)
+            # end for
+        # end for
+
+        # Forgetting factor, past timesteps are weighted by forgetting^age
+        x_bias = torch.cat((torch.ones(3, 30, 1, dtype=torch.float64), x), dim=2)
+        weights = torch.pow(0.9, torch.arange(29, -1, -1, dtype=torch.float64)).view(1, 30, 1)
+        xTx = torch.einsum('bti,btj->ij', x_bias * weights, x_bias)
+        xTx += 0.5 * 0.9 ** 30 * torch.eye(9, dtype=torch.float64)
+        xTy = torch.einsum('bti,btj->ij', x_bias * weights, y)
+        for square_root in [False, True]:
+            rls_cell = RLSCell(
+                input_dim=8, output_dim=2, ridge_param=0.5, forgetting_factor=0.9, chunk_size=4,
+                square_root=square_root, dtype=torch.float64
+            )
+            rls_cell(x, y)
+            self.assertTensorAlmostEqual(rls_cell.w_out, torch.linalg.solve(xTx, xTy).t(), 0.0001)
+        # end for
+
+        # One readout per stream
+        rls_cell = RLSCell(input_dim=8, output_dim=2, ridge_param=0.5, n_streams=3, dtype=torch.float64)
+        rls_cell(x, y)
+        for b in range(3):
+            stream_cell = RRCell(input_dim=8, output_dim=2, ridge_param=0.5, averaged=False, dtype=torch.float64)
+            stream_cell(x[b:b + 1], y[b:b + 1])
+            stream_cell.finalize()
+            self.assertTensorAlmostEqual(rls_cell.w_out[b], stream_cell.w_out, 0.0001)
+        # end for
+        self.assertRaises(Exception, rls_cell, x[:2], y[:2])
+
+        # Drop-in output layer of an ESN
+        esns = [
+            etmr.ESN(
+                input_dim=8, hidden_dim=20, output_dim=2, w_generator=torch.randn(20, 20, dtype=torch.float64) * 0.1,
+                win_generator=torch.randn(20, 8, dtype=torch.float64),
+                wbias_generator=torch.zeros(20, dtype=torch.float64), ridge_param=0.5, washout=5, dtype=torch.float64
+            )
+            for _ in range(2)
+        ]
+        esns[0].output = RRCell(input_dim=20, output_dim=2, ridge_param=0.5, averaged=False, dtype=torch.float64)
+        esns[1].output = RLSCell(input_dim=20, output_dim=2, ridge_param=0.5, dtype=torch.float64)
+        esns[1].w.copy_(esns[0].w)
+        esns[1].w_in.copy_(esns[0].w_in)
+        self.assertIsInstance(esns[1].output, RLSCell)
+        self.assertNotIn('output', esns[1]._modules)
+
+        # The RLS readout is updated online, during forward
+        with unittest.mock.patch.object(RLSCell, '_update', autospec=True, side_effect=RLSCell._update) as rls_update:
+            esns[1](x, y)
+        # end with
+        self.assertGreater(rls_update.call_count, 0)
+        self.assertGreater(float(torch.norm(esns[1].w_out)), 0.0)
+        esns[0](x, y)
+        for esn in esns:
+            esn.finalize()
+        # end for
+        self.assertTensorAlmostEqual(esns[1].w_out, esns[0].w_out, 0.0001)
+        self.assertTensorAlmostEqual(esns[1](x), esns[0](x), 0.0001)
+    # end test_rls
+
+    # Low-rank (Woodbury) increments in the incremental cells
+    def test_incremental_woodbury(self):
+        """
+        Low-rank (Woodbury) increments in the incremental cells
+        """
+        x, y = self._data(n_batches=4, time_length=20, input_dim=60, output_dim=1)
+
+        # Conceptor occupying part of the space
+        conceptor = ecnc.Conceptor(input_dim=60, aperture=1.0, dtype=torch.float64)
+        conceptor(torch.randn(1, 100, 60, dtype=torch.float64) * torch.linspace(0.1, 1.0, 60, dtype=torch.float64))
+        conceptor.finalize()
+        conceptors = ecnc.ConceptorSet(input_dim=60, dtype=torch.float64)
+        conceptors.add(0, conceptor)
+
+        # Same readout as the full inverse, with fewer and more timesteps than neurons
+        for time_length in [20, 10]:
+            for averaged in [True, False]:
+                inc_cells = [
+                    IncRRCell(
+                        input_dim=60, output_dim=1, conceptors=conceptors, ridge_param=0.01, learning_algo=algo,
+                        averaged=averaged, dtype=torch.float64
+                    )
+                    for algo in ['inv', 'woodbury']
+                ]
+                forg_cells = [
+                    IncForgRRCell(
+                        aperture=1.0, input_dim=60, output_dim=1, conceptors=conceptors, ridge_param_inc=0.01,
+                        ridge_param_up=0.01, learning_algo=algo, averaged=averaged, dtype=torch.float64
+                    )
+                    for algo in ['inv', 'woodbury']
+                ]
+                for cells in [inc_cells, forg_cells]:
+                    for cell in cells:
+                        cell(x[:, :time_length], y[:, :time_length])
+                    # end for
+                    self.assertTensorAlmostEqual(cells[1].w_out, cells[0].w_out, 0.0001)
+                # end for
+            # end for
+        # end for
+
+        # A positive ridge parameter is needed
+        cell = IncRRCell(input_dim=60, output_dim=1, conceptors=conceptors, learning_algo='woodbury', dtype=torch.float64)
+        self.assertRaises(Exception, cell, x, y)
+    # end test_incremental_woodbury
+
+    # Several readouts on one reservoir pass
+    def test_multi_head(self):
+        """
+        Several readouts on one reservoir pass
+        """
+        x, y = self._data(n_batches=3, time_length=60, input_dim=8, output_dim=3)
+        targets = {'now': y[:, :, :1], 'later': y[:, :, 1:]}
+
+        # Multi-head ESN trained with forward() and with fit(), one ESN per head
+        esns = [
+            etmr.ESN(
+                input_dim=8, hidden_dim=20, output_dim=output_dim, w_generator=torch.randn(20, 20, dtype=torch.float64) * 0.1,
+                win_generator=torch.randn(20, 8, dtype=torch.float64),
+                wbias_generator=torch.zeros(20, dtype=torch.float64), ridge_param=0.1, washout=5, dtype=torch.float64
+            )
+            for output_dim in [3, 3, 1, 2]
+        ]
+        for esn in esns[1:]:
+            esn.w.copy_(esns[0].w)
+            esn.w_in.copy_(esns[0].w_in)
+        # end for
+        for esn in esns[:2]:
+            esn.output = MultiHeadRRCell(
+                input_dim=20, heads={'now': 1, 'later': 2}, ridge_param=0.1, dtype=torch.float64
+            )
+        # end for
+        esns[0](x, targets)
+        esns[1].fit(x, targets, chunk_size=7)
+        esns[2](x, targets['now'])
+        esns[3](x, targets['later'])
+        for esn in esns:
+            esn.finalize()
+        # end for
+
+        # Same outputs for each head
+        for esn in esns[:2]:
+            outputs = esn(x)
+            self.assertEqual(set(outputs.keys()), {'now', 'later'})
+            self.assertTensorAlmostEqual(outputs['now'], esns[2](x), 0.0001)
+            self.assertTensorAlmostEqual(outputs['later'], esns[3](x), 0.0001)
+            self.assertTensorAlmostEqual(esn.output.head_w_out('later'), esns[3].w_out, 0.0001)
+        # end for
+
+        # Targets of every head are needed
+        cell = MultiHeadRRCell(input_dim=8, heads={'now': 1, 'later': 2}, dtype=torch.float64)
+        self.assertRaises(Exception, cell, x, {'now': targets['now']})
+    # end test_multi_head
+
+    # Quantized input and output weights
+    def test_quantization(self):
+        """
+        Quantized input and output weights
+        """
+        x, y = self._data(n_batches=3, time_length=100, input_dim=4, output_dim=2, dtype=torch.float32)
+
+        # Quantized ESNs
+        for mode, precision in [('int8', 0.05), ('float16', 0.005)]:
+            torch.manual_seed(5)
+            esn = etmr.LiESN(
+                input_dim=4, hidden_dim=50, output_dim=2, w_generator=torch.randn(50, 50) * 0.1,
+                win_generator=torch.randn(50, 4), wbias_generator=torch.randn(50) * 0.1, leaky_rate=0.5,
+                ridge_param=0.01, washout=10
+            )
+            esn(x, y)
+            esn.finalize()
+            float_outputs = esn(x)
+            report = quantize_model(esn, mode, calibration_inputs=x, calibration_targets=y[:, 10:])
+
+            # Smaller weights, same outputs
+            self.assertEqual(esn.output.w_out.dtype, torch.int8 if mode == 'int8' else torch.float16)
+            self.assertEqual(esn.cell.w_in.dtype, torch.int8 if mode == 'int8' else torch.float16)
+            self.assertLess(report['bytes_after'], report['bytes_before'] / 1.5)
+            self.assertLess(report['output_nrmse'], precision)
+            self.assertAlmostEqual(report['quantized_nrmse'], report['float_nrmse'], 1)
+            self.assertLess(float(torch.max(torch.abs(esn(x) - float_outputs))), 10 * precision)
+        # end for
+
+        # Only trained output layers
+        self.assertRaises(Exception, RRCell(input_dim=4, output_dim=2).quantize)
+    # end test_quantization
+
+    # Sequence-level readout on pooled states
+    def test_pooling(self):
+        """
+        Sequence-level readout on pooled states
+        """
+        torch.manual_seed(7)
+        u = torch.randn(6, 40, 3, dtype=torch.float64)
+        labels = torch.tensor([0, 1, 2, 0, 1, 2])
+
+        # For each pooling
+        for pooling in ['mean', 'last', [0, 14, -1]]:
+            esns = [
+                etmr.ESN(
+                    input_dim=3, hidden_dim=20, output_dim=3, w_generator=torch.randn(20, 20, dtype=torch.float64) * 0.1,
+                    win_generator=torch.randn(20, 3, dtype=torch.float64),
+                    wbias_generator=torch.zeros(20, dtype=torch.float64), ridge_param=0.01, washout=5, pooling=pooling,
+                    dtype=torch.float64
+                )
+                for _ in range(2)
+            ]
+            esns[1].w.copy_(esns[0].w)
+            esns[1].w_in.copy_(esns[0].w_in)
+            esns[0](u, labels)
+            esns[1].fit(u, torch.nn.functional.one_hot(labels, 3).double(), chunk_size=8)
+
+            # Features pooled by hand
+            states = esns[0].cell(u)
+            if pooling == 'mean':
+                features = states.mean(1)
+            elif pooling == 'last':
+                features = states[:, -1]
+            else:
+                features = torch.cat([states[:, t] for t in pooling], dim=1)
+            # end if
+            rr_cell = RRCell(input_dim=features.size(1), output_dim=3, ridge_param=0.01, dtype=torch.float64)
+            rr_cell(features.unsqueeze(1), torch.nn.functional.one_hot(labels, 3).double().unsqueeze(1))
+
+            # Same readout, one output per sample
+            for esn in esns + [rr_cell]:
+                esn.finalize()
+            # end for
+            self.assertTensorAlmostEqual(esns[0].w_out, rr_cell.w_out, 0.0001)
+            self.assertTensorAlmostEqual(esns[1].w_out, rr_cell.w_out, 0.0001)
+            self.assertEqual(tuple(esns[0](u).size()), (6, 3))
+            self.assertTensorAlmostEqual(esns[0](u), rr_cell(features.unsqueeze(1))[:, 0], 0.0001)
+        # end for
+    # end test_pooling
+
+    # Statistics merged over parts of a dataset
+    def test_sufficient_statistics(self):
+        """
+        Statistics merged over parts of a dataset
+        """
+        x, y = self._data(n_batches=6, time_length=30, input_dim=8)
+
+        # Output layer, PCA and conceptor trained on everything and on two halves
+        nodes = [
+            lambda: RRCell(input_dim=8, output_dim=2, ridge_param=0.01, dtype=torch.float64),
+            lambda: PCACell(input_dim=8, output_dim=3),
+            lambda: ecnc.Conceptor(input_dim=8, aperture=1.0, dtype=torch.float64)
+        ]
+        for create_node in nodes:
+            full_node, first_node, second_node = create_node(), create_node(), create_node()
+            for node, samples in [(full_node, slice(0, 6)), (first_node, slice(0, 2)), (second_node, slice(2, 6))]:
+                if isinstance(node, RRCell):
+                    node(x[samples], y[samples])
+                elif isinstance(node, PCACell):
+                    node(x[samples].float())
+                else:
+                    node.filter_fit(x[samples])
+                # end if
+            # end for
+
+            # Sum, save and load back
+            merged = first_node.statistics() + second_node.statistics()
+            with tempfile.TemporaryDirectory() as directory:
+                merged.save(os.path.join(directory, "statistics.pt"))
+                merged = SufficientStatistics.load(os.path.join(directory, "statistics.pt"))
+            # end with
+            loaded_node = create_node()
+            loaded_node.load_statistics(merged)
+            for name in merged.tensors.keys():
+                self.assertTensorAlmostEqual(getattr(loaded_node, name), getattr(full_node, name), 0.0001)
+            # end for
+            self.assertEqual(merged.counts, full_node.statistics().counts)
+        # end for
+
+        # Statistics of different nodes cannot be merged
+        self.assertRaises(Exception, lambda: nodes[0]().statistics() + nodes[2]().statistics())
+
+        # ESN output layer trained over shards in worker processes
+        esns = [
+            etmr.ESN(
+                input_dim=8, hidden_dim=20, output_dim=2, w_generator=torch.randn(20, 20, dtype=torch.float64) * 0.1,
+                win_generator=torch.randn(20, 8, dtype=torch.float64),
+                wbias_generator=torch.zeros(20, dtype=torch.float64), ridge_param=0.01, washout=5, dtype=torch.float64
+            )
+            for _ in range(2)
+        ]
+        esns[1].w.copy_(esns[0].w)
+        esns[1].w_in.copy_(esns[0].w_in)
+        esns[0](x, y)
+        esns[0].finalize()
+        parallel_fit(esns[1], TensorDataset(x, y), n_workers=2, batch_size=2)
+        self.assertTensorAlmostEqual(esns[1].w_out, esns[0].w_out, 0.0001)
+
+        # In this process, the model is neither reset nor left in training mode
+        esns[1].train(False)
+        xTx = esns[1].output.xTx.clone()
+        statistics = parallel_statistics(esns[1], TensorDataset(x, y), n_workers=1, batch_size=2)
+        self.assertFalse(esns[1].training)
+        self.assertTensorEqual(esns[1].output.xTx, xTx)
+        self.assertTensorAlmostEqual(statistics.tensors['xTy'], esns[0].output.xTy * 6, 0.0001)
+    # end test_sufficient_statistics
+
+    # endregion TESTS
+
+# end Test_RR_Cell